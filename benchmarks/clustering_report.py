@@ -0,0 +1,191 @@
+# ==============================================================================
+# TDF DATA PLATFORM - CLUSTERING AND PRUNING REPORT
+# ==============================================================================
+# Reads the clustering keys declared in sql/ddl (CLUSTER BY) and reports:
+#
+#   tables      per clustered table: micro-partitions, average clustering
+#               depth and overlaps (SYSTEM$CLUSTERING_INFORMATION)
+#   statements  per dashboard statement reading a clustered table (same
+#               extraction as plan_regression.py, views included): partitions
+#               scanned out of the table's total, and whether the scan
+#               filters on the clustering key
+#
+#   python benchmarks/clustering_report.py --backend snowflake --connection tdf
+#   python benchmarks/clustering_report.py                 # local: key filters, rows
+#
+# A statement that filters on the key yet scans most partitions points at a
+# table that needs reclustering (depth well above 1) or a predicate that
+# cannot prune, e.g. a function wrapped around the key column. One with no
+# key filter scans the whole history, however short the window it shows.
+#
+# Backends: snowflake explains each statement (EXPLAIN USING JSON, no
+# warehouse time) and reads clustering information. local runs EXPLAIN
+# ANALYZE on the DuckDB stand-in: no micro-partitions, so it reports rows
+# scanned and the filters pushed into each scan.
+# ==============================================================================
+
+import argparse
+import glob
+import json
+import os
+import re
+
+import pandas as pd
+
+from local_snowflake import DATABASE, REPO_ROOT, split_statements
+from plan_regression import LocalPlanner, SnowflakePlanner, extract_statements
+
+_CLUSTERED_TABLE_RE = re.compile(
+    r"^\s*CREATE\s+(?:OR\s+REPLACE\s+)?TABLE\s+([\w.]+)\s*\([\s\S]*\)\s*CLUSTER\s+BY\s*\(([\s\S]*)\)\s*$",
+    re.IGNORECASE,
+)
+_USE_SCHEMA_RE = re.compile(r"^\s*USE\s+SCHEMA\s+(?:\w+\.)?(\w+)\s*$", re.IGNORECASE)
+
+
+# ==============================================================================
+# CLUSTERING KEYS
+# ==============================================================================
+
+def clustering_keys():
+    """{'SCHEMA.TABLE': [key expressions]} for every CLUSTER BY in sql/ddl"""
+    keys = {}
+    for path in sorted(glob.glob(os.path.join(REPO_ROOT, "sql", "ddl", "*.sql"))):
+        with open(path, encoding="utf-8") as f:
+            schema = None
+            for statement in split_statements(f.read()):
+                use = _USE_SCHEMA_RE.match(statement)
+                if use:
+                    schema = use.group(1).upper()
+                    continue
+                match = _CLUSTERED_TABLE_RE.match(statement)
+                if match:
+                    name = match.group(1).upper().split(".")
+                    table = ".".join(name[-2:]) if len(name) > 1 else f"{schema}.{name[0]}"
+                    keys[table] = [k.strip() for k in match.group(2).split(",")]
+    return keys
+
+
+def _key_columns(expressions):
+    # DATE_TRUNC('MONTH', PERFORMED_DATE) prunes on PERFORMED_DATE
+    return {word for e in expressions for word in re.findall(r"\b[A-Z_][A-Z0-9_]*\b", e.upper())
+            if not re.search(rf"\b{word}\s*\(", e.upper())}
+
+
+def _filters_on_key(sql, filters, expressions):
+    # DuckDB drops predicates its statistics prove always true (e.g. a window
+    # covering all seed data), so the statement text is checked as well
+    for column in _key_columns(expressions):
+        if re.search(rf"\b{column}\b", filters, re.IGNORECASE):
+            return True
+        if re.search(rf"\b{column}\s*(>=?|<=?|=|BETWEEN\b|IN\b)", sql, re.IGNORECASE):
+            return True
+    return False
+
+
+# ==============================================================================
+# BACKENDS
+# ==============================================================================
+
+def snowflake_table_stats(planner, tables):
+    """SYSTEM$CLUSTERING_INFORMATION for each table"""
+    stats = {}
+    for table in tables:
+        info = json.loads(planner.session.sql(
+            "SELECT SYSTEM$CLUSTERING_INFORMATION(?)", params=[f"{DATABASE}.{table}"]
+        ).collect()[0][0])
+        stats[table] = {
+            "partitions": info.get("total_partition_count"),
+            "constant_partitions": info.get("total_constant_partition_count"),
+            "average_depth": info.get("average_depth"),
+            "average_overlaps": info.get("average_overlaps"),
+        }
+    return stats
+
+
+def local_table_stats(planner, tables):
+    """Row counts on the stand-in (DuckDB keeps no clustering depth)"""
+    return {
+        table: {"rows": planner.conn.execute(f"SELECT count(*) FROM {DATABASE}.{table}").fetchone()[0]}
+        for table in tables
+    }
+
+
+def scan_rows(statement, plan, keys, table_stats):
+    """One row per scan of a clustered table in a statement's plan"""
+    rows = []
+    for scan in plan["scans"]:
+        table = ".".join(scan["table"].split(".")[-2:])
+        if table not in keys:
+            continue
+        row = {"statement": statement["id"], "source": statement["source"], "table": table}
+        if scan["partitions_total"] is not None:
+            total, scanned = scan["partitions_total"], scan["partitions_scanned"] or 0
+            row.update(partitions_scanned=scanned, partitions_total=total,
+                       pruned_pct=round(100 * (1 - scanned / total), 1) if total else None,
+                       mb_scanned=round((scan["bytes"] or 0) / 1024 ** 2, 1))
+        else:
+            total = table_stats[table]["rows"]
+            filters = scan["filters"] or ""
+            row.update(rows_scanned=scan["rows_scanned"], rows_total=total,
+                       key_filter=_filters_on_key(statement["sql"], filters, keys[table]),
+                       filters=" ".join(filters.split())[:80])
+        rows.append(row)
+    return rows
+
+
+# ==============================================================================
+# REPORT
+# ==============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Clustering depth and partition pruning per dashboard statement")
+    parser.add_argument("--backend", choices=["local", "snowflake"], default="local")
+    parser.add_argument("--connection", help="connections.toml entry for --backend snowflake")
+    parser.add_argument("--filter", help="only statements whose id contains this text")
+    parser.add_argument("--json", help="write table and statement results to this file")
+    args = parser.parse_args()
+
+    keys = clustering_keys()
+    statements, _ = extract_statements()
+    if args.filter:
+        statements = [s for s in statements if args.filter in s["id"]]
+    if args.backend == "local":
+        planner = LocalPlanner()
+        table_stats = local_table_stats(planner, keys)
+    else:
+        planner = SnowflakePlanner(args.connection)
+        table_stats = snowflake_table_stats(planner, keys)
+
+    scans, errors, cache = [], 0, {}
+    for statement in statements:
+        key = (" ".join(statement["sql"].split()), statement["schema"])
+        if key not in cache:
+            try:
+                cache[key] = planner.plan(statement)
+            except Exception:
+                cache[key] = None
+        if cache[key] is None:
+            errors += 1
+            continue
+        scans += scan_rows(statement, cache[key], keys, table_stats)
+
+    pd.set_option("display.width", 200)
+    tables = pd.DataFrame([{"table": t, "cluster_by": ", ".join(k), **table_stats[t]} for t, k in keys.items()])
+    print("Clustered tables")
+    print(tables.to_string(index=False))
+    print()
+    if scans:
+        report = pd.DataFrame(scans).drop(columns=["source"])
+        order = ["pruned_pct"] if "pruned_pct" in report else ["key_filter", "rows_scanned"]
+        print("Dashboard statements reading them (least pruned first)")
+        print(report.sort_values(order, ascending=[True] * len(order)).to_string(index=False))
+        print()
+    print(f"{len(statements)} statements, {len(scans)} scans of clustered tables, {errors} could not be explained")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"tables": tables.to_dict("records"), "scans": scans}, f, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    main()
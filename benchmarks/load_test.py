@@ -0,0 +1,329 @@
+# ==============================================================================
+# TDF DATA PLATFORM - CONCURRENT SESSION LOAD TEST
+# ==============================================================================
+# Simulates N managers using streamlit_app_v2.py at once: each virtual user
+# is an AppTest session that opens the app, then alternates think time with
+# an interaction (switch sidebar page, switch tab, or move a simulator
+# widget). All sessions share one process, as they do in a Streamlit server,
+# so the query cache, single-flight and prefetch behave as in production.
+#
+#   python benchmarks/load_test.py --sessions 20 --duration 120
+#   python benchmarks/load_test.py --backend local --latency-ms 80 --think-s 2
+#   python benchmarks/load_test.py --backend snowflake --connection tdf --sessions 50
+#
+# --backend snowflake opens a Snowpark session from ~/.snowflake/connections.toml
+# (named by --connection, else the default connection) and runs the real
+# warehouse; local uses the DuckDB stand-in from local_snowflake.py.
+# ==============================================================================
+
+import argparse
+import json
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from run_benchmark import APP_FILE, install_session, tab_radio
+
+from streamlit.runtime import Runtime
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.element_tree import NumberInput, SelectSlider, Selectbox, Slider
+
+import tdf_dashboard.common as common
+
+# Relative weights of the interactions a virtual user picks after thinking
+INTERACTION_WEIGHTS = {"page": 4, "tab": 3, "widget": 3}
+
+LATENCY_PERCENTILES = [0.5, 0.9, 0.95, 0.99]
+
+# Errors caused by running AppTest sessions side by side on one shared mock
+# Runtime (see share_test_runtime), not by the app: widget ids looked up in
+# the wrong session's state, or a runtime cleared by another session's run
+HARNESS_ERROR_PATTERNS = ["KeyError('$$ID-", "KeyError: '$$ID-", "Runtime hasn't been created"]
+
+
+# ==============================================================================
+# BACKENDS
+# ==============================================================================
+
+class CountingSession:
+    """Wraps a Snowpark (or local) session and counts the statements it executes, by QUERY_TAG cache status"""
+
+    def __init__(self, session):
+        self.session = session
+        self.counts = Counter()
+        self.lock = threading.Lock()
+
+    def sql(self, query, params=None):
+        return _CountingDataFrame(self, self.session.sql(query, params=params))
+
+    def record(self, statement_params):
+        tag = json.loads((statement_params or {}).get("QUERY_TAG") or "{}")
+        with self.lock:
+            self.counts[tag.get("cache", "untagged")] += 1
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+
+class _CountingDataFrame:
+    def __init__(self, counter, df):
+        self.counter = counter
+        self.df = df
+
+    def to_pandas(self, *args, statement_params=None, **kwargs):
+        self.counter.record(statement_params)
+        return self.df.to_pandas(*args, statement_params=statement_params, **kwargs)
+
+    def to_pandas_batches(self, *args, statement_params=None, **kwargs):
+        self.counter.record(statement_params)
+        return self.df.to_pandas_batches(*args, statement_params=statement_params, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.df, name)
+
+
+def make_backend(args):
+    """Session for --backend: the DuckDB stand-in or a real Snowpark session"""
+    if args.backend == "local":
+        from local_snowflake import LocalSession, build_database
+        conn, _ = build_database()
+        return LocalSession(conn, latency_ms=args.latency_ms)
+    from snowflake.snowpark import Session
+    builder = Session.builder
+    if args.connection:
+        builder = builder.config("connection_name", args.connection)
+    return builder.create()
+
+
+# ==============================================================================
+# VIRTUAL USERS
+# ==============================================================================
+
+def rss_bytes():
+    """Current resident set size of this process"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak rather than current where /proc is unavailable (macOS: bytes)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def session_state_bytes(at):
+    """Approximate footprint of one session's st.session_state"""
+    total = 0
+    for value in at.session_state.values():
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            total += int(value.memory_usage(deep=True).sum()) if isinstance(value, pd.DataFrame) \
+                else int(value.memory_usage(deep=True))
+        else:
+            total += sys.getsizeof(value)
+    return total
+
+
+def _random_number(rng, low, high, step):
+    value = low + step * round(rng.uniform(low, high) / step - low / step)
+    return type(low)(min(max(value, low), high))
+
+
+def _move_widget(at, rng):
+    """Set a random main-area simulator widget to a new value; False if the view has none"""
+    widgets = [
+        w for w in list(at.main.slider) + list(at.main.select_slider) + list(at.main.selectbox)
+        + list(at.main.number_input) + list(at.main.toggle)
+        if not getattr(w, "disabled", False)
+        and not (isinstance(w, Slider) and not isinstance(w.min, (int, float)))  # date sliders
+    ]
+    if not widgets:
+        return False
+    widget = rng.choice(widgets)
+    if isinstance(widget, Slider):
+        if isinstance(widget.value, (tuple, list)):
+            widget.set_value(tuple(sorted(_random_number(rng, widget.min, widget.max, widget.step) for _ in range(2))))
+        else:
+            widget.set_value(_random_number(rng, widget.min, widget.max, widget.step))
+    elif isinstance(widget, (SelectSlider, Selectbox)):
+        widget.set_value(rng.choice(widget.options))
+    elif isinstance(widget, NumberInput):
+        low = widget.min if widget.min is not None else 0
+        high = widget.max if widget.max is not None else low + 100 * widget.step
+        widget.set_value(_random_number(rng, low, high, widget.step))
+    else:
+        widget.set_value(not widget.value)
+    return True
+
+
+def share_test_runtime():
+    """Let AppTest sessions run concurrently.
+
+    AppTest installs a mock Runtime singleton for each run and clears it when
+    the run ends, which breaks any other session's run still in progress;
+    keep the most recently installed one available instead. Sessions still
+    occasionally see each other's run state; those errors are matched by
+    HARNESS_ERROR_PATTERNS and reported apart from the app's.
+    """
+    latest = []
+
+    def instance(cls):
+        if cls._instance is not None:
+            latest[:] = [cls._instance]
+        if not latest:
+            raise RuntimeError("Runtime hasn't been created!")
+        return latest[0]
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(lambda cls: cls._instance is not None or bool(latest))
+
+
+def is_harness_error(message):
+    """True for an error produced by the shared-runtime test harness rather than the app"""
+    return any(pattern in message for pattern in HARNESS_ERROR_PATTERNS)
+
+
+def virtual_user(user_id, args, deadline, start_delay):
+    """One simulated manager; returns (interaction records, session_state bytes)"""
+    rng = random.Random(args.seed + user_id)
+    time.sleep(start_delay)
+    at = None
+    records = []
+
+    def timed(kind, page):
+        """Rerun the app and record the interaction; True if the run completed"""
+        started = time.perf_counter()
+        try:
+            at.run()
+            errors = [e.message for e in at.exception]
+            completed = bool(at.sidebar.radio)
+        except Exception as e:
+            errors = [repr(e)]
+            completed = False
+        harness_errors = [e for e in errors if is_harness_error(e)]
+        errors = [e for e in errors if not is_harness_error(e)]
+        records.append({
+            "user": user_id,
+            "kind": kind,
+            "page": page,
+            "ts": time.time(),
+            "elapsed_ms": (time.perf_counter() - started) * 1000,
+            "errors": len(errors),
+            "error": errors[0].split("\n")[0][:200] if errors else None,
+            "harness_errors": len(harness_errors),
+            "harness_error": harness_errors[0].split("\n")[0][:200] if harness_errors else None,
+        })
+        return completed
+
+    kind, page = "open", None
+    while time.time() < deadline:
+        if at is None:
+            # First visit, or a browser reload after a run that did not complete
+            at = AppTest.from_file(APP_FILE, default_timeout=args.timeout)
+            if not timed(kind, page):
+                at = None
+                continue
+            page = at.sidebar.radio[0].value
+        time.sleep(min(rng.expovariate(1 / args.think_s) if args.think_s else 0, max(deadline - time.time(), 0)))
+        if time.time() >= deadline:
+            break
+        kind = rng.choices(list(INTERACTION_WEIGHTS), weights=list(INTERACTION_WEIGHTS.values()))[0]
+        tabs = tab_radio(at)
+        if kind == "tab" and tabs is not None and len(tabs.options) > 1:
+            tabs.set_value(rng.choice([t for t in tabs.options if t != tabs.value]))
+        elif kind == "widget" and _move_widget(at, rng):
+            pass
+        else:
+            kind = "page"
+            page = rng.choice([p for p in at.sidebar.radio[0].options if p != page])
+            at.sidebar.radio[0].set_value(page)
+        if not timed(kind, page):
+            at, kind = None, "reload"
+    return records, session_state_bytes(at) if at is not None else 0
+
+
+# ==============================================================================
+# REPORT
+# ==============================================================================
+
+def latency_table(interactions, by):
+    grouped = interactions.groupby(by)["elapsed_ms"]
+    table = grouped.describe(percentiles=LATENCY_PERCENTILES)[["count", "50%", "90%", "95%", "99%", "max"]]
+    return table.rename(columns={"count": "n"}).round(0)
+
+
+def print_report(args, interactions, wall_s, statements, rss_before, rss_after, state_bytes):
+    n = len(interactions)
+    print(f"Backend {args.backend}: {args.sessions} sessions for {wall_s:.0f}s, think time {args.think_s}s (mean)")
+    print(f"Interactions: {n:,} ({n / wall_s:.1f}/s), {int(interactions['errors'].gt(0).sum())} with app errors")
+    for message, count in interactions["error"].value_counts().head(5).items():
+        print(f"  {count:5d} x {message}")
+    harness = int(interactions["harness_errors"].gt(0).sum())
+    if harness:
+        print(f"Harness errors (shared AppTest runtime, not counted as app errors): {harness}")
+        for message, count in interactions["harness_error"].value_counts().head(3).items():
+            print(f"  {count:5d} x {message}")
+    print()
+    print("Rerun latency (ms), all interactions:")
+    print(latency_table(interactions.assign(all="all"), "all").to_string())
+    print()
+    print(latency_table(interactions, "kind").to_string())
+    print()
+    print(latency_table(interactions[interactions["kind"] == "page"], "page").to_string())
+    print()
+    total = sum(statements.values())
+    print(f"Warehouse statements: {total:,} ({total / max(n, 1):.2f} per interaction)")
+    for kind, count in statements.most_common():
+        print(f"  {kind:<10} {count:,}")
+    cache = common.get_query_cache().stats()
+    print(f"Query cache: {cache}")
+    print()
+    print(f"Process RSS: {rss_before / 1024 ** 2:,.0f} MB before, {rss_after / 1024 ** 2:,.0f} MB after "
+          f"({(rss_after - rss_before) / args.sessions / 1024 ** 2:,.1f} MB per session, shared cache included)")
+    print(f"Session state: {pd.Series(state_bytes).mean() / 1024:,.0f} KB mean, "
+          f"{max(state_bytes) / 1024:,.0f} KB max per session")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent-session load test for the TDF dashboard")
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent virtual users (default 10)")
+    parser.add_argument("--duration", type=float, default=60, help="seconds to run after ramp-up starts")
+    parser.add_argument("--ramp-s", type=float, default=10, help="spread session starts over this many seconds")
+    parser.add_argument("--think-s", type=float, default=5, help="mean think time between interactions")
+    parser.add_argument("--backend", choices=["local", "snowflake"], default="local")
+    parser.add_argument("--connection", help="connections.toml entry for --backend snowflake")
+    parser.add_argument("--latency-ms", type=float, default=0, help="per-statement delay for --backend local")
+    parser.add_argument("--no-prefetch", action="store_true", help="turn adjacent-tab prefetch off")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds allowed per rerun")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="write every interaction to this file")
+    args = parser.parse_args()
+
+    session = CountingSession(make_backend(args))
+    install_session(session, prefetch=not args.no_prefetch)
+    share_test_runtime()
+    rss_before = rss_bytes()
+    started = time.time()
+    deadline = started + args.duration
+    with ThreadPoolExecutor(max_workers=args.sessions) as pool:
+        futures = [
+            pool.submit(virtual_user, i, args, deadline, args.ramp_s * i / args.sessions)
+            for i in range(args.sessions)
+        ]
+        results = [f.result() for f in futures]
+    wall_s = time.time() - started
+    interactions = pd.DataFrame([r for records, _ in results for r in records])
+    state_bytes = [size for _, size in results]
+    print_report(args, interactions, wall_s, session.counts, rss_before, rss_bytes(), state_bytes)
+
+    if args.json:
+        interactions.to_json(args.json, orient="records", indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,421 @@
+# ==============================================================================
+# TDF DATA PLATFORM - LOCAL SNOWFLAKE STAND-IN
+# ==============================================================================
+# Loads sql/ddl and sql/data into an in-memory DuckDB database through a small
+# Snowflake-dialect shim, and exposes it behind the slice of the Snowpark
+# session API the dashboard uses: session.sql(query, params).to_pandas() /
+# .to_pandas_batches(), blocking or async.
+#
+# The seed scripts are executed as written, so the data is a synthetic
+# equivalent of a fresh deployment (UNIFORM/RANDOM draw different values).
+# Statements the shim cannot translate are skipped and listed in the load
+# report rather than aborting the load.
+# ==============================================================================
+
+import json
+import os
+import re
+import threading
+import time
+import uuid
+
+import duckdb
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SQL_DIRS = [os.path.join(REPO_ROOT, "sql", "ddl"), os.path.join(REPO_ROOT, "sql", "data")]
+DATABASE = "TDF_DATA_PLATFORM"
+
+# Account-level statements with no local equivalent
+_SKIPPED_STATEMENT_RE = re.compile(
+    r"^\s*(USE\s+(ROLE|WAREHOUSE|DATABASE)|GRANT|REVOKE|CREATE\s+(OR\s+REPLACE\s+)?(ROLE|WAREHOUSE|DATABASE)"
+    r"|ALTER\s+(WAREHOUSE|ACCOUNT|USER|TASK)|EXECUTE\s+TASK|TRUNCATE|SHOW|DESCRIBE)\b",
+    re.IGNORECASE,
+)
+_USE_SCHEMA_RE = re.compile(r"^\s*USE\s+SCHEMA\s+(?:\w+\.)?(\w+)\s*$", re.IGNORECASE)
+
+# Snowflake column types DuckDB does not know
+_TYPE_MAP = [
+    (re.compile(r"\bTIMESTAMP_NTZ\b", re.IGNORECASE), "TIMESTAMP"),
+    (re.compile(r"\bTIMESTAMP_(LTZ|TZ)\b", re.IGNORECASE), "TIMESTAMPTZ"),
+    (re.compile(r"\bNUMBER\b(?!\s*\()", re.IGNORECASE), "DECIMAL(38, 0)"),
+    (re.compile(r"\bNUMBER\s*\(", re.IGNORECASE), "DECIMAL("),
+    (re.compile(r"\b(VARIANT|OBJECT|ARRAY)\b(?!\s*\()", re.IGNORECASE), "JSON"),
+    (re.compile(r"\bGEOGRAPHY\b", re.IGNORECASE), "VARCHAR"),
+]
+
+# Constraints Snowflake declares but does not enforce; DuckDB would enforce them
+_CONSTRAINT_RES = [
+    re.compile(r"\bFOREIGN\s+KEY\s*\([^)]*\)\s*REFERENCES\s+[\w.]+\s*\([^)]*\)", re.IGNORECASE),
+    re.compile(r"\bREFERENCES\s+[\w.]+\s*\([^)]*\)", re.IGNORECASE),
+    re.compile(r"\bPRIMARY\s+KEY\b(\s*\([^)]*\))?", re.IGNORECASE),
+    re.compile(r"\bUNIQUE\b(\s*\([^)]*\))?", re.IGNORECASE),
+]
+# Clustering keys steer Snowflake micro-partitioning; DuckDB has no equivalent
+_CLUSTER_BY_RE = re.compile(r"\)\s*CLUSTER\s+BY\s*\((?:[^()]|\([^()]*\))*\)\s*$", re.IGNORECASE)
+# Dynamic tables become views: always current, i.e. a target lag of zero
+_DYNAMIC_TABLE_RE = re.compile(r"^\s*CREATE\s+(?:OR\s+REPLACE\s+)?DYNAMIC\s+TABLE\s+([\w.]+)[\s\S]*?\bAS\b",
+                               re.IGNORECASE)
+# Scheduled tasks run their body once, after the seed data is loaded (as the
+# master deploy script does with EXECUTE TASK)
+_TASK_RE = re.compile(r"^\s*CREATE\s+(?:OR\s+REPLACE\s+)?TASK\s+[\w.]+[\s\S]*?\bAS\b\s*([\s\S]+)$", re.IGNORECASE)
+_COMMENT_CLAUSE_RE = re.compile(r"\s+COMMENT\s*=?\s*'(?:[^']|'')*'", re.IGNORECASE)
+_NOW_RE = re.compile(r"\b(CURRENT_DATE|CURRENT_TIMESTAMP)\s*\(\s*\)", re.IGNORECASE)
+_SEQ_RE = re.compile(r"\bSEQ[1248]\s*\(\s*\)", re.IGNORECASE)
+_INT_LITERAL_RE = re.compile(r"^-?\d+$")
+
+_DATE_PART_FUNCTIONS = {
+    "YEAR": ("to_years", 1), "YEARS": ("to_years", 1), "YYYY": ("to_years", 1), "YY": ("to_years", 1),
+    "QUARTER": ("to_months", 3),
+    "MONTH": ("to_months", 1), "MONTHS": ("to_months", 1), "MM": ("to_months", 1), "MON": ("to_months", 1),
+    "WEEK": ("to_days", 7), "WEEKS": ("to_days", 7),
+    "DAY": ("to_days", 1), "DAYS": ("to_days", 1), "DD": ("to_days", 1), "D": ("to_days", 1),
+    "HOUR": ("to_hours", 1), "HOURS": ("to_hours", 1),
+    "MINUTE": ("to_minutes", 1), "MINUTES": ("to_minutes", 1),
+    "SECOND": ("to_seconds", 1), "SECONDS": ("to_seconds", 1),
+}
+
+
+# ==============================================================================
+# SQL SHIM
+# ==============================================================================
+
+def split_statements(script):
+    """Split a SQL script on top-level semicolons, dropping comments"""
+    statements, current, i, n = [], [], 0, len(script)
+    while i < n:
+        c = script[i]
+        if script.startswith("--", i):
+            end = script.find("\n", i)
+            i = n if end < 0 else end
+        elif script.startswith("/*", i):
+            end = script.find("*/", i + 2)
+            i = n if end < 0 else end + 2
+        elif c == "'" or script.startswith("$$", i):
+            quote = "'" if c == "'" else "$$"
+            end = i + len(quote)
+            while True:
+                end = script.find(quote, end)
+                if end < 0:
+                    end = n
+                    break
+                if quote == "'" and script.startswith("''", end):
+                    end += 2
+                    continue
+                end += len(quote)
+                break
+            current.append(script[i:end])
+            i = end
+        elif c == ";":
+            statements.append("".join(current).strip())
+            current = []
+            i += 1
+        else:
+            current.append(c)
+            i += 1
+    statements.append("".join(current).strip())
+    return [s for s in statements if s]
+
+
+def _close_paren(sql, start):
+    """Index of the parenthesis closing the one opened at sql[start]"""
+    depth, i = 0, start
+    while i < len(sql):
+        c = sql[i]
+        if c == "'":
+            i = sql.find("'", i + 1)
+            while i >= 0 and sql.startswith("''", i):
+                i = sql.find("'", i + 2)
+            if i < 0:
+                break
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    raise ValueError(f"unbalanced parentheses near: {sql[start:start + 60]!r}")
+
+
+def _split_args(body):
+    args, depth, start, i = [], 0, 0, 0
+    while i < len(body):
+        c = body[i]
+        if c == "'":
+            i = body.find("'", i + 1)
+            while i >= 0 and body.startswith("''", i):
+                i = body.find("'", i + 2)
+            if i < 0:
+                break
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "," and depth == 0:
+            args.append(body[start:i].strip())
+            start = i + 1
+        i += 1
+    args.append(body[start:].strip())
+    return args
+
+
+def _rewrite_calls(sql, name, rewrite):
+    """Replace every NAME(args) call with rewrite(args, sql_after_call) -> (text, chars_consumed_after)"""
+    pattern = re.compile(r"\b" + name + r"\s*\(", re.IGNORECASE)
+    out, pos = [], 0
+    while True:
+        match = pattern.search(sql, pos)
+        if match is None:
+            out.append(sql[pos:])
+            return "".join(out)
+        open_at = match.end() - 1
+        close_at = _close_paren(sql, open_at)
+        args = [_rewrite_calls(arg, name, rewrite) for arg in _split_args(sql[open_at + 1:close_at])]
+        text, consumed = rewrite(args, sql[close_at + 1:])
+        out.append(sql[pos:match.start()])
+        out.append(text)
+        pos = close_at + 1 + consumed
+
+
+def _date_part(arg):
+    return arg.strip("'\" ").upper()
+
+
+def _dateadd(args, rest):
+    part, amount, value = args
+    func, factor = _DATE_PART_FUNCTIONS[_date_part(part)]
+    amount = f"CAST(({amount}) AS INTEGER)" if factor == 1 else f"CAST(({amount}) AS INTEGER) * {factor}"
+    if value.startswith("'"):
+        value = f"CAST({value} AS TIMESTAMP)"
+    return f"({value} + {func}({amount}))", 0
+
+
+def _uniform(args, rest):
+    low, high = args[0], args[1]
+    if _INT_LITERAL_RE.match(low) and _INT_LITERAL_RE.match(high):
+        return f"CAST(floor(random() * (({high}) - ({low}) + 1)) + ({low}) AS INTEGER)", 0
+    return f"(({low}) + random() * (({high}) - ({low})))", 0
+
+
+def _array_agg(args, rest):
+    # ARRAY_AGG(OBJECT_CONSTRUCT(*)) FROM (subquery): aggregate the subquery's
+    # rows as structs, which needs an alias on the subquery
+    if len(args) == 1 and re.fullmatch(r"OBJECT_CONSTRUCT(_KEEP_NULL)?\s*\(\s*\*\s*\)", args[0], re.IGNORECASE):
+        source = re.match(r"\s*FROM\s*\(", rest, re.IGNORECASE)
+        if source:
+            close_at = _close_paren(rest, source.end() - 1)
+            subquery = translate(rest[source.end():close_at])
+            return f"to_json(array_agg(_bundle_row)) FROM ({subquery}) _bundle_row", close_at + 1
+    return f"array_agg({', '.join(args)})", 0
+
+
+def _simple(template):
+    def rewrite(args, rest):
+        return template.format(*args), 0
+    return rewrite
+
+
+_CALL_REWRITES = [
+    ("DATEADD", _dateadd),
+    ("TIMESTAMPADD", _dateadd),
+    ("DATEDIFF", lambda args, rest: (f"date_diff('{_date_part(args[0]).lower()}', {args[1]}, {args[2]})", 0)),
+    ("DATE_TRUNC", lambda args, rest: (f"date_trunc('{_date_part(args[0]).lower()}', {args[1]})", 0)),
+    ("UNIFORM", _uniform),
+    ("LPAD", lambda args, rest: (f"lpad(CAST({args[0]} AS VARCHAR), {', '.join(args[1:])})", 0)),
+    ("IFF", _simple("(CASE WHEN {0} THEN {1} ELSE {2} END)")),
+    ("NVL", _simple("COALESCE({0}, {1})")),
+    ("ZEROIFNULL", _simple("COALESCE({0}, 0)")),
+    ("DIV0", _simple("(CASE WHEN ({1}) = 0 THEN 0 ELSE ({0}) / ({1}) END)")),
+    ("APPROX_PERCENTILE", _simple("approx_quantile({0}, {1})")),
+    ("ARRAY_AGG", _array_agg),
+    ("OBJECT_CONSTRUCT_KEEP_NULL", lambda args, rest: (f"json_object({', '.join(args)})", 0)),
+    ("OBJECT_CONSTRUCT", lambda args, rest: (f"json_object({', '.join(args)})", 0)),
+    ("TRY_PARSE_JSON", _simple("TRY_CAST({0} AS JSON)")),
+]
+
+
+def translate(sql):
+    """Rewrite one Snowflake statement into DuckDB SQL"""
+    sql = _NOW_RE.sub(r"\1", sql)
+    sql = _SEQ_RE.sub("(row_number() OVER () - 1)", sql)
+    sql = re.sub(r"TABLE\s*\(\s*GENERATOR\s*\(\s*ROWCOUNT\s*=>\s*(\d+)\s*\)\s*\)", r"range(\1)", sql,
+                 flags=re.IGNORECASE)
+    sql = re.sub(rf"\b{DATABASE}\.INFORMATION_SCHEMA\.TABLES\b", "memory.main.snowflake_tables", sql,
+                 flags=re.IGNORECASE)
+    for name, rewrite in _CALL_REWRITES:
+        sql = _rewrite_calls(sql, name, rewrite)
+    return sql
+
+
+def translate_ddl(sql):
+    """translate() plus type mapping and removal of clauses DuckDB rejects or would enforce"""
+    sql = _DYNAMIC_TABLE_RE.sub(r"CREATE OR REPLACE VIEW \1 AS", sql)
+    sql = _COMMENT_CLAUSE_RE.sub("", sql)
+    sql = _CLUSTER_BY_RE.sub(")", sql)
+    for pattern in _CONSTRAINT_RES:
+        sql = pattern.sub("", sql)
+    for pattern, replacement in _TYPE_MAP:
+        sql = pattern.sub(replacement, sql)
+    return translate(sql)
+
+
+# ==============================================================================
+# DATABASE BUILD
+# ==============================================================================
+
+def build_database(sql_dirs=SQL_DIRS):
+    """Create and seed the local database; returns (connection, load report)"""
+    conn = duckdb.connect()
+    conn.execute(f"ATTACH ':memory:' AS {DATABASE}")
+    conn.execute(f"USE {DATABASE}")
+    started = time.perf_counter()
+    report = {"statements": 0, "skipped": 0, "failed": []}
+    tasks = []
+    for sql_dir in sql_dirs:
+        for filename in sorted(f for f in os.listdir(sql_dir) if f.endswith(".sql")):
+            with open(os.path.join(sql_dir, filename), encoding="utf-8") as f:
+                statements = split_statements(f.read())
+            schema = None
+            for statement in statements:
+                use_schema = _USE_SCHEMA_RE.match(statement)
+                task = _TASK_RE.match(statement)
+                if use_schema:
+                    schema = use_schema.group(1)
+                    statement = f"USE {DATABASE}.{schema}"
+                elif task:
+                    tasks.append((filename, schema, statement, task.group(1)))
+                    continue
+                elif _SKIPPED_STATEMENT_RE.match(statement):
+                    report["skipped"] += 1
+                    continue
+                report["statements"] += 1
+                try:
+                    conn.execute(translate_ddl(statement))
+                except Exception as e:
+                    report["failed"].append((filename, statement.split("\n", 1)[0][:80], str(e).split("\n")[0]))
+    for filename, schema, statement, body in tasks:
+        report["statements"] += 1
+        try:
+            conn.execute(f"USE {DATABASE}.{schema or 'main'}")
+            conn.execute(translate_ddl(body))
+        except Exception as e:
+            report["failed"].append((filename, statement.split("\n", 1)[0][:80], str(e).split("\n")[0]))
+    conn.execute(f"USE {DATABASE}")
+    # INFORMATION_SCHEMA.TABLES as the data-version check reads it; every table
+    # was last altered by this load
+    conn.execute(f"""
+        CREATE TABLE memory.main.snowflake_tables AS
+        SELECT upper(table_schema) as TABLE_SCHEMA, upper(table_name) as TABLE_NAME, table_type as TABLE_TYPE,
+               now() as LAST_ALTERED
+        FROM information_schema.tables
+        WHERE table_catalog = '{DATABASE}'
+    """)
+    report["tables"] = conn.execute(f"""
+        SELECT schema_name || '.' || table_name, estimated_size
+        FROM duckdb_tables() WHERE database_name = '{DATABASE}' ORDER BY 1
+    """).fetchall()
+    report["load_s"] = time.perf_counter() - started
+    return conn, report
+
+
+# ==============================================================================
+# SNOWPARK SESSION STAND-IN
+# ==============================================================================
+
+class LocalAsyncJob:
+    """AsyncJob look-alike for a result computed eagerly"""
+
+    def __init__(self, result, query_id):
+        self._result = result
+        self.query_id = query_id
+
+    def result(self):
+        return self._result
+
+
+class LocalDataFrame:
+    """Result of LocalSession.sql(); executes on to_pandas / to_pandas_batches"""
+
+    def __init__(self, session, query, params):
+        self.session = session
+        self.query = query
+        self.params = params
+
+    @property
+    def columns(self):
+        cursor = self.session.conn.cursor()
+        cursor.execute(f"SELECT * FROM ({translate(self.query)}) LIMIT 0", self.params or [])
+        return [d[0].upper() for d in cursor.description]
+
+    def to_pandas(self, block=True, statement_params=None):
+        query_id, df = self.session.execute(self.query, self.params, statement_params)
+        return df if block else LocalAsyncJob(df, query_id)
+
+    def to_pandas_batches(self, block=True, statement_params=None):
+        query_id, df = self.session.execute(self.query, self.params, statement_params)
+        batches = [df.iloc[i:i + self.session.batch_rows] for i in range(0, len(df), self.session.batch_rows)]
+        return iter(batches) if block else LocalAsyncJob(iter(batches), query_id)
+
+
+class LocalSession:
+    """Snowpark session stand-in backed by DuckDB.
+
+    Every statement is recorded in ``statements`` with its QUERY_TAG, so
+    results can be attributed to pages and sections as in QUERY_HISTORY.
+    ``latency_ms`` adds a fixed delay per statement to model the network
+    round-trip and warehouse overhead a local engine does not have.
+    """
+
+    def __init__(self, conn, latency_ms=0, batch_rows=100_000):
+        self.conn = conn
+        self.latency_ms = latency_ms
+        self.batch_rows = batch_rows
+        self.statements = []
+        self.lock = threading.Lock()
+
+    def sql(self, query, params=None):
+        return LocalDataFrame(self, query, params)
+
+    def execute(self, query, params=None, statement_params=None):
+        query_id = str(uuid.uuid4())
+        tag = (statement_params or {}).get("QUERY_TAG")
+        started = time.perf_counter()
+        error = None
+        try:
+            if self.latency_ms:
+                time.sleep(self.latency_ms / 1000)
+            # One cursor per statement: DuckDB cursors are safe to use from
+            # the query cache's worker threads concurrently
+            cursor = self.conn.cursor()
+            df = cursor.execute(translate(query), params or []).df()
+            # Unquoted identifiers come back upper-case from Snowflake
+            df.columns = [c.upper() for c in df.columns]
+            return query_id, df
+        except Exception as e:
+            error = str(e).split("\n")[0]
+            raise
+        finally:
+            record = {
+                "query_id": query_id,
+                "tag": json.loads(tag) if tag else {},
+                "query": query,
+                "elapsed_ms": (time.perf_counter() - started) * 1000,
+                "rows": None if error else len(df),
+                "error": error,
+            }
+            with self.lock:
+                self.statements.append(record)
+
+    def statement_log(self):
+        """Recorded statements as a DataFrame, one row per statement"""
+        with self.lock:
+            records = list(self.statements)
+        log = pd.DataFrame(records, columns=["query_id", "tag", "query", "elapsed_ms", "rows", "error"])
+        for field in ["page", "tab", "section", "cache"]:
+            log[field] = log["tag"].map(lambda tag: tag.get(field))
+        return log
+
+    def clear_log(self):
+        with self.lock:
+            self.statements.clear()
@@ -0,0 +1,232 @@
+# ==============================================================================
+# TDF DATA PLATFORM - MAINTENANCE COST SCALING BENCHMARK
+# ==============================================================================
+# Grows OPERATIONS.MAINTENANCE_RECORDS to N x the seed volume on the local
+# DuckDB stand-in (extra copies spread over ten years of history) and times:
+#
+#   legacy        the former VW_COST_PER_TOWER, two correlated subqueries
+#                 against MAINTENANCE_RECORDS per tower
+#   full_refresh  rebuilding DT_SITE_MAINTENANCE_MONTHLY from scratch
+#   incremental   applying a fixed batch of new records to the rollup, as an
+#                 incremental dynamic table refresh does
+#   cost_per_tower VW_COST_PER_TOWER reading the materialized rollup
+#
+#   python benchmarks/maintenance_scaling.py
+#   python benchmarks/maintenance_scaling.py --scales 1 10 100 1000 --batch-rows 5000
+#
+# Prints each timing's scaling exponent against maintenance volume (1.0 =
+# linear) and exits 1 if a rollup timing grows faster than --max-exponent,
+# or if VW_COST_PER_TOWER disagrees with the legacy query at any scale.
+# ==============================================================================
+
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from local_snowflake import REPO_ROOT, build_database, split_statements, translate
+
+DDL_FILE = os.path.join(REPO_ROOT, "sql", "ddl", "12_executive_views.sql")
+ROLLUP = "TDF_DATA_PLATFORM.ANALYTICS.DT_SITE_MAINTENANCE_MONTHLY"
+RECORDS = "TDF_DATA_PLATFORM.OPERATIONS.MAINTENANCE_RECORDS"
+
+# VW_COST_PER_TOWER before the per-site rollup, kept as the reference result
+LEGACY_COST_PER_TOWER_QUERY = """
+    SELECT
+        t.TOWER_TYPE,
+        r.REGION_NAME,
+        COUNT(*) AS TOWER_COUNT,
+        AVG(t.HEIGHT_M) AS AVG_HEIGHT_M,
+        AVG(t.ORIGINAL_COST_EUR) AS AVG_ORIGINAL_COST,
+        AVG(t.REPLACEMENT_COST_EUR) AS AVG_REPLACEMENT_COST,
+        SUM(t.CURRENT_BOOK_VALUE_EUR) AS TOTAL_BOOK_VALUE,
+        AVG(
+            (SELECT SUM(mr.TOTAL_COST_EUR)
+             FROM TDF_DATA_PLATFORM.OPERATIONS.MAINTENANCE_RECORDS mr
+             WHERE mr.SITE_ID = t.SITE_ID
+             AND mr.PERFORMED_DATE >= DATEADD(YEAR, -1, CURRENT_DATE()))
+        ) AS AVG_ANNUAL_MAINTENANCE_COST,
+        AVG(t.REPLACEMENT_COST_EUR) + AVG(
+            (SELECT COALESCE(SUM(mr.TOTAL_COST_EUR), 0) * 10
+             FROM TDF_DATA_PLATFORM.OPERATIONS.MAINTENANCE_RECORDS mr
+             WHERE mr.SITE_ID = t.SITE_ID)
+        ) AS ESTIMATED_TCO_EUR
+    FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.TOWERS t
+    LEFT JOIN TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES s ON t.SITE_ID = s.SITE_ID
+    LEFT JOIN TDF_DATA_PLATFORM.CORE.DEPARTMENTS d ON s.DEPARTMENT_ID = d.DEPARTMENT_ID
+    LEFT JOIN TDF_DATA_PLATFORM.CORE.REGIONS r ON d.REGION_ID = r.REGION_ID
+    GROUP BY t.TOWER_TYPE, r.REGION_NAME
+"""
+
+COST_PER_TOWER_QUERY = "SELECT * FROM TDF_DATA_PLATFORM.ANALYTICS.VW_COST_PER_TOWER"
+
+# What an incremental refresh does with a batch of new records: aggregate the
+# batch per (site, month) and fold it into the existing groups
+INCREMENTAL_MERGE = f"""
+    MERGE INTO {ROLLUP} r
+    USING (
+        SELECT SITE_ID, date_trunc('month', PERFORMED_DATE) AS MONTH_START,
+               count(*) AS RECORD_COUNT, sum(TOTAL_COST_EUR) AS TOTAL_COST_EUR
+        FROM memory.main.maintenance_batch
+        GROUP BY ALL
+    ) d
+    ON r.SITE_ID = d.SITE_ID AND r.MONTH_START = d.MONTH_START
+    WHEN MATCHED THEN UPDATE SET
+        RECORD_COUNT = r.RECORD_COUNT + d.RECORD_COUNT,
+        TOTAL_COST_EUR = r.TOTAL_COST_EUR + d.TOTAL_COST_EUR
+    WHEN NOT MATCHED THEN INSERT (SITE_ID, MONTH_START, RECORD_COUNT, TOTAL_COST_EUR)
+        VALUES (d.SITE_ID, d.MONTH_START, d.RECORD_COUNT, d.TOTAL_COST_EUR)
+"""
+
+ROLLUP_TIMINGS = ["full_refresh", "incremental", "cost_per_tower"]
+MAX_EXPONENT = 1.25
+
+
+# ==============================================================================
+# SETUP
+# ==============================================================================
+
+def rollup_query():
+    """The DT_SITE_MAINTENANCE_MONTHLY defining query, as written in the DDL"""
+    with open(DDL_FILE, encoding="utf-8") as f:
+        for statement in split_statements(f.read()):
+            if "DYNAMIC TABLE DT_SITE_MAINTENANCE_MONTHLY" in statement.upper():
+                return translate(statement[statement.upper().index("\nAS\n") + 4:])
+    raise ValueError(f"DT_SITE_MAINTENANCE_MONTHLY not found in {DDL_FILE}")
+
+
+def materialize_rollup(conn, query):
+    """Replace the stand-in's view with a stored table, as Snowflake stores a dynamic table"""
+    kind = conn.execute("""
+        SELECT table_type FROM information_schema.tables
+        WHERE table_catalog = 'TDF_DATA_PLATFORM' AND table_schema = 'ANALYTICS'
+          AND table_name = 'DT_SITE_MAINTENANCE_MONTHLY'
+    """).fetchone()
+    if kind and kind[0] == "VIEW":
+        conn.execute(f"DROP VIEW {ROLLUP}")
+    conn.execute(f"CREATE OR REPLACE TABLE {ROLLUP} AS {query}")
+
+
+def scale_records(conn, factor):
+    """Reload MAINTENANCE_RECORDS as factor copies of the seed rows; copy i is shifted back up to ten years"""
+    conn.execute(f"DELETE FROM {RECORDS}")
+    conn.execute(f"""
+        INSERT INTO {RECORDS}
+        SELECT s.* REPLACE (
+            MAINTENANCE_ID || CASE WHEN i = 0 THEN '' ELSE '-' || i END AS MAINTENANCE_ID,
+            CAST(PERFORMED_DATE - CASE WHEN i = 0 THEN 0 ELSE CAST(hash(MAINTENANCE_ID, i) % 3650 AS INTEGER) END
+                 AS DATE) AS PERFORMED_DATE
+        )
+        FROM memory.main.maintenance_seed s, range({factor}) copies(i)
+    """)
+    return conn.execute(f"SELECT count(*) FROM {RECORDS}").fetchone()[0]
+
+
+def new_batch(conn, rows, tag):
+    """A batch of fresh records landing today, staged in memory.main.maintenance_batch"""
+    conn.execute(f"""
+        CREATE OR REPLACE TABLE memory.main.maintenance_batch AS
+        SELECT * REPLACE ('NEW-{tag}-' || row_number() OVER () AS MAINTENANCE_ID, CURRENT_DATE AS PERFORMED_DATE)
+        FROM memory.main.maintenance_seed USING SAMPLE {rows} ROWS
+    """)
+
+
+# ==============================================================================
+# MEASUREMENT
+# ==============================================================================
+
+def timed(conn, statement, runs, before=None):
+    """Median wall time (ms) of a statement over runs; before() is called untimed ahead of each run"""
+    samples = []
+    for _ in range(runs):
+        if before is not None:
+            before()
+        started = time.perf_counter()
+        conn.execute(statement).fetchall()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def same_result(a, b):
+    """True if two VW_COST_PER_TOWER results match (row order and float noise ignored)"""
+    keys = ["TOWER_TYPE", "REGION_NAME"]
+    a = a.sort_values(keys, ignore_index=True)
+    b = b.sort_values(keys, ignore_index=True)
+    if list(a.columns) != list(b.columns) or len(a) != len(b) or not a[keys].equals(b[keys]):
+        return False
+    numeric = [c for c in a.columns if c not in keys]
+    return bool(np.allclose(a[numeric].astype(float), b[numeric].astype(float), rtol=1e-9, equal_nan=True))
+
+
+def run_scale(conn, factor, query, batch_rows, runs):
+    rows = scale_records(conn, factor)
+    materialize_rollup(conn, query)
+    legacy_sql = translate(LEGACY_COST_PER_TOWER_QUERY)
+    result = {
+        "scale": factor,
+        "maintenance_rows": rows,
+        "rollup_rows": conn.execute(f"SELECT count(*) FROM {ROLLUP}").fetchone()[0],
+        "matches_legacy": same_result(conn.execute(legacy_sql).df(), conn.execute(COST_PER_TOWER_QUERY).df()),
+        "legacy": timed(conn, legacy_sql, runs),
+        "full_refresh": timed(conn, f"CREATE OR REPLACE TABLE {ROLLUP} AS {query}", runs),
+        "cost_per_tower": timed(conn, COST_PER_TOWER_QUERY, runs),
+    }
+    batches = iter(range(runs))
+    result["incremental"] = timed(conn, INCREMENTAL_MERGE, runs,
+                                  before=lambda: new_batch(conn, batch_rows, f"{factor}-{next(batches)}"))
+    return result
+
+
+def exponent(results, metric):
+    """Slope of log(time) against log(rows) between the smallest and largest scale"""
+    first, last = results[0], results[-1]
+    if last["maintenance_rows"] == first["maintenance_rows"] or min(first[metric], last[metric]) <= 0:
+        return None
+    return math.log(last[metric] / first[metric]) / math.log(last["maintenance_rows"] / first["maintenance_rows"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintenance cost rollup scaling benchmark on the local stand-in")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100],
+                        help="maintenance volume multipliers (default 1 10 100)")
+    parser.add_argument("--batch-rows", type=int, default=1000, help="new records per incremental refresh")
+    parser.add_argument("--runs", type=int, default=3, help="timed runs per measurement (median reported)")
+    parser.add_argument("--max-exponent", type=float, default=MAX_EXPONENT,
+                        help="fail if a rollup timing scales worse than rows^this (default 1.25)")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    conn, _ = build_database()
+    conn.execute(f"CREATE TABLE memory.main.maintenance_seed AS SELECT * FROM {RECORDS}")
+    query = rollup_query()
+    results = [run_scale(conn, factor, query, args.batch_rows, args.runs) for factor in sorted(args.scales)]
+
+    table = pd.DataFrame(results).set_index("scale")
+    print(f"Median of {args.runs} runs (ms); incremental = {args.batch_rows:,} new records folded into the rollup")
+    print(table.round(1).to_string())
+    print()
+    failed = [f"VW_COST_PER_TOWER differs from the legacy view at {r['scale']}x"
+              for r in results if not r["matches_legacy"]]
+    for metric in ["legacy"] + ROLLUP_TIMINGS:
+        k = exponent(results, metric)
+        print(f"{metric:<15} time ~ rows^{k:.2f}" if k is not None else f"{metric:<15} -")
+        if metric in ROLLUP_TIMINGS and k is not None and k > args.max_exponent:
+            failed.append(f"{metric} scales as rows^{k:.2f} (limit {args.max_exponent})")
+    for message in failed:
+        print(f"FAIL {message}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+# ==============================================================================
+# TDF DATA PLATFORM - QUERY PLAN REGRESSION CHECK
+# ==============================================================================
+# Extracts every SQL statement embedded in the dashboard (streamlit_app.py,
+# tdf_dashboard/) and in sql/queries/*.sql, explains each one against a target
+# environment and records tables scanned (partitions / rows, bytes) and joins
+# (input vs output rows). Flags:
+#
+#   full_scan      a large table read in full (every micro-partition, or
+#                  every row with no filter pushed into the scan)
+#   exploding_join a join emitting more rows than it consumes, e.g. two
+#                  child tables joined on a shared SITE_ID before aggregating
+#
+#   python benchmarks/plan_regression.py --write-baseline plans_baseline.json
+#   python benchmarks/plan_regression.py --baseline plans_baseline.json
+#   python benchmarks/plan_regression.py --backend snowflake --connection tdf --execute
+#
+# With --baseline, only findings absent from the baseline fail the run (exit
+# 1), so accepted full scans of small dimensions do not block changes.
+# Statements are identified by file, enclosing function (or constant) and
+# ordinal, so moving code around does not invalidate the baseline.
+#
+# Backends: local runs EXPLAIN ANALYZE on the DuckDB stand-in (rows, no
+# partitions). snowflake runs EXPLAIN USING JSON (partitions, bytes); with
+# --execute it also runs each statement and reads GET_QUERY_OPERATOR_STATS
+# for join row counts, which spends warehouse time.
+# ==============================================================================
+
+import argparse
+import ast
+import glob
+import json
+import os
+import re
+import sys
+
+from local_snowflake import REPO_ROOT, split_statements
+
+STREAMLIT_DIR = os.path.join(REPO_ROOT, "streamlit")
+PYTHON_SOURCES = ["streamlit_app.py", "tdf_dashboard/common.py", "tdf_dashboard/pages/*.py"]
+SQL_SOURCES = ["sql/queries/*.sql"]
+
+# Embedded SQL: an upper-case SELECT/WITH statement reading FROM something
+_SQL_TEXT_RE = re.compile(r"^\s*(SELECT|WITH)\s[\s\S]*\bFROM\b")
+_USE_RE = re.compile(r"^\s*USE\s+(DATABASE|SCHEMA)\s+([\w.]+)\s*$", re.IGNORECASE)
+
+# Defaults: tables smaller than this are not worth pruning
+MIN_PARTITIONS = 16
+MIN_ROWS = 10_000
+# A join is exploding when it emits more than FANOUT x the rows of its larger input
+FANOUT = 1.5
+
+
+# ==============================================================================
+# STATEMENT EXTRACTION
+# ==============================================================================
+
+class _SqlCollector(ast.NodeVisitor):
+    """Collects SQL string constants with the function or constant they belong to"""
+
+    def __init__(self):
+        self.scope = []
+        self.found = []  # (scope, lineno, sql)
+        self.dynamic = 0
+
+    def visit_FunctionDef(self, node):
+        self.scope.append(node.name)
+        self.generic_visit(node)
+        self.scope.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Assign(self, node):
+        if not self.scope and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            self.scope.append(node.targets[0].id)
+            self.generic_visit(node)
+            self.scope.pop()
+        else:
+            self.generic_visit(node)
+
+    def visit_JoinedStr(self, node):
+        # f-string SQL is assembled at run time and cannot be explained as written
+        text = "".join(v.value for v in node.values if isinstance(v, ast.Constant))
+        if _SQL_TEXT_RE.match(text):
+            self.dynamic += 1
+
+    def visit_Constant(self, node):
+        if isinstance(node.value, str) and _SQL_TEXT_RE.match(node.value):
+            self.found.append((".".join(self.scope) or "<module>", node.lineno, node.value))
+
+
+def extract_statements():
+    """Every dashboard statement as dicts with id, source (file:line), sql and schema context"""
+    statements, dynamic = [], 0
+    for pattern in PYTHON_SOURCES:
+        for path in sorted(glob.glob(os.path.join(STREAMLIT_DIR, pattern))):
+            relpath = os.path.relpath(path, REPO_ROOT)
+            collector = _SqlCollector()
+            with open(path, encoding="utf-8") as f:
+                collector.visit(ast.parse(f.read()))
+            dynamic += collector.dynamic
+            ordinals = {}
+            for scope, lineno, sql in collector.found:
+                ordinals[scope] = ordinals.get(scope, 0) + 1
+                statements.append({
+                    "id": f"{relpath}:{scope}#{ordinals[scope]}",
+                    "source": f"{relpath}:{lineno}",
+                    "sql": sql,
+                    "schema": None,
+                })
+    for pattern in SQL_SOURCES:
+        for path in sorted(glob.glob(os.path.join(REPO_ROOT, pattern))):
+            relpath = os.path.relpath(path, REPO_ROOT)
+            with open(path, encoding="utf-8") as f:
+                script = f.read()
+            database, schema, n = "TDF_DATA_PLATFORM", None, 0
+            for sql in split_statements(script):
+                use = _USE_RE.match(sql)
+                if use:
+                    if use.group(1).upper() == "DATABASE":
+                        database = use.group(2)
+                    else:
+                        schema = use.group(2) if "." in use.group(2) else f"{database}.{use.group(2)}"
+                    continue
+                if not re.match(r"^\s*(SELECT|WITH)\b", sql, re.IGNORECASE):
+                    continue
+                n += 1
+                line = script[:script.find(sql[:80])].count("\n") + 1
+                statements.append({"id": f"{relpath}#{n}", "source": f"{relpath}:{line}", "sql": sql, "schema": schema})
+    return statements, dynamic
+
+
+def _explainable(sql):
+    # Bind placeholders get a sample value; the plan shape does not depend on it
+    return re.sub(r"\?", "1", sql.strip().rstrip(";"))
+
+
+# ==============================================================================
+# BACKENDS
+# ==============================================================================
+
+class LocalPlanner:
+    """EXPLAIN ANALYZE on the DuckDB stand-in: actual rows per scan and join"""
+
+    _JOIN_OPERATORS = ("JOIN", "CROSS_PRODUCT")
+
+    def __init__(self):
+        from local_snowflake import build_database, translate
+        self.translate = translate
+        self.conn, _ = build_database()
+
+    def plan(self, statement):
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA enable_profiling = 'json'")
+        if statement["schema"]:
+            cursor.execute(f"USE {statement['schema']}")
+        profile = cursor.execute("EXPLAIN ANALYZE " + self.translate(_explainable(statement["sql"]))).fetchall()
+        scans, joins = [], []
+        self._walk(json.loads(profile[0][1]), scans, joins)
+        return {"scans": scans, "joins": joins, "bytes": None}
+
+    def _walk(self, node, scans, joins):
+        operator = node.get("operator_type") or ""
+        info = node.get("extra_info") or {}
+        children = node.get("children") or []
+        if operator == "TABLE_SCAN" and "Table" in info:
+            filters = info.get("Filters") or ""
+            scans.append({
+                "table": info["Table"].upper(),
+                "rows_scanned": node.get("operator_rows_scanned"),
+                "filtered": bool(info.get("Filters")),
+                "filters": " AND ".join(filters) if isinstance(filters, list) else filters,
+                "partitions_total": None,
+                "partitions_scanned": None,
+                "bytes": None,
+            })
+        elif any(name in operator for name in self._JOIN_OPERATORS):
+            joins.append({
+                "type": f"{operator} {info.get('Join Type', '')}".strip(),
+                "condition": info.get("Conditions", ""),
+                "input_rows": max((child.get("operator_cardinality") or 0 for child in children), default=0),
+                "output_rows": node.get("operator_cardinality"),
+            })
+        for child in children:
+            self._walk(child, scans, joins)
+
+
+class SnowflakePlanner:
+    """EXPLAIN USING JSON (partitions, bytes) and, with execute, operator row counts"""
+
+    def __init__(self, connection=None, execute=False):
+        from snowflake.snowpark import Session
+        builder = Session.builder
+        if connection:
+            builder = builder.config("connection_name", connection)
+        self.session = builder.create()
+        self.execute = execute
+        self.session.sql("ALTER SESSION SET USE_CACHED_RESULT = FALSE").collect()
+
+    def plan(self, statement):
+        if statement["schema"]:
+            self.session.sql(f"USE SCHEMA {statement['schema']}").collect()
+        sql = _explainable(statement["sql"])
+        explain = json.loads(self.session.sql("EXPLAIN USING JSON " + sql).collect()[0][0])
+        scans, joins = [], []
+        for operation in [op for step in explain.get("Operations", []) for op in step]:
+            name = operation.get("operation", "")
+            if name == "TableScan":
+                scans.append({
+                    "table": (operation.get("objects") or ["?"])[0].upper(),
+                    "rows_scanned": None,
+                    "filtered": None,
+                    "filters": None,
+                    "partitions_total": operation.get("partitionsTotal"),
+                    "partitions_scanned": operation.get("partitionsAssigned"),
+                    "bytes": operation.get("bytesAssigned"),
+                })
+            elif "Join" in name and not self.execute:
+                joins.append({
+                    "type": name,
+                    "condition": "; ".join(operation.get("expressions") or []),
+                    "input_rows": None,
+                    "output_rows": None,
+                })
+        if self.execute:
+            joins = self._executed_joins(sql)
+        return {"scans": scans, "joins": joins, "bytes": explain.get("GlobalStats", {}).get("bytesAssigned")}
+
+    def _executed_joins(self, sql):
+        job = self.session.sql(sql).collect_nowait()
+        job.result()
+        stats = self.session.sql(
+            "SELECT OPERATOR_ID, PARENT_OPERATORS, OPERATOR_TYPE, OPERATOR_STATISTICS, OPERATOR_ATTRIBUTES "
+            "FROM TABLE(GET_QUERY_OPERATOR_STATS(?))", params=[job.query_id]
+        ).collect()
+        # A join's inputs are the outputs of the operators that feed it
+        child_rows = {}
+        for row in stats:
+            output_rows = json.loads(row[3] or "{}").get("output_rows") or 0
+            for parent in json.loads(row[1] or "[]"):
+                child_rows.setdefault(parent, []).append(output_rows)
+        joins = []
+        for row in stats:
+            if "Join" not in row[2]:
+                continue
+            attributes = json.loads(row[4] or "{}")
+            joins.append({
+                "type": row[2],
+                "condition": attributes.get("equality_join_condition") or attributes.get("additional_join_condition", ""),
+                "input_rows": max(child_rows.get(row[0], [0])),
+                "output_rows": json.loads(row[3] or "{}").get("output_rows"),
+            })
+        return joins
+
+
+# ==============================================================================
+# FINDINGS
+# ==============================================================================
+
+def findings(plan, min_partitions=MIN_PARTITIONS, min_rows=MIN_ROWS, fanout=FANOUT):
+    """[(kind, detail)] for one statement's plan"""
+    found = []
+    for scan in plan["scans"]:
+        if scan["partitions_total"] is not None:
+            full = scan["partitions_total"] >= min_partitions and scan["partitions_scanned"] == scan["partitions_total"]
+        else:
+            full = not scan["filtered"] and (scan["rows_scanned"] or 0) >= min_rows
+        if full:
+            found.append(("full_scan", scan["table"]))
+    for join in plan["joins"]:
+        output_rows, input_rows = join["output_rows"], join["input_rows"]
+        if output_rows is not None and output_rows >= min_rows and output_rows > fanout * (input_rows or 0):
+            found.append(("exploding_join", join["condition"] or join["type"]))
+    return found
+
+
+def _summary(plan):
+    scanned = [s for s in plan["scans"]]
+    if any(s["partitions_total"] is not None for s in scanned):
+        total = sum(s["partitions_total"] or 0 for s in scanned)
+        assigned = sum(s["partitions_scanned"] or 0 for s in scanned)
+        volume = f"{assigned:,}/{total:,} partitions, {(plan['bytes'] or 0) / 1024 ** 2:,.1f} MB"
+    else:
+        volume = f"{sum(s['rows_scanned'] or 0 for s in scanned):,} rows scanned"
+    worst = max((j["output_rows"] / max(j["input_rows"] or 1, 1) for j in plan["joins"]
+                 if j["output_rows"] is not None), default=None)
+    fan = f", worst join x{worst:.1f}" if worst is not None else ""
+    return f"{len(scanned)} scans, {len(plan['joins'])} joins, {volume}{fan}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Explain every dashboard statement and flag plan regressions")
+    parser.add_argument("--backend", choices=["local", "snowflake"], default="local")
+    parser.add_argument("--connection", help="connections.toml entry for --backend snowflake")
+    parser.add_argument("--execute", action="store_true",
+                        help="snowflake: also run each statement to get join row counts (uses the warehouse)")
+    parser.add_argument("--min-partitions", type=int, default=MIN_PARTITIONS)
+    parser.add_argument("--min-rows", type=int, default=MIN_ROWS)
+    parser.add_argument("--fanout", type=float, default=FANOUT)
+    parser.add_argument("--filter", help="only statements whose id contains this text")
+    parser.add_argument("--json", help="write every plan and finding to this file")
+    parser.add_argument("--baseline", help="findings file from --write-baseline; only new findings fail")
+    parser.add_argument("--write-baseline", help="write the current findings as the accepted baseline")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print every statement, not just findings")
+    args = parser.parse_args()
+
+    statements, dynamic = extract_statements()
+    if args.filter:
+        statements = [s for s in statements if args.filter in s["id"]]
+    planner = LocalPlanner() if args.backend == "local" else SnowflakePlanner(args.connection, args.execute)
+
+    plans, cache = [], {}
+    for statement in statements:
+        key = (" ".join(statement["sql"].split()), statement["schema"])
+        if key not in cache:
+            try:
+                cache[key] = planner.plan(statement)
+            except Exception as e:
+                cache[key] = {"error": str(e).split("\n")[0][:300]}
+        plan = dict(cache[key], id=statement["id"], source=statement["source"])
+        if "error" not in plan:
+            plan["findings"] = findings(plan, args.min_partitions, args.min_rows, args.fanout)
+        plans.append(plan)
+
+    accepted = set()
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            accepted = {tuple(item) for item in json.load(f)["findings"]}
+
+    new = []
+    for plan in plans:
+        if "error" in plan:
+            if args.verbose:
+                print(f"ERROR  {plan['id']} ({plan['source']}): {plan['error']}")
+            continue
+        plan_new = [f for f in plan["findings"] if (plan["id"], *f) not in accepted]
+        new += [(plan["id"], *f) for f in plan_new]
+        if plan["findings"] or args.verbose:
+            print(f"{plan['id']} ({plan['source']}): {_summary(plan)}")
+            for kind, detail in plan["findings"]:
+                marker = "NEW " if (kind, detail) in plan_new else "    "
+                print(f"  {marker}{kind}: {detail}")
+
+    errors = sum("error" in p for p in plans)
+    print()
+    print(f"{len(plans)} statements explained ({len(cache)} distinct), {errors} could not be explained, "
+          f"{dynamic} f-string statements skipped")
+    print(f"{sum(len(p.get('findings', [])) for p in plans)} findings, {len(new)} not in the baseline")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(plans, f, indent=2, default=str)
+    if args.write_baseline:
+        with open(args.write_baseline, "w", encoding="utf-8") as f:
+            json.dump({"findings": sorted((p["id"], *finding) for p in plans for finding in p.get("findings", []))},
+                      f, indent=2)
+    if new and not args.write_baseline:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
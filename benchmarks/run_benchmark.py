@@ -0,0 +1,231 @@
+# ==============================================================================
+# TDF DATA PLATFORM - OFFLINE DASHBOARD BENCHMARK
+# ==============================================================================
+# Renders every sidebar page and tab of streamlit_app_v2.py through
+# Streamlit's AppTest against the local DuckDB stand-in (local_snowflake.py)
+# and reports latency per page/tab and per query. No Snowflake account needed.
+#
+#   python benchmarks/run_benchmark.py
+#   python benchmarks/run_benchmark.py --latency-ms 80 --json bench.json
+#   python benchmarks/run_benchmark.py --baseline bench.json --tolerance 0.25
+#
+# Each view is rendered cold (query cache cleared) and then --runs more times
+# warm. With --baseline, exits non-zero when a view's cold or warm median is
+# more than --tolerance slower than in the baseline file.
+# ==============================================================================
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+import pandas as pd
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+STREAMLIT_DIR = os.path.join(os.path.dirname(BENCH_DIR), "streamlit")
+APP_FILE = os.path.join(STREAMLIT_DIR, "streamlit_app_v2.py")
+sys.path.insert(0, STREAMLIT_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+# The persistent cache tier would turn cold runs into disk reads
+os.environ.pop("TDF_QUERY_CACHE_DIR", None)
+
+from streamlit.testing.v1 import AppTest
+
+import tdf_dashboard.common as common
+from local_snowflake import LocalSession, build_database
+
+# Differences under this many milliseconds are noise, whatever the ratio
+REGRESSION_FLOOR_MS = 50
+
+
+# ==============================================================================
+# APP DRIVER
+# ==============================================================================
+
+def install_session(session, prefetch=False):
+    """Point the dashboard's get_session() at the local stand-in"""
+    common.get_session = lambda: session
+    # Adjacent-tab prefetch issues queries in the background and blurs
+    # per-view timings; off unless asked for
+    common.TAB_PREFETCH = prefetch
+
+
+def clear_caches():
+    common.get_query_cache().clear()
+    common.get_table_version_cache().clear()
+
+
+def tab_radio(at):
+    """The page's render_tabs() radio, or None for pages without tabs"""
+    for radio in at.main.radio:
+        if radio.key and radio.key.endswith("_tab"):
+            return radio
+    return None
+
+
+def _timed_run(at, timeout):
+    started = time.perf_counter()
+    at.run(timeout=timeout)
+    elapsed = (time.perf_counter() - started) * 1000
+    errors = [e.message for e in at.exception]
+    return elapsed, errors
+
+
+def benchmark_view(at, session, view, select, runs, timeout):
+    """Render one page/tab cold and then warm; returns the view's result record"""
+    clear_caches()
+    select()
+    session.clear_log()
+    cold_ms, errors = _timed_run(at, timeout)
+    statements = session.statement_log()
+    warm = []
+    for _ in range(runs):
+        elapsed, warm_errors = _timed_run(at, timeout)
+        warm.append(elapsed)
+        errors += warm_errors
+    return {
+        "view": view,
+        "cold_ms": cold_ms,
+        "warm_ms": statistics.median(warm) if warm else None,
+        "statements": len(statements),
+        "sql_ms": float(statements["elapsed_ms"].sum()),
+        "query_errors": int(statements["error"].notna().sum()),
+        "exceptions": sorted(set(errors)),
+    }, statements
+
+
+def run_benchmark(session, pages=None, runs=3, timeout=120):
+    """Drive every page (and each of its tabs) through AppTest; returns (views, statements)"""
+    at = AppTest.from_file(APP_FILE, default_timeout=timeout)
+    at.run()
+    nav = at.sidebar.radio[0]
+    views, statement_logs = [], []
+    for page in pages or nav.options:
+        view = page
+        record, statements = benchmark_view(at, session, view, lambda: at.sidebar.radio[0].set_value(page),
+                                            runs, timeout)
+        views.append(record)
+        statement_logs.append(statements.assign(view=view))
+        tabs = tab_radio(at)
+        if tabs is None:
+            continue
+        tab_key = tabs.key
+        for tab in tabs.options[1:]:
+            view = f"{page} / {tab}"
+            record, statements = benchmark_view(at, session, view, lambda: at.main.radio(key=tab_key).set_value(tab),
+                                                runs, timeout)
+            views.append(record)
+            statement_logs.append(statements.assign(view=view))
+        # Leave the page on its first tab for the next visit
+        at.main.radio(key=tab_key).set_value(tabs.options[0])
+    return views, pd.concat(statement_logs, ignore_index=True)
+
+
+# ==============================================================================
+# REPORTING
+# ==============================================================================
+
+def query_report(statements):
+    """Per-statement latency over every cold render, slowest first"""
+    statements = statements.assign(fingerprint=statements["query"].map(common.query_fingerprint))
+    report = statements.groupby("fingerprint").agg(
+        calls=("elapsed_ms", "size"),
+        p50_ms=("elapsed_ms", "median"),
+        max_ms=("elapsed_ms", "max"),
+        rows=("rows", "max"),
+        errors=("error", "count"),
+        view=("view", "first"),
+        section=("section", "first"),
+        error=("error", "first"),
+        query=("query", "first"),
+    )
+    return report.sort_values("max_ms", ascending=False).reset_index()
+
+
+def print_report(load_report, views, queries, top):
+    print(f"Local database: {len(load_report['tables'])} tables loaded in {load_report['load_s']:.1f}s, "
+          f"{len(load_report['failed'])} seed statements not translated")
+    for filename, statement, error in load_report["failed"]:
+        print(f"  {filename}: {statement} -> {error}")
+    print()
+    print(f"{'View':<58} {'Cold ms':>9} {'Warm ms':>9} {'Stmts':>6} {'SQL ms':>9}  Errors")
+    for v in views:
+        problems = v["query_errors"] + len(v["exceptions"])
+        warm = f"{v['warm_ms']:9.0f}" if v["warm_ms"] is not None else f"{'-':>9}"
+        print(f"{v['view'][:58]:<58} {v['cold_ms']:9.0f} {warm} {v['statements']:6d} {v['sql_ms']:9.0f}  "
+              f"{problems or ''}")
+    print()
+    print(f"Slowest statements (top {top}):")
+    for q in queries.head(top).itertuples():
+        print(f"  {q.max_ms:8.1f} ms  x{q.calls:<3d} {str(q.section)[:45]:<45} {' '.join(q.query.split())[:70]}")
+    failing = queries[queries["errors"] > 0]
+    if not failing.empty:
+        print()
+        print(f"Statements failing on the local engine ({len(failing)}):")
+        for q in failing.itertuples():
+            print(f"  {str(q.section)[:45]:<45} {q.error[:100]}")
+    for v in views:
+        for message in v["exceptions"]:
+            print(f"Exception in {v['view']}: {message[:200]}")
+
+
+def compare_to_baseline(views, baseline, tolerance):
+    """Views slower than the baseline by more than tolerance; [(view, metric, before, after)]"""
+    before = {v["view"]: v for v in baseline["views"]}
+    regressions = []
+    for v in views:
+        old = before.get(v["view"])
+        if old is None:
+            continue
+        for metric in ["cold_ms", "warm_ms"]:
+            if v[metric] is None or old.get(metric) is None:
+                continue
+            if v[metric] > old[metric] * (1 + tolerance) and v[metric] - old[metric] > REGRESSION_FLOOR_MS:
+                regressions.append((v["view"], metric, old[metric], v[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard pages against a local Snowflake stand-in")
+    parser.add_argument("--pages", nargs="*", help="sidebar page labels to run (default: all visible pages)")
+    parser.add_argument("--runs", type=int, default=3, help="warm renders per view (default 3)")
+    parser.add_argument("--latency-ms", type=float, default=0,
+                        help="delay added to every statement to model the Snowflake round-trip")
+    parser.add_argument("--prefetch", action="store_true", help="keep adjacent-tab prefetch on")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds allowed per render")
+    parser.add_argument("--top", type=int, default=15, help="statements listed in the report")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="results file from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown against the baseline (default 0.25 = 25%%)")
+    args = parser.parse_args()
+
+    conn, load_report = build_database()
+    session = LocalSession(conn, latency_ms=args.latency_ms)
+    install_session(session, prefetch=args.prefetch)
+    views, statements = run_benchmark(session, args.pages, args.runs, args.timeout)
+    queries = query_report(statements)
+    print_report(load_report, views, queries, args.top)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "latency_ms": args.latency_ms,
+                "views": views,
+                "queries": queries.drop(columns=["query"]).to_dict(orient="records"),
+            }, f, indent=2, default=str)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare_to_baseline(views, json.load(f), args.tolerance)
+        for view, metric, old, new in regressions:
+            print(f"REGRESSION {view} {metric}: {old:.0f} ms -> {new:.0f} ms")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -152,6 +152,11 @@ EXECUTE IMMEDIATE FROM @TDF_DATA_PLATFORM.PUBLIC.TDF_REPO/branches/main/sql/data
 -- ============================================================================
 EXECUTE IMMEDIATE FROM @TDF_DATA_PLATFORM.PUBLIC.TDF_REPO/branches/main/sql/data/22_seed_infrastructure_detail.sql;
 
+-- ============================================================================
+-- FIRST RISK SNAPSHOT (the task then refreshes it on its schedule)
+-- ============================================================================
+EXECUTE TASK TDF_DATA_PLATFORM.ANALYTICS.TASK_REFRESH_RISK_SNAPSHOT;
+
 -- ============================================================================
 -- DEPLOYMENT VALIDATION
 -- ============================================================================
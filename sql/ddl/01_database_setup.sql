@@ -23,6 +23,9 @@ GRANT ALL PRIVILEGES ON DATABASE TDF_DATA_PLATFORM TO ROLE SYSADMIN;
 GRANT CREATE SCHEMA ON DATABASE TDF_DATA_PLATFORM TO ROLE SYSADMIN;
 GRANT USAGE ON DATABASE TDF_DATA_PLATFORM TO ROLE SECURITYADMIN;
 
+-- Scheduled tasks (ANALYTICS.TASK_REFRESH_RISK_SNAPSHOT) run as SYSADMIN
+GRANT EXECUTE TASK ON ACCOUNT TO ROLE SYSADMIN;
+
 -- ============================================================================
 -- ROLES
 -- ============================================================================
@@ -134,6 +137,8 @@ GRANT SELECT ON FUTURE TABLES IN DATABASE TDF_DATA_PLATFORM TO ROLE TDF_ANALYST;
 GRANT SELECT ON FUTURE VIEWS IN DATABASE TDF_DATA_PLATFORM TO ROLE TDF_ANALYST;
 GRANT SELECT ON FUTURE TABLES IN DATABASE TDF_DATA_PLATFORM TO ROLE TDF_EXECUTIVE;
 GRANT SELECT ON FUTURE VIEWS IN DATABASE TDF_DATA_PLATFORM TO ROLE TDF_EXECUTIVE;
+GRANT SELECT ON FUTURE DYNAMIC TABLES IN DATABASE TDF_DATA_PLATFORM TO ROLE TDF_ANALYST;
+GRANT SELECT ON FUTURE DYNAMIC TABLES IN DATABASE TDF_DATA_PLATFORM TO ROLE TDF_EXECUTIVE;
 
 GRANT ALL ON FUTURE TABLES IN DATABASE TDF_DATA_PLATFORM TO ROLE TDF_ENGINEER;
 GRANT ALL ON FUTURE VIEWS IN DATABASE TDF_DATA_PLATFORM TO ROLE TDF_ENGINEER;
@@ -14,6 +14,7 @@ USE SCHEMA OPERATIONS;
 -- WORK_ORDERS (Field work requiring resources - UC1)
 -- ============================================================================
 
+-- Clustered by CREATED_DATE: dashboards read orders created in a trailing window
 CREATE OR REPLACE TABLE WORK_ORDERS (
     WORK_ORDER_ID VARCHAR(20) PRIMARY KEY,
     WORK_ORDER_NUMBER VARCHAR(30) NOT NULL UNIQUE,
@@ -75,7 +76,8 @@ CREATE OR REPLACE TABLE WORK_ORDERS (
     CREATED_BY VARCHAR(100),
     CREATED_AT TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
     UPDATED_AT TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
-);
+)
+CLUSTER BY (CREATED_DATE);
 
 -- ============================================================================
 -- RESOURCE_ALLOCATION (Staff-to-project/work order assignments - UC1)
@@ -118,6 +120,7 @@ CREATE OR REPLACE TABLE RESOURCE_ALLOCATION (
 -- MAINTENANCE_RECORDS (Equipment maintenance history - UC4)
 -- ============================================================================
 
+-- Clustered by PERFORMED_DATE: cost rollups and lifecycle views read a date range
 CREATE OR REPLACE TABLE MAINTENANCE_RECORDS (
     MAINTENANCE_ID VARCHAR(20) PRIMARY KEY,
     
@@ -161,7 +164,8 @@ CREATE OR REPLACE TABLE MAINTENANCE_RECORDS (
     -- Audit
     SOURCE_SYSTEM VARCHAR(50) DEFAULT 'TDF_CMMS',
     CREATED_AT TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
-);
+)
+CLUSTER BY (PERFORMED_DATE);
 
 -- ============================================================================
 -- EQUIPMENT_STATUS (Current equipment health/condition - UC4)
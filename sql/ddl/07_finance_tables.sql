@@ -167,6 +167,7 @@ CREATE OR REPLACE TABLE CAPEX_ACTUALS (
 -- ACCOUNTING_ENTRIES (Journal entries with full lineage - UC2 ESG Audit)
 -- ============================================================================
 
+-- Clustered by FISCAL_YEAR, FISCAL_PERIOD: finance views read one fiscal year or period
 CREATE OR REPLACE TABLE ACCOUNTING_ENTRIES (
     ENTRY_ID VARCHAR(20) PRIMARY KEY,
     JOURNAL_ID VARCHAR(30) NOT NULL,
@@ -223,7 +224,8 @@ CREATE OR REPLACE TABLE ACCOUNTING_ENTRIES (
     IS_ESG_RELEVANT BOOLEAN DEFAULT FALSE COMMENT 'Flag for ESG reporting',
     
     UNIQUE (JOURNAL_ID, LINE_NUMBER)
-);
+)
+CLUSTER BY (FISCAL_YEAR, FISCAL_PERIOD);
 
 -- ============================================================================
 -- RENEWAL_FORECAST (Equipment replacement predictions - UC4)
@@ -15,6 +15,7 @@ USE SCHEMA ENERGY;
 -- CONSUMPTION_READINGS (kWh per site - monthly)
 -- ============================================================================
 
+-- Clustered by YEAR_MONTH: dashboards read a trailing window of months
 CREATE OR REPLACE TABLE CONSUMPTION_READINGS (
     READING_ID VARCHAR(20) PRIMARY KEY,
     
@@ -60,7 +61,8 @@ CREATE OR REPLACE TABLE CONSUMPTION_READINGS (
     -- Audit
     CREATED_AT TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
     UPDATED_AT TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
-);
+)
+CLUSTER BY (YEAR_MONTH);
 
 -- ============================================================================
 -- ENERGY_SUPPLIERS (Energy provider contracts)
@@ -69,6 +69,7 @@ CREATE OR REPLACE TABLE REGULATORY_REPORTS (
 -- AUDIT_TRAIL (Complete data lineage for auditors - UC2)
 -- ============================================================================
 
+-- Clustered by DATA_PERIOD_START, REPORT_ID: lineage is read per reporting period, joined on REPORT_ID
 CREATE OR REPLACE TABLE AUDIT_TRAIL (
     AUDIT_ID VARCHAR(20) PRIMARY KEY,
     
@@ -121,7 +122,8 @@ CREATE OR REPLACE TABLE AUDIT_TRAIL (
     -- Audit
     CREATED_BY VARCHAR(100),
     CREATED_AT TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
-);
+)
+CLUSTER BY (DATA_PERIOD_START, REPORT_ID);
 
 -- ============================================================================
 -- BOARD_SCORECARD (ESG metrics for C-Level/Board)
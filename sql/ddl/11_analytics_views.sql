@@ -142,6 +142,66 @@ LEFT JOIN TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES s ON cr.SITE_ID = s.SITE_ID
 LEFT JOIN TDF_DATA_PLATFORM.CORE.REGIONS r ON s.DEPARTMENT_ID = r.REGION_ID
 GROUP BY cr.YEAR_MONTH, s.SITE_TYPE, r.REGION_NAME;
 
+-- ============================================================================
+-- CLIENT INSTALLATION & WORK ORDER ROLLUPS (dynamic tables)
+-- ============================================================================
+-- A site carries several client installations and many work orders, so
+-- joining CLIENT_INSTALLATIONS and WORK_ORDERS (or SITES) on SITE_ID
+-- repeats each row once per match and inflates every SUM. These rollups
+-- aggregate each side to one row per key first; views and dashboard panels
+-- join them 1:1. Incremental refresh only re-aggregates the keys touched
+-- by changed source rows.
+-- ============================================================================
+
+-- One row per (operator, site): installations, equipment and revenue
+CREATE OR REPLACE DYNAMIC TABLE DT_OPERATOR_SITE_INSTALLATIONS
+    TARGET_LAG = '15 minutes'
+    WAREHOUSE = TDF_WH
+    REFRESH_MODE = INCREMENTAL
+AS
+SELECT
+    OPERATOR_ID,
+    SITE_ID,
+    COUNT(*) AS INSTALLATIONS,
+    SUM(EQUIPMENT_COUNT) AS EQUIPMENT_COUNT,
+    SUM(ANNUAL_REVENUE_EUR) AS ANNUAL_REVENUE_EUR
+FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.CLIENT_INSTALLATIONS
+GROUP BY OPERATOR_ID, SITE_ID;
+
+-- One row per site: work order volume, SLA outcomes and open critical tickets
+CREATE OR REPLACE DYNAMIC TABLE DT_SITE_WORK_ORDERS
+    TARGET_LAG = '15 minutes'
+    WAREHOUSE = TDF_WH
+    REFRESH_MODE = INCREMENTAL
+AS
+SELECT
+    SITE_ID,
+    COUNT(*) AS WORK_ORDERS,
+    SUM(CASE WHEN SLA_MET = TRUE THEN 1 ELSE 0 END) AS SLA_MET_COUNT,
+    SUM(CASE WHEN STATUS = 'OPEN' AND PRIORITY IN ('CRITICAL', 'HIGH') THEN 1 ELSE 0 END) AS OPEN_CRITICAL_TICKETS
+FROM TDF_DATA_PLATFORM.OPERATIONS.WORK_ORDERS
+GROUP BY SITE_ID;
+
+-- One row per operator: footprint and service level across the sites it
+-- occupies (a work order counts once per operator present at its site)
+CREATE OR REPLACE DYNAMIC TABLE DT_OPERATOR_SERVICE_LEVEL
+    TARGET_LAG = '15 minutes'
+    WAREHOUSE = TDF_WH
+    REFRESH_MODE = INCREMENTAL
+AS
+SELECT
+    osi.OPERATOR_ID,
+    COUNT(*) AS SITES_COUNT,
+    SUM(osi.INSTALLATIONS) AS INSTALLATIONS,
+    SUM(osi.EQUIPMENT_COUNT) AS EQUIPMENT_COUNT,
+    SUM(osi.ANNUAL_REVENUE_EUR) AS ANNUAL_REVENUE_EUR,
+    SUM(swo.WORK_ORDERS) AS WORK_ORDERS,
+    SUM(swo.SLA_MET_COUNT) AS SLA_MET_COUNT,
+    SUM(swo.OPEN_CRITICAL_TICKETS) AS OPEN_CRITICAL_TICKETS
+FROM DT_OPERATOR_SITE_INSTALLATIONS osi
+LEFT JOIN DT_SITE_WORK_ORDERS swo ON osi.SITE_ID = swo.SITE_ID
+GROUP BY osi.OPERATOR_ID;
+
 -- ============================================================================
 -- UC3: INFRASTRUCTURE & DIGITAL TWIN VIEWS
 -- ============================================================================
@@ -175,7 +235,11 @@ SELECT
     ROUND(SUM(s.CURRENT_TENANTS) / NULLIF(COUNT(DISTINCT s.SITE_ID), 0), 2) AS COLOCATION_RATE,
     SUM(ci.ANNUAL_REVENUE_EUR) AS TOTAL_ANNUAL_REVENUE
 FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES s
-LEFT JOIN TDF_DATA_PLATFORM.INFRASTRUCTURE.CLIENT_INSTALLATIONS ci ON s.SITE_ID = ci.SITE_ID
+LEFT JOIN (
+    SELECT SITE_ID, SUM(ANNUAL_REVENUE_EUR) AS ANNUAL_REVENUE_EUR
+    FROM DT_OPERATOR_SITE_INSTALLATIONS
+    GROUP BY SITE_ID
+) ci ON s.SITE_ID = ci.SITE_ID
 LEFT JOIN TDF_DATA_PLATFORM.CORE.DEPARTMENTS d ON s.DEPARTMENT_ID = d.DEPARTMENT_ID
 LEFT JOIN TDF_DATA_PLATFORM.CORE.REGIONS r ON d.REGION_ID = r.REGION_ID
 WHERE s.STATUS = 'ACTIVE'
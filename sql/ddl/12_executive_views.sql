@@ -63,6 +63,103 @@ LEFT JOIN TDF_DATA_PLATFORM.ESG.BOARD_SCORECARD bs
     ON em.FISCAL_YEAR = bs.FISCAL_YEAR 
     AND em.FISCAL_MONTH = MONTH(bs.REPORTING_DATE);
 
+-- ============================================================================
+-- EXECUTIVE KPI SUMMARY (Dynamic Table)
+-- ============================================================================
+-- Materialized VW_EXECUTIVE_KPIS, read by the Executive Dashboard hero banner
+-- and the app sidebar. The view re-runs its five platform-wide scalar
+-- subqueries for every EBITDA_METRICS row on every read; here they are
+-- single-row aggregates joined once, recomputed only when a source changed.
+-- Also carries the sidebar figures (active tower sites, active employees).
+--
+-- REFRESH_MODE = AUTO: a CROSS JOIN of scalar aggregates may not qualify for
+-- incremental refresh, and INCREMENTAL would then fail the CREATE on deploy.
+-- AUTO picks incremental when the shape allows it, full otherwise. Check which
+-- mode was chosen (and why) after deploying:
+--   SHOW DYNAMIC TABLES LIKE 'DT_EXECUTIVE_KPIS' IN SCHEMA ANALYTICS;
+--   -- refresh_mode, refresh_mode_reason columns
+--
+-- Target lag matches the app's 'finance' cache TTL (15 minutes). Change it with:
+--   ALTER DYNAMIC TABLE ANALYTICS.DT_EXECUTIVE_KPIS SET TARGET_LAG = '1 hour';
+-- Refresh cost vs the plain view: sql/queries/executive_kpis_refresh_cost.sql
+-- ============================================================================
+
+CREATE OR REPLACE DYNAMIC TABLE DT_EXECUTIVE_KPIS
+    TARGET_LAG = '15 minutes'
+    WAREHOUSE = TDF_WH
+    REFRESH_MODE = AUTO
+AS
+SELECT
+    em.PERIOD_DATE,
+    em.FISCAL_YEAR,
+    em.FISCAL_MONTH,
+
+    -- Revenue
+    em.REVENUE_EUR,
+    em.REVENUE_EUR / 1000000 AS REVENUE_EUR_M,
+
+    -- EBITDA (Target: 42-53%)
+    em.EBITDAAL_EUR,
+    em.EBITDAAL_MARGIN_PCT,
+    CASE
+        WHEN em.EBITDAAL_MARGIN_PCT >= 45 THEN 'GREEN'
+        WHEN em.EBITDAAL_MARGIN_PCT >= 40 THEN 'AMBER'
+        ELSE 'RED'
+    END AS EBITDA_STATUS,
+
+    -- YoY Growth
+    em.YOY_GROWTH_PCT,
+
+    -- Infrastructure
+    s.ACTIVE_SITES,
+    s.ACTIVE_TOWER_SITES,
+    t.TOTAL_TOWERS,
+
+    -- Colocation
+    s.AVG_COLOCATION_RATE,
+
+    -- ESG
+    bs.CARBON_EMISSIONS_TONNES,
+    bs.RENEWABLE_ENERGY_PCT,
+    bs.EQUALITY_INDEX_SCORE,
+    bs.OVERALL_ESG_STATUS,
+
+    -- Risk
+    es.AVG_EQUIPMENT_RISK,
+    dl.OPEN_DISCREPANCIES,
+
+    -- Workforce
+    e.ACTIVE_EMPLOYEES,
+
+    -- Credit Rating
+    'BBB-' AS FITCH_RATING,
+    'Stable' AS RATING_OUTLOOK
+
+FROM TDF_DATA_PLATFORM.FINANCE.EBITDA_METRICS em
+LEFT JOIN TDF_DATA_PLATFORM.ESG.BOARD_SCORECARD bs
+    ON em.FISCAL_YEAR = bs.FISCAL_YEAR
+    AND em.FISCAL_MONTH = MONTH(bs.REPORTING_DATE)
+CROSS JOIN (
+    SELECT
+        COUNT(*) AS ACTIVE_SITES,
+        COUNT(CASE WHEN SITE_TYPE = 'TOWER' THEN 1 END) AS ACTIVE_TOWER_SITES,
+        AVG(COLOCATION_RATE) AS AVG_COLOCATION_RATE
+    FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES
+    WHERE STATUS = 'ACTIVE'
+) s
+CROSS JOIN (SELECT COUNT(*) AS TOTAL_TOWERS FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.TOWERS) t
+CROSS JOIN (SELECT AVG(FAILURE_RISK_SCORE) AS AVG_EQUIPMENT_RISK FROM TDF_DATA_PLATFORM.OPERATIONS.EQUIPMENT_STATUS) es
+CROSS JOIN (
+    SELECT COUNT(*) AS OPEN_DISCREPANCIES
+    FROM TDF_DATA_PLATFORM.DIGITAL_TWIN.DISCREPANCY_LOG
+    WHERE STATUS = 'OPEN'
+) dl
+CROSS JOIN (
+    SELECT COUNT(*) AS ACTIVE_EMPLOYEES
+    FROM TDF_DATA_PLATFORM.HR.EMPLOYEES
+    WHERE EMPLOYMENT_STATUS = 'ACTIVE'
+) e;
+
 -- ============================================================================
 -- REVENUE ANALYSIS (Segment & Client Breakdown)
 -- ============================================================================
@@ -137,50 +234,246 @@ LEFT JOIN TDF_DATA_PLATFORM.CORE.BUSINESS_UNITS bu ON em.BU_ID = bu.BU_ID;
 -- ============================================================================
 -- RISK DASHBOARD (C-Level Risk View)
 -- ============================================================================
+-- Risk metrics are snapshotted by TASK_REFRESH_RISK_SNAPSHOT: every metric is
+-- computed once per run (one pass per source table) and the RAG statuses are
+-- derived from the computed values. Each run upserts today's row, so
+-- RISK_SNAPSHOT_HISTORY keeps one dated row per day for trends; the
+-- Executive Risk Radar reads the latest row.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS RISK_SNAPSHOT_HISTORY (
+    SNAPSHOT_DATE DATE NOT NULL,
+    REFRESHED_AT TIMESTAMP_NTZ NOT NULL,
 
-CREATE OR REPLACE VIEW VW_RISK_DASHBOARD AS
-SELECT 
-    CURRENT_DATE() AS REPORT_DATE,
-    
     -- Equipment Risk
-    (SELECT COUNT(*) FROM TDF_DATA_PLATFORM.OPERATIONS.EQUIPMENT_STATUS WHERE FAILURE_RISK_SCORE >= 80) AS CRITICAL_EQUIPMENT_COUNT,
-    (SELECT AVG(FAILURE_RISK_SCORE) FROM TDF_DATA_PLATFORM.OPERATIONS.EQUIPMENT_STATUS) AS AVG_EQUIPMENT_RISK_SCORE,
-    CASE 
-        WHEN (SELECT AVG(FAILURE_RISK_SCORE) FROM TDF_DATA_PLATFORM.OPERATIONS.EQUIPMENT_STATUS) <= 30 THEN 'GREEN'
-        WHEN (SELECT AVG(FAILURE_RISK_SCORE) FROM TDF_DATA_PLATFORM.OPERATIONS.EQUIPMENT_STATUS) <= 50 THEN 'AMBER'
-        ELSE 'RED'
-    END AS EQUIPMENT_RISK_STATUS,
-    
+    CRITICAL_EQUIPMENT_COUNT NUMBER,
+    HIGH_RISK_EQUIPMENT_COUNT NUMBER,
+    AVG_EQUIPMENT_RISK_SCORE FLOAT,
+    EQUIPMENT_RISK_STATUS VARCHAR(10),
+
     -- Infrastructure Risk
-    (SELECT AVG(RISK_SCORE) FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES WHERE STATUS = 'ACTIVE') AS AVG_SITE_RISK_SCORE,
-    CASE 
-        WHEN (SELECT AVG(RISK_SCORE) FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES WHERE STATUS = 'ACTIVE') <= 30 THEN 'GREEN'
-        WHEN (SELECT AVG(RISK_SCORE) FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES WHERE STATUS = 'ACTIVE') <= 50 THEN 'AMBER'
-        ELSE 'RED'
-    END AS INFRASTRUCTURE_RISK_STATUS,
-    
+    AVG_SITE_RISK_SCORE FLOAT,
+    INFRASTRUCTURE_RISK_STATUS VARCHAR(10),
+    PLANNED_SITES NUMBER,
+
     -- Digital Twin Quality Risk
-    (SELECT COUNT(*) FROM TDF_DATA_PLATFORM.DIGITAL_TWIN.DISCREPANCY_LOG WHERE STATUS = 'OPEN' AND SEVERITY = 'CRITICAL') AS CRITICAL_DISCREPANCIES,
-    (SELECT AVG(OVERALL_SCORE) FROM TDF_DATA_PLATFORM.DIGITAL_TWIN.DATA_QUALITY_SCORES WHERE ENTITY_TYPE = 'COMPANY') AS DT_QUALITY_SCORE,
-    CASE 
-        WHEN (SELECT AVG(OVERALL_SCORE) FROM TDF_DATA_PLATFORM.DIGITAL_TWIN.DATA_QUALITY_SCORES WHERE ENTITY_TYPE = 'COMPANY') >= 80 THEN 'GREEN'
-        WHEN (SELECT AVG(OVERALL_SCORE) FROM TDF_DATA_PLATFORM.DIGITAL_TWIN.DATA_QUALITY_SCORES WHERE ENTITY_TYPE = 'COMPANY') >= 60 THEN 'AMBER'
-        ELSE 'RED'
-    END AS DATA_QUALITY_STATUS,
-    
+    CRITICAL_DISCREPANCIES NUMBER,
+    DT_QUALITY_SCORE FLOAT,
+    DATA_QUALITY_STATUS VARCHAR(10),
+
     -- Compliance Risk
-    (SELECT COUNT(*) FROM TDF_DATA_PLATFORM.ESG.COMPLIANCE_REQUIREMENTS WHERE COMPLIANCE_STATUS = 'NON_COMPLIANT') AS NON_COMPLIANT_COUNT,
-    CASE 
-        WHEN (SELECT COUNT(*) FROM TDF_DATA_PLATFORM.ESG.COMPLIANCE_REQUIREMENTS WHERE COMPLIANCE_STATUS = 'NON_COMPLIANT') = 0 THEN 'GREEN'
-        WHEN (SELECT COUNT(*) FROM TDF_DATA_PLATFORM.ESG.COMPLIANCE_REQUIREMENTS WHERE COMPLIANCE_STATUS = 'NON_COMPLIANT') <= 2 THEN 'AMBER'
-        ELSE 'RED'
-    END AS COMPLIANCE_RISK_STATUS,
-    
-    -- Coverage Risk (Zones Blanches)
-    (SELECT COUNT(*) FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES WHERE STATUS = 'PLANNED') AS PLANNED_SITES,
-    
-    -- Overall Risk
-    'AMBER' AS OVERALL_RISK_STATUS;
+    NON_COMPLIANT_COUNT NUMBER,
+    COMPLIANCE_RISK_STATUS VARCHAR(10),
+    PENDING_ESG_REPORTS NUMBER,
+
+    -- Service Risk
+    SLA_BREACHES_30D NUMBER,
+
+    -- Commercial Risk (next contract renewals)
+    NEXT_EXPIRY_OPERATOR VARCHAR(200),
+    NEXT_EXPIRY_DATE DATE,
+    NEXT_EXPIRY_DAYS NUMBER,
+    NEXT_EXPIRY_REVENUE_M FLOAT,
+    CONTRACTS_EXPIRING_12M NUMBER,
+    CONTRACT_REVENUE_AT_RISK_M FLOAT,
+
+    -- Overall Risk (worst component status)
+    OVERALL_RISK_STATUS VARCHAR(10),
+
+    PRIMARY KEY (SNAPSHOT_DATE)
+) COMMENT = 'Daily risk snapshot, refreshed by TASK_REFRESH_RISK_SNAPSHOT';
+
+CREATE OR REPLACE TASK TASK_REFRESH_RISK_SNAPSHOT
+    WAREHOUSE = TDF_WH
+    SCHEDULE = '15 MINUTE'
+    COMMENT = 'Upserts today''s row of RISK_SNAPSHOT_HISTORY'
+AS
+MERGE INTO TDF_DATA_PLATFORM.ANALYTICS.RISK_SNAPSHOT_HISTORY h
+USING (
+    WITH equipment AS (
+        SELECT
+            COUNT(CASE WHEN FAILURE_RISK_SCORE >= 80 THEN 1 END) AS CRITICAL_EQUIPMENT_COUNT,
+            COUNT(CASE WHEN FAILURE_RISK_SCORE > 70 THEN 1 END) AS HIGH_RISK_EQUIPMENT_COUNT,
+            AVG(FAILURE_RISK_SCORE) AS AVG_EQUIPMENT_RISK_SCORE
+        FROM TDF_DATA_PLATFORM.OPERATIONS.EQUIPMENT_STATUS
+    ),
+    sites AS (
+        SELECT
+            AVG(CASE WHEN STATUS = 'ACTIVE' THEN RISK_SCORE END) AS AVG_SITE_RISK_SCORE,
+            COUNT(CASE WHEN STATUS = 'PLANNED' THEN 1 END) AS PLANNED_SITES
+        FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES
+    ),
+    discrepancies AS (
+        SELECT COUNT(*) AS CRITICAL_DISCREPANCIES
+        FROM TDF_DATA_PLATFORM.DIGITAL_TWIN.DISCREPANCY_LOG
+        WHERE STATUS = 'OPEN' AND SEVERITY = 'CRITICAL'
+    ),
+    data_quality AS (
+        SELECT AVG(OVERALL_SCORE) AS DT_QUALITY_SCORE
+        FROM TDF_DATA_PLATFORM.DIGITAL_TWIN.DATA_QUALITY_SCORES
+        WHERE ENTITY_TYPE = 'COMPANY'
+    ),
+    compliance AS (
+        SELECT COUNT(*) AS NON_COMPLIANT_COUNT
+        FROM TDF_DATA_PLATFORM.ESG.COMPLIANCE_REQUIREMENTS
+        WHERE COMPLIANCE_STATUS = 'NON_COMPLIANT'
+    ),
+    esg_reports AS (
+        SELECT COUNT(*) AS PENDING_ESG_REPORTS
+        FROM TDF_DATA_PLATFORM.ESG.REGULATORY_REPORTS
+        WHERE STATUS IN ('DRAFT', 'REVIEW')
+    ),
+    sla AS (
+        SELECT COUNT(*) AS SLA_BREACHES_30D
+        FROM TDF_DATA_PLATFORM.OPERATIONS.WORK_ORDERS
+        WHERE SLA_MET = FALSE
+        AND STATUS = 'COMPLETED'
+        AND CREATED_DATE >= DATEADD(MONTH, -1, CURRENT_DATE())
+    ),
+    next_contracts AS (
+        SELECT
+            OPERATOR_NAME,
+            CONTRACT_END_DATE,
+            DATEDIFF(DAY, CURRENT_DATE(), CONTRACT_END_DATE) AS DAYS_TO_EXPIRY,
+            ANNUAL_REVENUE_EUR / 1000000 AS REVENUE_M
+        FROM TDF_DATA_PLATFORM.CORE.OPERATORS
+        WHERE CONTRACT_END_DATE IS NOT NULL
+        AND ANNUAL_REVENUE_EUR > 0
+        ORDER BY CONTRACT_END_DATE ASC
+        LIMIT 5
+    ),
+    contracts AS (
+        SELECT
+            COUNT(CASE WHEN DAYS_TO_EXPIRY < 365 THEN 1 END) AS CONTRACTS_EXPIRING_12M,
+            COALESCE(SUM(CASE WHEN DAYS_TO_EXPIRY < 365 THEN REVENUE_M END), 0) AS CONTRACT_REVENUE_AT_RISK_M
+        FROM next_contracts
+    ),
+    next_contract AS (
+        SELECT * FROM next_contracts ORDER BY CONTRACT_END_DATE ASC LIMIT 1
+    ),
+    metrics AS (
+        SELECT
+            CURRENT_DATE() AS SNAPSHOT_DATE,
+            CURRENT_TIMESTAMP()::TIMESTAMP_NTZ AS REFRESHED_AT,
+            e.*, s.*, d.*, q.*, c.*, r.*, w.*, k.*,
+            n.OPERATOR_NAME AS NEXT_EXPIRY_OPERATOR,
+            n.CONTRACT_END_DATE AS NEXT_EXPIRY_DATE,
+            n.DAYS_TO_EXPIRY AS NEXT_EXPIRY_DAYS,
+            n.REVENUE_M AS NEXT_EXPIRY_REVENUE_M
+        FROM equipment e
+        CROSS JOIN sites s
+        CROSS JOIN discrepancies d
+        CROSS JOIN data_quality q
+        CROSS JOIN compliance c
+        CROSS JOIN esg_reports r
+        CROSS JOIN sla w
+        CROSS JOIN contracts k
+        LEFT JOIN next_contract n ON TRUE
+    ),
+    statuses AS (
+        SELECT
+            m.*,
+            CASE
+                WHEN m.AVG_EQUIPMENT_RISK_SCORE <= 30 THEN 'GREEN'
+                WHEN m.AVG_EQUIPMENT_RISK_SCORE <= 50 THEN 'AMBER'
+                ELSE 'RED'
+            END AS EQUIPMENT_RISK_STATUS,
+            CASE
+                WHEN m.AVG_SITE_RISK_SCORE <= 30 THEN 'GREEN'
+                WHEN m.AVG_SITE_RISK_SCORE <= 50 THEN 'AMBER'
+                ELSE 'RED'
+            END AS INFRASTRUCTURE_RISK_STATUS,
+            CASE
+                WHEN m.DT_QUALITY_SCORE >= 80 THEN 'GREEN'
+                WHEN m.DT_QUALITY_SCORE >= 60 THEN 'AMBER'
+                ELSE 'RED'
+            END AS DATA_QUALITY_STATUS,
+            CASE
+                WHEN m.NON_COMPLIANT_COUNT = 0 THEN 'GREEN'
+                WHEN m.NON_COMPLIANT_COUNT <= 2 THEN 'AMBER'
+                ELSE 'RED'
+            END AS COMPLIANCE_RISK_STATUS
+        FROM metrics m
+    )
+    SELECT
+        st.*,
+        CASE
+            WHEN 'RED' IN (st.EQUIPMENT_RISK_STATUS, st.INFRASTRUCTURE_RISK_STATUS,
+                           st.DATA_QUALITY_STATUS, st.COMPLIANCE_RISK_STATUS) THEN 'RED'
+            WHEN 'AMBER' IN (st.EQUIPMENT_RISK_STATUS, st.INFRASTRUCTURE_RISK_STATUS,
+                             st.DATA_QUALITY_STATUS, st.COMPLIANCE_RISK_STATUS) THEN 'AMBER'
+            ELSE 'GREEN'
+        END AS OVERALL_RISK_STATUS
+    FROM statuses st
+) src
+ON h.SNAPSHOT_DATE = src.SNAPSHOT_DATE
+WHEN MATCHED THEN UPDATE SET
+    REFRESHED_AT = src.REFRESHED_AT,
+    CRITICAL_EQUIPMENT_COUNT = src.CRITICAL_EQUIPMENT_COUNT,
+    HIGH_RISK_EQUIPMENT_COUNT = src.HIGH_RISK_EQUIPMENT_COUNT,
+    AVG_EQUIPMENT_RISK_SCORE = src.AVG_EQUIPMENT_RISK_SCORE,
+    EQUIPMENT_RISK_STATUS = src.EQUIPMENT_RISK_STATUS,
+    AVG_SITE_RISK_SCORE = src.AVG_SITE_RISK_SCORE,
+    INFRASTRUCTURE_RISK_STATUS = src.INFRASTRUCTURE_RISK_STATUS,
+    PLANNED_SITES = src.PLANNED_SITES,
+    CRITICAL_DISCREPANCIES = src.CRITICAL_DISCREPANCIES,
+    DT_QUALITY_SCORE = src.DT_QUALITY_SCORE,
+    DATA_QUALITY_STATUS = src.DATA_QUALITY_STATUS,
+    NON_COMPLIANT_COUNT = src.NON_COMPLIANT_COUNT,
+    COMPLIANCE_RISK_STATUS = src.COMPLIANCE_RISK_STATUS,
+    PENDING_ESG_REPORTS = src.PENDING_ESG_REPORTS,
+    SLA_BREACHES_30D = src.SLA_BREACHES_30D,
+    NEXT_EXPIRY_OPERATOR = src.NEXT_EXPIRY_OPERATOR,
+    NEXT_EXPIRY_DATE = src.NEXT_EXPIRY_DATE,
+    NEXT_EXPIRY_DAYS = src.NEXT_EXPIRY_DAYS,
+    NEXT_EXPIRY_REVENUE_M = src.NEXT_EXPIRY_REVENUE_M,
+    CONTRACTS_EXPIRING_12M = src.CONTRACTS_EXPIRING_12M,
+    CONTRACT_REVENUE_AT_RISK_M = src.CONTRACT_REVENUE_AT_RISK_M,
+    OVERALL_RISK_STATUS = src.OVERALL_RISK_STATUS
+WHEN NOT MATCHED THEN INSERT (
+    SNAPSHOT_DATE, REFRESHED_AT,
+    CRITICAL_EQUIPMENT_COUNT, HIGH_RISK_EQUIPMENT_COUNT, AVG_EQUIPMENT_RISK_SCORE, EQUIPMENT_RISK_STATUS,
+    AVG_SITE_RISK_SCORE, INFRASTRUCTURE_RISK_STATUS, PLANNED_SITES,
+    CRITICAL_DISCREPANCIES, DT_QUALITY_SCORE, DATA_QUALITY_STATUS,
+    NON_COMPLIANT_COUNT, COMPLIANCE_RISK_STATUS, PENDING_ESG_REPORTS,
+    SLA_BREACHES_30D,
+    NEXT_EXPIRY_OPERATOR, NEXT_EXPIRY_DATE, NEXT_EXPIRY_DAYS, NEXT_EXPIRY_REVENUE_M,
+    CONTRACTS_EXPIRING_12M, CONTRACT_REVENUE_AT_RISK_M,
+    OVERALL_RISK_STATUS
+) VALUES (
+    src.SNAPSHOT_DATE, src.REFRESHED_AT,
+    src.CRITICAL_EQUIPMENT_COUNT, src.HIGH_RISK_EQUIPMENT_COUNT, src.AVG_EQUIPMENT_RISK_SCORE, src.EQUIPMENT_RISK_STATUS,
+    src.AVG_SITE_RISK_SCORE, src.INFRASTRUCTURE_RISK_STATUS, src.PLANNED_SITES,
+    src.CRITICAL_DISCREPANCIES, src.DT_QUALITY_SCORE, src.DATA_QUALITY_STATUS,
+    src.NON_COMPLIANT_COUNT, src.COMPLIANCE_RISK_STATUS, src.PENDING_ESG_REPORTS,
+    src.SLA_BREACHES_30D,
+    src.NEXT_EXPIRY_OPERATOR, src.NEXT_EXPIRY_DATE, src.NEXT_EXPIRY_DAYS, src.NEXT_EXPIRY_REVENUE_M,
+    src.CONTRACTS_EXPIRING_12M, src.CONTRACT_REVENUE_AT_RISK_M,
+    src.OVERALL_RISK_STATUS
+);
+
+ALTER TASK TASK_REFRESH_RISK_SNAPSHOT RESUME;
+
+-- Latest snapshot, with the columns of the former single-row view
+CREATE OR REPLACE VIEW VW_RISK_DASHBOARD AS
+SELECT
+    SNAPSHOT_DATE AS REPORT_DATE,
+    REFRESHED_AT,
+    CRITICAL_EQUIPMENT_COUNT,
+    AVG_EQUIPMENT_RISK_SCORE,
+    EQUIPMENT_RISK_STATUS,
+    AVG_SITE_RISK_SCORE,
+    INFRASTRUCTURE_RISK_STATUS,
+    CRITICAL_DISCREPANCIES,
+    DT_QUALITY_SCORE,
+    DATA_QUALITY_STATUS,
+    NON_COMPLIANT_COUNT,
+    COMPLIANCE_RISK_STATUS,
+    PLANNED_SITES,
+    OVERALL_RISK_STATUS
+FROM RISK_SNAPSHOT_HISTORY
+ORDER BY SNAPSHOT_DATE DESC
+LIMIT 1;
 
 -- ============================================================================
 -- MARKET SHARE & COMPETITIVE POSITION
@@ -236,6 +529,63 @@ ORDER BY ANNUAL_REVENUE_EUR DESC;
 -- COST PER TOWER / SITE ANALYSIS
 -- ============================================================================
 
+-- Maintenance cost per site and month, maintained incrementally: a refresh
+-- only re-aggregates the (site, month) groups touched by new, changed or
+-- deleted MAINTENANCE_RECORDS, whatever the size of the CMMS history
+CREATE OR REPLACE DYNAMIC TABLE DT_SITE_MAINTENANCE_MONTHLY
+    TARGET_LAG = '1 hour'
+    WAREHOUSE = TDF_WH
+    REFRESH_MODE = INCREMENTAL
+AS
+SELECT
+    SITE_ID,
+    DATE_TRUNC('MONTH', PERFORMED_DATE) AS MONTH_START,
+    COUNT(*) AS RECORD_COUNT,
+    SUM(TOTAL_COST_EUR) AS TOTAL_COST_EUR
+FROM TDF_DATA_PLATFORM.OPERATIONS.MAINTENANCE_RECORDS
+GROUP BY SITE_ID, DATE_TRUNC('MONTH', PERFORMED_DATE);
+
+-- Trailing-12-month and lifetime maintenance cost per site. Whole months
+-- inside the window come from the monthly rollup; only the month straddling
+-- the window start is read from MAINTENANCE_RECORDS (date-pruned), so the
+-- trailing window stays exact to the day. COST_T12M_EUR is NULL for sites
+-- with no maintenance in the window.
+CREATE OR REPLACE VIEW VW_SITE_MAINTENANCE_COST AS
+WITH window_start AS (
+    SELECT
+        DATEADD(YEAR, -1, CURRENT_DATE()) AS START_DATE,
+        DATE_TRUNC('MONTH', DATEADD(YEAR, -1, CURRENT_DATE())) AS START_MONTH
+),
+by_site AS (
+    SELECT
+        m.SITE_ID,
+        SUM(m.RECORD_COUNT) AS RECORD_COUNT,
+        SUM(m.TOTAL_COST_EUR) AS COST_LIFETIME_EUR,
+        SUM(CASE WHEN m.MONTH_START > w.START_MONTH THEN m.TOTAL_COST_EUR END) AS COST_FULL_MONTHS_EUR,
+        COUNT(CASE WHEN m.MONTH_START > w.START_MONTH THEN 1 END) AS N_FULL_MONTHS
+    FROM DT_SITE_MAINTENANCE_MONTHLY m
+    CROSS JOIN window_start w
+    GROUP BY m.SITE_ID
+),
+start_month AS (
+    SELECT mr.SITE_ID, SUM(mr.TOTAL_COST_EUR) AS COST_EUR
+    FROM TDF_DATA_PLATFORM.OPERATIONS.MAINTENANCE_RECORDS mr
+    CROSS JOIN window_start w
+    WHERE mr.PERFORMED_DATE >= w.START_DATE
+    AND mr.PERFORMED_DATE < DATEADD(MONTH, 1, w.START_MONTH)
+    GROUP BY mr.SITE_ID
+)
+SELECT
+    b.SITE_ID,
+    b.RECORD_COUNT,
+    b.COST_LIFETIME_EUR,
+    CASE
+        WHEN b.N_FULL_MONTHS = 0 AND sm.SITE_ID IS NULL THEN NULL
+        ELSE COALESCE(b.COST_FULL_MONTHS_EUR, 0) + COALESCE(sm.COST_EUR, 0)
+    END AS COST_T12M_EUR
+FROM by_site b
+LEFT JOIN start_month sm ON b.SITE_ID = sm.SITE_ID;
+
 CREATE OR REPLACE VIEW VW_COST_PER_TOWER AS
 SELECT 
     t.TOWER_TYPE,
@@ -246,25 +596,19 @@ SELECT
     AVG(t.REPLACEMENT_COST_EUR) AS AVG_REPLACEMENT_COST,
     SUM(t.CURRENT_BOOK_VALUE_EUR) AS TOTAL_BOOK_VALUE,
     
-    -- Maintenance Costs
-    AVG(
-        (SELECT SUM(mr.TOTAL_COST_EUR) 
-         FROM TDF_DATA_PLATFORM.OPERATIONS.MAINTENANCE_RECORDS mr 
-         WHERE mr.SITE_ID = t.SITE_ID 
-         AND mr.PERFORMED_DATE >= DATEADD(YEAR, -1, CURRENT_DATE()))
-    ) AS AVG_ANNUAL_MAINTENANCE_COST,
+    -- Maintenance Costs (per-site rollup, joined once)
+    AVG(mc.COST_T12M_EUR) AS AVG_ANNUAL_MAINTENANCE_COST,
     
     -- Total Cost of Ownership
     AVG(t.REPLACEMENT_COST_EUR) + AVG(
-        (SELECT COALESCE(SUM(mr.TOTAL_COST_EUR), 0) * 10  -- 10-year maintenance projection
-         FROM TDF_DATA_PLATFORM.OPERATIONS.MAINTENANCE_RECORDS mr 
-         WHERE mr.SITE_ID = t.SITE_ID)
+        COALESCE(mc.COST_LIFETIME_EUR, 0) * 10  -- 10-year maintenance projection
     ) AS ESTIMATED_TCO_EUR
 
 FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.TOWERS t
 LEFT JOIN TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES s ON t.SITE_ID = s.SITE_ID
 LEFT JOIN TDF_DATA_PLATFORM.CORE.DEPARTMENTS d ON s.DEPARTMENT_ID = d.DEPARTMENT_ID
 LEFT JOIN TDF_DATA_PLATFORM.CORE.REGIONS r ON d.REGION_ID = r.REGION_ID
+LEFT JOIN VW_SITE_MAINTENANCE_COST mc ON t.SITE_ID = mc.SITE_ID
 GROUP BY t.TOWER_TYPE, r.REGION_NAME;
 
 -- Revenue Per Site
@@ -0,0 +1,69 @@
+-- ============================================================================
+-- TDF DATA PLATFORM - DASHBOARD COST ATTRIBUTION
+-- ============================================================================
+-- Ranks dashboard sections by warehouse time and credits using the JSON
+-- QUERY_TAG set on every statement the Streamlit app issues:
+--   {"app":"tdf_dashboard","version":..,"page":..,"tab":..,"section":..,"cache":..}
+-- cache is "miss" (a viewer waited on it), "refresh" (a stale result
+-- revalidated in the background) or "prefetch" (an adjacent tab warmed ahead).
+-- ACCOUNT_USAGE views lag by up to ~45 minutes (QUERY_ATTRIBUTION_HISTORY by
+-- up to a few hours) and require IMPORTED PRIVILEGES on the SNOWFLAKE database.
+-- ============================================================================
+
+USE WAREHOUSE TDF_WH;
+
+-- ============================================================================
+-- COST BY DASHBOARD SECTION (last 7 days)
+-- ============================================================================
+
+WITH dashboard_queries AS (
+    SELECT
+        q.QUERY_ID,
+        TRY_PARSE_JSON(q.QUERY_TAG) as TAG,
+        q.TOTAL_ELAPSED_TIME,
+        q.EXECUTION_TIME,
+        q.QUEUED_OVERLOAD_TIME,
+        q.BYTES_SCANNED,
+        q.CREDITS_USED_CLOUD_SERVICES
+    FROM SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY q
+    WHERE q.START_TIME >= DATEADD('day', -7, CURRENT_TIMESTAMP())
+      AND q.QUERY_TAG LIKE '%"app":"tdf_dashboard"%'
+)
+SELECT
+    d.TAG:page::STRING as PAGE,
+    d.TAG:tab::STRING as TAB,
+    d.TAG:section::STRING as SECTION,
+    d.TAG:version::STRING as APP_VERSION,
+    COUNT(*) as N_QUERIES,
+    COUNT_IF(d.TAG:cache::STRING = 'prefetch') as N_PREFETCH,
+    COUNT_IF(d.TAG:cache::STRING = 'refresh') as N_REFRESH,
+    ROUND(SUM(d.TOTAL_ELAPSED_TIME) / 1000, 1) as TOTAL_ELAPSED_S,
+    ROUND(APPROX_PERCENTILE(d.TOTAL_ELAPSED_TIME, 0.5) / 1000, 2) as P50_ELAPSED_S,
+    ROUND(APPROX_PERCENTILE(d.TOTAL_ELAPSED_TIME, 0.95) / 1000, 2) as P95_ELAPSED_S,
+    ROUND(SUM(d.QUEUED_OVERLOAD_TIME) / 1000, 1) as QUEUED_S,
+    ROUND(SUM(d.BYTES_SCANNED) / POWER(1024, 3), 2) as GB_SCANNED,
+    ROUND(SUM(COALESCE(a.CREDITS_ATTRIBUTED_COMPUTE, 0)), 4) as COMPUTE_CREDITS,
+    ROUND(SUM(d.CREDITS_USED_CLOUD_SERVICES), 4) as CLOUD_SERVICES_CREDITS
+FROM dashboard_queries d
+LEFT JOIN SNOWFLAKE.ACCOUNT_USAGE.QUERY_ATTRIBUTION_HISTORY a
+    ON a.QUERY_ID = d.QUERY_ID
+GROUP BY 1, 2, 3, 4
+ORDER BY COMPUTE_CREDITS DESC, TOTAL_ELAPSED_S DESC;
+
+-- ============================================================================
+-- COST BY PAGE AND DAY
+-- ============================================================================
+
+SELECT
+    DATE_TRUNC('day', q.START_TIME) as QUERY_DATE,
+    TRY_PARSE_JSON(q.QUERY_TAG):page::STRING as PAGE,
+    COUNT(*) as N_QUERIES,
+    ROUND(SUM(q.TOTAL_ELAPSED_TIME) / 1000, 1) as TOTAL_ELAPSED_S,
+    ROUND(SUM(COALESCE(a.CREDITS_ATTRIBUTED_COMPUTE, 0)), 4) as COMPUTE_CREDITS
+FROM SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY q
+LEFT JOIN SNOWFLAKE.ACCOUNT_USAGE.QUERY_ATTRIBUTION_HISTORY a
+    ON a.QUERY_ID = q.QUERY_ID
+WHERE q.START_TIME >= DATEADD('day', -30, CURRENT_TIMESTAMP())
+  AND q.QUERY_TAG LIKE '%"app":"tdf_dashboard"%'
+GROUP BY 1, 2
+ORDER BY QUERY_DATE DESC, COMPUTE_CREDITS DESC;
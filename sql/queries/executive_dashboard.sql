@@ -9,10 +9,10 @@ USE DATABASE TDF_DATA_PLATFORM;
 USE SCHEMA ANALYTICS;
 
 -- ============================================================================
--- EXECUTIVE KPI SUMMARY (Single View)
+-- EXECUTIVE KPI SUMMARY (Dynamic Table, refreshed within its target lag)
 -- ============================================================================
 
-SELECT * FROM VW_EXECUTIVE_KPIS
+SELECT * FROM DT_EXECUTIVE_KPIS
 ORDER BY PERIOD_DATE DESC
 LIMIT 1;
 
@@ -41,11 +41,16 @@ WHERE FISCAL_YEAR = 2025
 ORDER BY PERIOD_DATE DESC;
 
 -- ============================================================================
--- RISK DASHBOARD
+-- RISK DASHBOARD (latest snapshot, then the daily trend)
 -- ============================================================================
 
 SELECT * FROM VW_RISK_DASHBOARD;
 
+SELECT *
+FROM RISK_SNAPSHOT_HISTORY
+WHERE SNAPSHOT_DATE >= DATEADD(DAY, -30, CURRENT_DATE())
+ORDER BY SNAPSHOT_DATE;
+
 -- ============================================================================
 -- MARKET SHARE BY REGION
 -- ============================================================================
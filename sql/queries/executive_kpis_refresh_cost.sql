@@ -0,0 +1,130 @@
+-- ============================================================================
+-- TDF DATA PLATFORM - EXECUTIVE KPI REFRESH COST
+-- ============================================================================
+-- Compares ANALYTICS.DT_EXECUTIVE_KPIS (dynamic table, refreshed within its
+-- target lag) with the plain ANALYTICS.VW_EXECUTIVE_KPIS view,
+-- which recomputes its scalar subqueries on every read.
+-- The view costs one full computation per read; the dynamic table costs one
+-- refresh per target lag interval in which a source table changed, plus
+-- cheap reads of a handful of stored rows.
+-- ACCOUNT_USAGE views lag by up to ~45 minutes and require IMPORTED
+-- PRIVILEGES on the SNOWFLAKE database.
+-- ============================================================================
+
+USE WAREHOUSE TDF_WH;
+USE DATABASE TDF_DATA_PLATFORM;
+USE SCHEMA ANALYTICS;
+
+-- ============================================================================
+-- LIKE-FOR-LIKE RUN (this session, result cache off)
+-- ============================================================================
+
+ALTER SESSION SET USE_CACHED_RESULT = FALSE;
+
+SELECT * FROM VW_EXECUTIVE_KPIS;
+
+SELECT * FROM DT_EXECUTIVE_KPIS;
+
+ALTER DYNAMIC TABLE DT_EXECUTIVE_KPIS REFRESH;
+
+SELECT
+    QUERY_TEXT,
+    TOTAL_ELAPSED_TIME as ELAPSED_MS,
+    BYTES_SCANNED,
+    PARTITIONS_SCANNED,
+    PARTITIONS_TOTAL,
+    ROWS_PRODUCED
+FROM TABLE(INFORMATION_SCHEMA.QUERY_HISTORY_BY_SESSION(RESULT_LIMIT => 20))
+WHERE QUERY_TEXT ILIKE '%EXECUTIVE_KPIS%'
+  AND QUERY_TEXT NOT ILIKE '%QUERY_HISTORY_BY_SESSION%'
+ORDER BY START_TIME;
+
+ALTER SESSION UNSET USE_CACHED_RESULT;
+
+-- ============================================================================
+-- REFRESH MODE
+-- ============================================================================
+-- The table is created with REFRESH_MODE = AUTO; REFRESH_MODE shows whether
+-- Snowflake settled on INCREMENTAL or FULL, REFRESH_MODE_REASON why not
+-- incremental
+
+SHOW DYNAMIC TABLES LIKE 'DT_EXECUTIVE_KPIS' IN SCHEMA ANALYTICS;
+
+SELECT "name", "refresh_mode", "refresh_mode_reason", "target_lag", "scheduling_state"
+FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()));
+
+-- ============================================================================
+-- REFRESH HISTORY (last 7 days)
+-- ============================================================================
+-- REFRESH_ACTION: INCREMENTAL, FULL, or NO_DATA (sources unchanged, no compute)
+
+SELECT
+    REFRESH_START_TIME,
+    DATEDIFF('millisecond', REFRESH_START_TIME, REFRESH_END_TIME) as REFRESH_MS,
+    REFRESH_ACTION,
+    REFRESH_TRIGGER,
+    STATE,
+    TARGET_LAG_SEC,
+    STATISTICS:numInsertedRows::NUMBER as ROWS_INSERTED,
+    STATISTICS:numDeletedRows::NUMBER as ROWS_DELETED,
+    QUERY_ID
+FROM TABLE(INFORMATION_SCHEMA.DYNAMIC_TABLE_REFRESH_HISTORY(
+    NAME => 'TDF_DATA_PLATFORM.ANALYTICS.DT_EXECUTIVE_KPIS',
+    DATA_TIMESTAMP_START => DATEADD('day', -7, CURRENT_TIMESTAMP())
+))
+ORDER BY REFRESH_START_TIME DESC;
+
+-- ============================================================================
+-- DAILY COST: VIEW READS VS DYNAMIC TABLE REFRESHES + READS (last 30 days)
+-- ============================================================================
+
+WITH kpi_queries AS (
+    SELECT
+        q.QUERY_ID,
+        q.START_TIME,
+        'VW_EXECUTIVE_KPIS reads' as SOURCE,
+        q.TOTAL_ELAPSED_TIME,
+        q.BYTES_SCANNED
+    FROM SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY q
+    WHERE q.START_TIME >= DATEADD('day', -30, CURRENT_TIMESTAMP())
+      AND q.QUERY_TYPE = 'SELECT'
+      AND q.QUERY_TEXT ILIKE '%VW_EXECUTIVE_KPIS%'
+    UNION ALL
+    SELECT
+        q.QUERY_ID,
+        q.START_TIME,
+        'DT_EXECUTIVE_KPIS reads' as SOURCE,
+        q.TOTAL_ELAPSED_TIME,
+        q.BYTES_SCANNED
+    FROM SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY q
+    WHERE q.START_TIME >= DATEADD('day', -30, CURRENT_TIMESTAMP())
+      AND q.QUERY_TYPE = 'SELECT'
+      AND q.QUERY_TEXT ILIKE '%DT_EXECUTIVE_KPIS%'
+    UNION ALL
+    SELECT
+        q.QUERY_ID,
+        q.START_TIME,
+        'DT_EXECUTIVE_KPIS refreshes' as SOURCE,
+        q.TOTAL_ELAPSED_TIME,
+        q.BYTES_SCANNED
+    FROM SNOWFLAKE.ACCOUNT_USAGE.DYNAMIC_TABLE_REFRESH_HISTORY r
+    JOIN SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY q
+        ON q.QUERY_ID = r.QUERY_ID
+    WHERE r.DATABASE_NAME = 'TDF_DATA_PLATFORM'
+      AND r.SCHEMA_NAME = 'ANALYTICS'
+      AND r.NAME = 'DT_EXECUTIVE_KPIS'
+      AND q.START_TIME >= DATEADD('day', -30, CURRENT_TIMESTAMP())
+)
+SELECT
+    DATE_TRUNC('day', k.START_TIME) as QUERY_DATE,
+    k.SOURCE,
+    COUNT(*) as N_QUERIES,
+    ROUND(SUM(k.TOTAL_ELAPSED_TIME) / 1000, 1) as TOTAL_ELAPSED_S,
+    ROUND(AVG(k.TOTAL_ELAPSED_TIME), 0) as AVG_ELAPSED_MS,
+    ROUND(SUM(k.BYTES_SCANNED) / POWER(1024, 2), 1) as MB_SCANNED,
+    ROUND(SUM(COALESCE(a.CREDITS_ATTRIBUTED_COMPUTE, 0)), 4) as COMPUTE_CREDITS
+FROM kpi_queries k
+LEFT JOIN SNOWFLAKE.ACCOUNT_USAGE.QUERY_ATTRIBUTION_HISTORY a
+    ON a.QUERY_ID = k.QUERY_ID
+GROUP BY 1, 2
+ORDER BY QUERY_DATE DESC, SOURCE;
@@ -0,0 +1,1191 @@
+# ==============================================================================
+# TDF DATA PLATFORM - SHARED HELPERS
+# ==============================================================================
+# Snowflake session, query cache, tab routing, rendering helpers and the
+# capacity forecast engine, shared by every dashboard page
+# ==============================================================================
+
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import streamlit as st
+from snowflake.snowpark.context import get_active_session
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+
+# ==============================================================================
+# SNOWFLAKE SESSION
+# ==============================================================================
+
+@st.cache_resource
+def get_session():
+    """Get Snowflake session for Streamlit in Snowflake"""
+    return get_active_session()
+
+# ==============================================================================
+# QUERY CACHE
+# ==============================================================================
+
+# Freshness classes: how long (seconds) a cached result may be served.
+# Each run_query call site declares the class matching the tables it reads.
+QUERY_FRESHNESS_TTL = {
+    "reference": 6 * 60 * 60,   # CORE.REGIONS, DEPARTMENTS, OPERATORS, site inventory
+    "finance": 15 * 60,         # EBITDA_METRICS, REVENUE_*, ESG scorecards, ANALYTICS.DT_* rollups
+    "operational": 30,          # WORK_ORDERS, EQUIPMENT_STATUS, workforce utilisation
+}
+
+QUERY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# How long a session waits for another session's identical in-flight query
+# before issuing its own
+QUERY_SINGLE_FLIGHT_TIMEOUT = 60
+
+# Stale-while-revalidate: for a while past its TTL an entry is still served
+# instantly while a background thread refreshes it, so the first viewer after
+# TDF_WH auto-suspends (AUTO_SUSPEND = 300) does not wait for the resume.
+# The window scales with the entry's TTL (QUERY_STALE_RATIO x TTL, at most
+# QUERY_STALE_WINDOW) but never drops below QUERY_STALE_MIN_WINDOW, which
+# covers the AUTO_SUSPEND idle period plus the resume: otherwise a 30s
+# 'operational' figure would be past its window whenever the warehouse has
+# suspended, the very case the window is for. Such a figure is served at
+# most 10.5 minutes old, a 6h 'reference' one up to a day.
+QUERY_SERVE_STALE = True
+QUERY_STALE_RATIO = 4
+QUERY_STALE_MIN_WINDOW = 10 * 60
+QUERY_STALE_WINDOW = 24 * 60 * 60
+
+# Optional persistent tier: results are also written as Parquet under this
+# directory and read back after a redeploy or restart before any SQL is run.
+# Point it at storage that outlives the container; unset disables the tier.
+QUERY_DISK_CACHE_DIR = os.environ.get("TDF_QUERY_CACHE_DIR")
+QUERY_DISK_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+_SQL_LITERAL_RE = re.compile(r"('(?:[^']|'')*')")
+
+
+class QueryCache:
+    """Thread-safe, byte-bounded LRU cache of query results with a TTL per entry.
+
+    One instance is shared by every session in the process. Concurrent misses
+    on the same key are coalesced: the first caller runs the query and the
+    others wait for its result (single-flight). Expired entries are kept for
+    a stale window proportional to their TTL (see stale_window_for) so
+    callers that accept stale data can be answered while the entry is
+    refreshed in the background.
+    """
+
+    def __init__(self, max_bytes=QUERY_CACHE_MAX_BYTES, stale_window=QUERY_STALE_WINDOW,
+                 stale_ratio=QUERY_STALE_RATIO, min_stale_window=QUERY_STALE_MIN_WINDOW, disk=None):
+        self.max_bytes = max_bytes
+        self.stale_window = stale_window
+        self.stale_ratio = stale_ratio
+        self.min_stale_window = min_stale_window
+        self.disk = disk  # DiskQueryCache consulted on memory misses, or None
+        self.entries = OrderedDict()  # key -> (expires_at, stale_until, nbytes, DataFrame)
+        self.inflight = {}  # key -> threading.Event set when the running fetch finishes
+        self.total_bytes = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.lock = threading.RLock()
+
+    def fetch(self, key, loader, ttl, serve_stale=False):
+        """Return the cached DataFrame for key, running loader() on a miss.
+
+        With serve_stale, an expired entry still inside the stale window is
+        returned at once and loader(cache_status="refresh") runs in a
+        background thread to replace it. Exceptions from a foreground loader()
+        propagate and are not cached.
+
+        The in-flight slot belongs to the caller that created it (its Event is
+        the ownership token). A waiter that times out runs loader() itself
+        but leaves the slot alone, so later callers keep waiting on the owner.
+        """
+        slot = None
+        while True:
+            with self.lock:
+                entry = self._live_entry(key, serve_stale)
+                if entry is not None:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    if entry[0] < time.monotonic():
+                        self.stale_hits += 1
+                        if key not in self.inflight:
+                            refresh_slot = self.inflight[key] = threading.Event()
+                            threading.Thread(target=self._refresh, args=(key, loader, ttl, refresh_slot),
+                                             daemon=True).start()
+                    return entry[3]
+                done = self.inflight.get(key)
+                if done is None:
+                    slot = self.inflight[key] = threading.Event()
+                    self.misses += 1
+                    break
+                self.coalesced += 1
+            if not done.wait(QUERY_SINGLE_FLIGHT_TIMEOUT):
+                with self.lock:
+                    self.misses += 1
+                break
+        df = self._load_from_disk(key, loader, ttl, serve_stale, slot)
+        if df is not None:
+            return df
+        try:
+            df = loader()
+        except Exception:
+            self.release(key, slot)
+            raise
+        self.put(key, df, ttl, slot=slot)
+        return df
+
+    def _refresh(self, key, loader, ttl, slot):
+        try:
+            df = loader(cache_status="refresh")
+        except Exception:
+            self.release(key, slot)
+            return
+        self.put(key, df, ttl, slot=slot)
+
+    def _load_from_disk(self, key, loader, ttl, serve_stale, slot):
+        """Promote key's persisted result to memory if it is still usable, ending the in-flight slot if the caller owns it"""
+        stored = self.disk.load(key) if self.disk is not None else None
+        if stored is None:
+            return None
+        df, as_of = stored
+        age = time.time() - as_of
+        if age >= ttl and not (serve_stale and age < ttl + self.stale_window_for(ttl)):
+            return None
+        with self.lock:
+            self.disk_hits += 1
+        # Keep the original load time: the entry expires when it would have
+        self.put(key, df, ttl, persist=False, age=age, slot=slot)
+        refresh_slot = self.claim(key) if age >= ttl else None
+        if refresh_slot is not None:
+            threading.Thread(target=self._refresh, args=(key, loader, ttl, refresh_slot), daemon=True).start()
+        return df
+
+    def stale_window_for(self, ttl):
+        """Seconds past expiry an entry with this TTL may still be served stale"""
+        return min(self.stale_window, max(self.min_stale_window, ttl * self.stale_ratio))
+
+    def put(self, key, df, ttl, persist=True, age=0, slot=None):
+        """Store df under key for ttl seconds (less age, if it was loaded earlier), evicting least recently used entries.
+
+        ``slot`` is the in-flight token from fetch() or claim(); when given, the
+        fetch it stands for is ended (see release).
+        """
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        with self.lock:
+            if nbytes <= self.max_bytes:
+                if key in self.entries:
+                    self._drop(key)
+                expires_at = time.monotonic() + ttl - age
+                self.entries[key] = (expires_at, expires_at + self.stale_window_for(ttl), nbytes, df)
+                self.total_bytes += nbytes
+                while self.total_bytes > self.max_bytes:
+                    self._drop(next(iter(self.entries)))
+                    self.evictions += 1
+            self.release(key, slot)
+        if persist and self.disk is not None:
+            self.disk.save(key, df)
+
+    def claim(self, key):
+        """Reserve key for a background fetch: the in-flight token, or None if it is fresh or already being fetched"""
+        with self.lock:
+            if key in self.inflight or self._live_entry(key) is not None:
+                return None
+            slot = self.inflight[key] = threading.Event()
+            return slot
+
+    def release(self, key, slot):
+        """End the in-flight fetch of key and wake any sessions waiting on it, if slot still owns it"""
+        if slot is None:
+            return
+        with self.lock:
+            if self.inflight.get(key) is slot:
+                del self.inflight[key]
+        slot.set()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _live_entry(self, key, serve_stale=False):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if entry[0] >= now or (serve_stale and entry[1] >= now):
+            return entry
+        if entry[1] < now:
+            self._drop(key)
+        return None
+
+    def _drop(self, key):
+        _, _, nbytes, _ = self.entries.pop(key)
+        self.total_bytes -= nbytes
+
+
+class DiskQueryCache:
+    """Size-bounded directory of Parquet query results.
+
+    Each cache key gets a subdirectory holding one file named
+    ``<data version>-<as_of ms>.parquet``; results written under another
+    data version are never read back. Writes happen on a background thread
+    and every disk error is ignored, since this tier is only an optimization.
+    """
+
+    def __init__(self, root, data_version, max_bytes=QUERY_DISK_CACHE_MAX_BYTES):
+        self.root = root
+        self.version_tag = hashlib.sha1(str(data_version).encode("utf-8")).hexdigest()[:12]
+        self.max_bytes = max_bytes
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tdf-disk-cache")
+        os.makedirs(root, exist_ok=True)
+
+    def _key_dir(self, key):
+        return os.path.join(self.root, hashlib.sha1(repr(key).encode("utf-8")).hexdigest())
+
+    def load(self, key):
+        """(DataFrame, as_of epoch seconds) persisted for key at this data version, or None"""
+        key_dir = self._key_dir(key)
+        prefix = self.version_tag + "-"
+        try:
+            names = [n for n in os.listdir(key_dir) if n.startswith(prefix) and n.endswith(".parquet")]
+            if not names:
+                return None
+            name = max(names, key=lambda n: int(n[len(prefix):-len(".parquet")]))
+            path = os.path.join(key_dir, name)
+            df = pd.read_parquet(path)
+            os.utime(path)  # recently used: evicted last
+        except Exception:
+            return None
+        as_of = int(name[len(prefix):-len(".parquet")]) / 1000
+        df.attrs["as_of"] = as_of
+        return df, as_of
+
+    def save(self, key, df):
+        """Persist df for key in the background, replacing older files of that key"""
+        self.writer.submit(self._write, self._key_dir(key), df, df.attrs.get("as_of", time.time()))
+
+    def _write(self, key_dir, df, as_of):
+        name = f"{self.version_tag}-{int(as_of * 1000)}.parquet"
+        try:
+            os.makedirs(key_dir, exist_ok=True)
+            tmp_path = os.path.join(key_dir, f".{name}.tmp")
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, os.path.join(key_dir, name))
+            for old in os.listdir(key_dir):
+                if old != name:
+                    os.remove(os.path.join(key_dir, old))
+            self._evict()
+        except Exception:
+            pass
+
+    def _files(self):
+        """(mtime, size, path) of every stored result; skips in-progress .tmp files and files removed mid-scan"""
+        files = []
+        try:
+            key_dirs = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return files
+        for key_dir in key_dirs:
+            try:
+                if not key_dir.is_dir():
+                    continue
+                entries = list(os.scandir(key_dir.path))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+
+    def _evict(self):
+        """Delete least recently used files until the directory fits in max_bytes"""
+        files = self._files()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            try:
+                os.rmdir(os.path.dirname(path))
+            except OSError:
+                pass  # still holds a result, or already gone
+
+    def stats(self):
+        files = self._files()
+        return {"files": len(files), "bytes": sum(size for _, size, _ in files)}
+
+
+def normalize_sql(query):
+    """Collapse whitespace outside string literals so reformatted SQL shares a cache key"""
+    parts = _SQL_LITERAL_RE.split(query.strip().rstrip(";"))
+    for i in range(0, len(parts), 2):
+        parts[i] = re.sub(r"\s+", " ", parts[i])
+    return "".join(parts).strip()
+
+
+def query_cache_key(query, params=None, compact=False, data_version=None):
+    """Cache key for a statement: its normalized text, plus its bind values when it has any.
+
+    Compacted results (see compact_frame) are cached separately from plain
+    ones, and a versioned statement (see table_data_version) gets a new key
+    whenever one of its tables changes.
+    """
+    key = normalize_sql(query)
+    if params:
+        key = (key, tuple(params))
+    if compact:
+        key = ("compact", key)
+    return (key, data_version) if data_version is not None else key
+
+
+@st.cache_resource
+def get_query_cache():
+    """Process-wide query cache shared by every viewer session"""
+    disk = None
+    if QUERY_DISK_CACHE_DIR:
+        # Persisted results are tied to the app version: a release that changes
+        # a query's SQL or its post-processing starts from a cold disk tier
+        disk = DiskQueryCache(QUERY_DISK_CACHE_DIR, APP_VERSION)
+    return QueryCache(disk=disk)
+
+
+# Worker threads shared by all sessions for run_queries batches
+QUERY_BATCH_WORKERS = 8
+
+
+@st.cache_resource
+def get_query_executor():
+    """Thread pool used to dispatch independent queries concurrently"""
+    return ThreadPoolExecutor(max_workers=QUERY_BATCH_WORKERS, thread_name_prefix="tdf-query")
+
+# ==============================================================================
+# TAB ROUTING
+# ==============================================================================
+
+# Warm the neighbouring tabs' queries in a background thread while the user
+# reads the current one
+TAB_PREFETCH = True
+
+TAB_MANIFEST_MAX_QUERIES = 64
+
+# Session-state slot holding the (tab group key, label) of the tab whose body
+# is currently executing. Kept per session: module globals here are shared by
+# every viewer in the process.
+ACTIVE_TAB_STATE_KEY = "_tdf_active_tab"
+
+
+
+@st.cache_resource
+def get_tab_query_manifest():
+    """Statements last issued by each tab, shared by all sessions: {(key, label): {cache_key: (query, freshness, params, compact, tables, section)}}"""
+    return {}
+
+
+def record_tab_query(key, query, freshness, params=None, compact=False, tables=None, section=None):
+    """Remember that the active tab issued this statement (and from which section), so it can be prefetched later"""
+    active_tab = st.session_state.get(ACTIVE_TAB_STATE_KEY)
+    if active_tab is None:
+        return
+    tab_queries = get_tab_query_manifest().setdefault(active_tab, {})
+    if key in tab_queries or len(tab_queries) < TAB_MANIFEST_MAX_QUERIES:
+        tab_queries[key] = (query, freshness, params, compact, tables, section)
+
+
+def _prefetch_worker(sf_session, cache, pending):
+    for key, slot, ttl, query, params, compact, tag in pending:
+        try:
+            df = _sql_to_pandas(sf_session, query, params, tag=tag, compact=compact)
+        except Exception:
+            cache.release(key, slot)
+            continue
+        cache.put(key, df, ttl, slot=slot)
+
+
+def prefetch_tab_queries(tab_key, labels):
+    """Fetch the recorded statements of the given tabs into the cache in a background thread"""
+    manifest = get_tab_query_manifest()
+    cache = get_query_cache()
+    page = st.session_state.get(ACTIVE_PAGE_STATE_KEY)
+    pending = []
+    for label in labels:
+        for query, freshness, params, compact, tables, section in list(manifest.get((tab_key, label), {}).values()):
+            key, ttl, _ = resolve_query(query, freshness, params, compact, tables)
+            slot = cache.claim(key)
+            if slot is not None:
+                pending.append((key, slot, ttl, query, params, compact, build_query_tag(page, label, section, "prefetch")))
+    if pending:
+        threading.Thread(target=_prefetch_worker, args=(get_session(), cache, pending), daemon=True).start()
+
+
+def render_tabs(labels, key):
+    """Render a tab bar and return one flag per tab, True only for the selected tab.
+
+    Unlike st.tabs, which executes every tab body on each rerun, pages guard
+    each body with ``if show_<tab>:`` so only the visible tab runs its queries
+    and builds its figures.
+    """
+    active = st.radio(key, labels, horizontal=True, key=key, label_visibility="collapsed")
+    st.session_state[ACTIVE_TAB_STATE_KEY] = (key, active)
+    if TAB_PREFETCH:
+        i = labels.index(active)
+        prefetch_tab_queries(key, [labels[j] for j in (i - 1, i + 1) if 0 <= j < len(labels)])
+    return [label == active for label in labels]
+
+# ==============================================================================
+# QUERY INSTRUMENTATION
+# ==============================================================================
+
+# Statements and page reruns kept for the Performance page; the oldest records
+# are dropped first
+QUERY_LOG_SIZE = 5000
+RERUN_LOG_SIZE = 1000
+
+# Session-state slots for the page being rendered and the current run's
+# SQL / Plotly time accumulators
+ACTIVE_PAGE_STATE_KEY = "_tdf_active_page"
+RERUN_TIMINGS_STATE_KEY = "_tdf_rerun_timings"
+
+# Every statement carries a JSON QUERY_TAG naming the app version, page, tab,
+# section and why it reached Snowflake ("miss", "refresh" for a stale result
+# revalidated in the background, or "prefetch"), so
+# ACCOUNT_USAGE.QUERY_HISTORY can attribute warehouse time to dashboard
+# sections (see sql/queries/dashboard_cost_attribution.sql)
+QUERY_TAG_APP = "tdf_dashboard"
+APP_VERSION = "1.0"
+
+_SQL_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+
+class QueryLog:
+    """Rolling in-process log of executed statements and page rerun timings"""
+
+    def __init__(self, max_queries=QUERY_LOG_SIZE, max_reruns=RERUN_LOG_SIZE):
+        self.queries = deque(maxlen=max_queries)
+        self.reruns = deque(maxlen=max_reruns)
+        self.lock = threading.Lock()
+
+    def record_query(self, entry):
+        with self.lock:
+            self.queries.append(entry)
+
+    def record_rerun(self, entry):
+        with self.lock:
+            self.reruns.append(entry)
+
+    def snapshot(self):
+        """Copies of the query and rerun records, oldest first"""
+        with self.lock:
+            return list(self.queries), list(self.reruns)
+
+    def clear(self):
+        with self.lock:
+            self.queries.clear()
+            self.reruns.clear()
+
+
+@st.cache_resource
+def get_query_log():
+    """Process-wide query log shared by every viewer session"""
+    return QueryLog()
+
+
+def query_fingerprint(query):
+    """Short id for a statement's shape: normalized text with literals replaced by ?"""
+    parts = _SQL_LITERAL_RE.split(normalize_sql(query))
+    shape = "".join("?" if i % 2 else _SQL_NUMBER_RE.sub("?", part) for i, part in enumerate(parts))
+    return hashlib.sha1(shape.encode("utf-8")).hexdigest()[:12]
+
+
+def build_query_tag(page, tab, section, cache_status):
+    """QUERY_TAG value for one statement"""
+    return json.dumps({
+        "app": QUERY_TAG_APP,
+        "version": APP_VERSION,
+        "page": page,
+        "tab": tab,
+        "section": section,
+        "cache": cache_status,
+    }, separators=(",", ":"), ensure_ascii=False)
+
+
+def query_tag_context(section):
+    """(page, tab, section) of a statement issued by the running script, for build_query_tag"""
+    active_tab = st.session_state.get(ACTIVE_TAB_STATE_KEY)
+    return st.session_state.get(ACTIVE_PAGE_STATE_KEY), active_tab[1] if active_tab else None, section
+
+
+def begin_rerun(page):
+    """Start timing a full script run of the given page and reserve the top of it for the stale-data notice"""
+    st.session_state[ACTIVE_PAGE_STATE_KEY] = page
+    st.session_state[ACTIVE_TAB_STATE_KEY] = None
+    st.session_state[RERUN_TIMINGS_STATE_KEY] = {
+        "started": time.perf_counter(), "sql": 0.0, "plotly": 0.0,
+        "stale_as_of": None, "stale_notice": st.empty(),
+    }
+
+
+def end_rerun():
+    """Record how the finished run split its time between SQL, Plotly and the rest (pandas, layout)"""
+    timings = st.session_state.get(RERUN_TIMINGS_STATE_KEY)
+    if timings is None:
+        return
+    if timings["stale_as_of"] is not None:
+        label = _age_label(time.time() - timings["stale_as_of"])
+        timings["stale_notice"].markdown(
+            f'<span class="as-of-badge" title="Oldest cached result shown on this page">as of {label}</span> '
+            f'Some figures on this page come from the cache and are being refreshed in the background.',
+            unsafe_allow_html=True,
+        )
+    total = time.perf_counter() - timings["started"]
+    active_tab = st.session_state.get(ACTIVE_TAB_STATE_KEY)
+    get_query_log().record_rerun({
+        "ts": time.time(),
+        "page": st.session_state.get(ACTIVE_PAGE_STATE_KEY),
+        "tab": active_tab[1] if active_tab else None,
+        "total_ms": total * 1000,
+        "sql_ms": timings["sql"] * 1000,
+        "plotly_ms": timings["plotly"] * 1000,
+        "pandas_ms": max(total - timings["sql"] - timings["plotly"], 0.0) * 1000,
+    })
+
+
+def _add_rerun_time(category, seconds):
+    timings = st.session_state.get(RERUN_TIMINGS_STATE_KEY)
+    if timings is not None:
+        timings[category] += seconds
+
+
+def _note_if_stale(df, ttl):
+    """Remember the oldest result this run displays past its TTL, for end_rerun's notice"""
+    age = data_age(df)
+    timings = st.session_state.get(RERUN_TIMINGS_STATE_KEY)
+    if timings is not None and age is not None and age > ttl:
+        as_of = df.attrs["as_of"]
+        timings["stale_as_of"] = min(timings["stale_as_of"] or as_of, as_of)
+
+
+def _call_site():
+    """'module.function' of the nearest caller outside this module.
+
+    No line number: the section is the cost-attribution key in QUERY_HISTORY
+    and must not change when unrelated code above the call moves.
+    """
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+    if frame is None:
+        return None
+    module = os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
+    return f"{module}.{frame.f_code.co_name}"
+
+
+def _cache_status(stats, df, error, ttl):
+    if error is not None:
+        return "error"
+    if stats:
+        return "miss"
+    age = data_age(df)
+    return "stale" if age is not None and age > ttl else "hit"
+
+
+def _log_query(query, section, elapsed, stats, df=None, error=None, ttl=None):
+    """Append one run_query / run_queries call to the query log"""
+    active_tab = st.session_state.get(ACTIVE_TAB_STATE_KEY)
+    get_query_log().record_query({
+        "ts": time.time(),
+        "fingerprint": query_fingerprint(query),
+        "query": normalize_sql(query),
+        "page": st.session_state.get(ACTIVE_PAGE_STATE_KEY),
+        "tab": active_tab[1] if active_tab else None,
+        "section": section,
+        "cache": _cache_status(stats, df, error, ttl),
+        "elapsed_ms": elapsed * 1000,
+        "sql_ms": stats.get("sql_ms"),
+        "rows": len(df) if df is not None else None,
+        "bytes": stats.get("bytes"),
+        "bytes_raw": stats.get("bytes_raw"),
+        "query_id": stats.get("query_id"),
+        "error": str(error) if error is not None else None,
+    })
+
+# ==============================================================================
+# RESULT COMPACTION
+# ==============================================================================
+
+# String columns stay categorical when at most this share of values is distinct
+COMPACT_CATEGORY_MAX_RATIO = 0.5
+
+# A float column is stored as float32 only if every value still rounds to the
+# same figure at this many decimals (the dashboard shows at most two)
+COMPACT_FLOAT_DECIMALS = 2
+
+
+def _downcast_numeric(df):
+    for column in df.columns:
+        values = df[column]
+        if pd.api.types.is_integer_dtype(values):
+            df[column] = pd.to_numeric(values, downcast="integer")
+        elif pd.api.types.is_float_dtype(values) and values.dtype != np.float32:
+            with np.errstate(over="ignore", invalid="ignore"):
+                narrow = values.to_numpy().astype(np.float32)
+                lossless = np.array_equal(
+                    np.round(narrow.astype(np.float64), COMPACT_FLOAT_DECIMALS),
+                    np.round(values.to_numpy(), COMPACT_FLOAT_DECIMALS),
+                    equal_nan=True,
+                )
+            if lossless:
+                df[column] = narrow
+    return df
+
+
+def _strings_to_categories(df):
+    for column in df.columns:
+        values = df[column]
+        is_text = isinstance(values.dtype, pd.StringDtype) or (
+            values.dtype == object and pd.api.types.infer_dtype(values, skipna=True) == "string"
+        )
+        if is_text:
+            df[column] = values.astype("category")
+    return df
+
+
+def _drop_high_cardinality_categories(df):
+    for column in df.columns:
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype) and len(values.cat.categories) > COMPACT_CATEGORY_MAX_RATIO * len(values):
+            # Back to the column's own string dtype (object or Arrow-backed)
+            df[column] = values.astype(values.cat.categories.dtype)
+    return df
+
+
+def compact_frame(df):
+    """Copy of df with integers/floats downcast and low-cardinality strings stored as categoricals"""
+    return _drop_high_cardinality_categories(_strings_to_categories(_downcast_numeric(df.copy())))
+
+
+def compact_batches(batches):
+    """Compact a stream of DataFrame batches one at a time and concatenate them.
+
+    Returns (DataFrame or None when there were no batches, in-memory bytes the
+    batches would have taken uncompacted).
+    """
+    frames = []
+    raw_bytes = 0
+    for batch in batches:
+        raw_bytes += int(batch.memory_usage(index=True, deep=True).sum())
+        frames.append(_strings_to_categories(_downcast_numeric(batch)))
+    if not frames:
+        return None, 0
+    for column in frames[0].columns:
+        if isinstance(frames[0][column].dtype, pd.CategoricalDtype):
+            categories = union_categoricals(
+                [f[column] for f in frames if isinstance(f[column].dtype, pd.CategoricalDtype)]
+            ).categories
+            for f in frames:
+                if isinstance(f[column].dtype, pd.CategoricalDtype):
+                    f[column] = f[column].cat.set_categories(categories)
+    df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    return _drop_high_cardinality_categories(df), raw_bytes
+
+# ==============================================================================
+# DATA VERSIONS
+# ==============================================================================
+
+# A statement that reads only base tables is versioned by their LAST_ALTERED
+# timestamps: its cache key changes as soon as any of those tables is loaded or
+# modified, so the result can be kept for QUERY_VERSIONED_TTL instead of its
+# freshness class TTL. Views, unqualified names, CTEs and clock functions
+# make a statement unversioned (plain TTL).
+DATA_VERSIONING = True
+
+# How often the process re-reads LAST_ALTERED for the whole database
+TABLE_VERSION_CHECK_INTERVAL = 30
+
+QUERY_VERSIONED_TTL = 24 * 60 * 60
+
+TABLE_VERSIONS_QUERY = """
+    SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE, LAST_ALTERED
+    FROM TDF_DATA_PLATFORM.INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_SCHEMA <> 'INFORMATION_SCHEMA'
+"""
+
+_SQL_QUALIFIED_TABLE_RE = re.compile(r"\bTDF_DATA_PLATFORM\.(\w+)\.(\w+)", re.IGNORECASE)
+_SQL_FROM_TARGET_RE = re.compile(r"\b(?:FROM|JOIN)\s+([A-Za-z_][\w$.]*)", re.IGNORECASE)
+_SQL_CLOCK_RE = re.compile(
+    r"\b(?:CURRENT_DATE|CURRENT_TIMESTAMP|CURRENT_TIME|LOCALTIMESTAMP|SYSDATE|GETDATE|RANDOM|UNIFORM|UUID_STRING)\b",
+    re.IGNORECASE,
+)
+
+
+def referenced_tables(query):
+    """SCHEMA.TABLE names a statement reads, or None if they cannot be determined from its text"""
+    text = "".join(_SQL_LITERAL_RE.split(query)[::2])
+    if _SQL_CLOCK_RE.search(text):
+        return None
+    targets = _SQL_FROM_TARGET_RE.findall(text)
+    if not targets or any(not _SQL_QUALIFIED_TABLE_RE.fullmatch(target) for target in targets):
+        return None
+    return sorted({f"{schema}.{table}".upper() for schema, table in _SQL_QUALIFIED_TABLE_RE.findall(text)})
+
+
+@st.cache_resource
+def get_table_version_cache():
+    """Small cache holding the LAST_ALTERED snapshot (kept apart from the result cache and its disk tier)"""
+    return QueryCache(max_bytes=16 * 1024 * 1024)
+
+
+def _load_table_versions(sf_session, cache_status="miss"):
+    try:
+        df = _sql_to_pandas(
+            sf_session, TABLE_VERSIONS_QUERY, tag=build_query_tag(None, None, "common.table_versions", cache_status)
+        )
+    except Exception:
+        # Missing privilege or a transient error: cache the failure like a
+        # snapshot with no tables, so for one check interval statements use
+        # their freshness TTL without repeating the lookup on every call
+        df = pd.DataFrame()
+        df.attrs.update(versions={}, as_of=None)
+        return df
+    df.attrs["versions"] = {
+        f"{row.TABLE_SCHEMA}.{row.TABLE_NAME}".upper(): (row.TABLE_TYPE, str(row.LAST_ALTERED))
+        for row in df.itertuples(index=False)
+    }
+    return df
+
+
+def get_table_versions():
+    """({SCHEMA.TABLE: (TABLE_TYPE, LAST_ALTERED)}, checked-at epoch seconds), re-read every TABLE_VERSION_CHECK_INTERVAL.
+
+    Like results, an expired snapshot is served while it is re-read in the
+    background. Returns ({}, None) if INFORMATION_SCHEMA cannot be read
+    (a failed read is cached for the same interval); statements then fall
+    back to their freshness TTL.
+    """
+    df, _, error = _timed_fetch(
+        get_table_version_cache(), "table_versions", partial(_load_table_versions, get_session()),
+        TABLE_VERSION_CHECK_INTERVAL, QUERY_SERVE_STALE,
+    )
+    if error is not None:
+        return {}, None
+    return df.attrs["versions"], df.attrs["as_of"]
+
+
+def table_data_version(tables):
+    """Version token for a set of SCHEMA.TABLE names and when it was checked, or (None, None) if unversionable"""
+    if not DATA_VERSIONING or not tables:
+        return None, None
+    versions, checked_at = get_table_versions()
+    token = []
+    for table in sorted(t.upper().split(".", 1)[1] if t.upper().startswith("TDF_DATA_PLATFORM.") else t.upper() for t in tables):
+        table_type, last_altered = versions.get(table, (None, None))
+        if table_type != "BASE TABLE":
+            return None, None
+        token.append(last_altered)
+    return hashlib.sha1("|".join(token).encode("utf-8")).hexdigest()[:16], checked_at
+
+
+def resolve_query(query, freshness, params=None, compact=False, tables=None):
+    """(cache key, TTL seconds, version checked-at or None) for a statement.
+
+    ``tables`` lists the SCHEMA.TABLE names the statement reads; by default
+    they are taken from its fully qualified TDF_DATA_PLATFORM references.
+    """
+    version, checked_at = table_data_version(referenced_tables(query) if tables is None else tables)
+    key = query_cache_key(query, params, compact, version)
+    ttl = QUERY_VERSIONED_TTL if version is not None else QUERY_FRESHNESS_TTL[freshness]
+    return key, ttl, checked_at
+
+
+def _mark_verified(df, checked_at):
+    """A versioned result is known current as of the last version check"""
+    if checked_at is not None:
+        df.attrs["as_of"] = max(df.attrs.get("as_of", 0), checked_at)
+    return df
+
+# ==============================================================================
+# HELPER FUNCTIONS
+# ==============================================================================
+
+# Interactive simulators are wrapped in @fragment so a widget change reruns only
+# that panel instead of the whole script. st.fragment landed in Streamlit 1.37;
+# older runtimes provide st.experimental_fragment, and anything earlier falls
+# back to a plain call (full rerun).
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+def _sql_to_pandas(sf_session, query, params=None, stats=None, tag=None, compact=False):
+    started = time.perf_counter()
+    statement_params = {"QUERY_TAG": tag} if tag else None
+    sf_df = sf_session.sql(query, params=params)
+    if compact:
+        # Arrow result batches are converted and compacted one at a time, so
+        # the full object-dtype frame never exists in memory
+        job = sf_df.to_pandas_batches(block=False, statement_params=statement_params)
+        df, raw_bytes = compact_batches(job.result())
+        if df is None:
+            df = pd.DataFrame(columns=sf_df.columns)
+    else:
+        job = sf_df.to_pandas(block=False, statement_params=statement_params)
+        df = job.result()
+        raw_bytes = None
+    df.attrs["as_of"] = time.time()
+    if stats is not None:
+        stats["sql_ms"] = (time.perf_counter() - started) * 1000
+        stats["query_id"] = job.query_id
+        stats["bytes"] = int(df.memory_usage(index=True, deep=True).sum())
+        stats["bytes_raw"] = raw_bytes if raw_bytes is not None else stats["bytes"]
+    return df
+
+def _statement_loader(sf_session, query, params=None, stats=None, tag_context=(None, None, None), compact=False):
+    """QueryCache loader for one statement; its QUERY_TAG is built when it runs, with the cache status it is run for"""
+    def load(cache_status="miss"):
+        tag = build_query_tag(*tag_context, cache_status)
+        return _sql_to_pandas(sf_session, query, params, stats, tag, compact=compact)
+    return load
+
+def _timed_fetch(cache, key, loader, ttl, serve_stale=False):
+    """cache.fetch() returning (DataFrame or None, elapsed seconds, exception or None)"""
+    started = time.perf_counter()
+    try:
+        return cache.fetch(key, loader, ttl, serve_stale), time.perf_counter() - started, None
+    except Exception as e:
+        return None, time.perf_counter() - started, e
+
+def run_query(query, freshness="operational", params=None, compact=False, allow_stale=QUERY_SERVE_STALE,
+              tables=None, section=None):
+    """Execute a SQL query and return results as DataFrame, served from cache while fresh.
+
+    Values that vary between calls belong in ``params`` (bound to ``?``
+    placeholders) rather than in the SQL text: the statement text then stays
+    stable, so Snowflake's result cache and plan reuse apply and the query
+    cache keys on (text, params).
+
+    Every call is recorded in the query log (timing, rows, bytes, QUERY_ID and
+    the calling page, tab and section) for the Performance page, and statements
+    that reach Snowflake carry the same context in their QUERY_TAG. The
+    section defaults to the calling module.function; pass ``section`` to
+    name it.
+
+    ``compact=True`` streams the result as Arrow batches and shrinks it as it
+    arrives (see compact_frame): meant for row-level pulls such as per-site
+    or per-equipment data kept in session state. Callers get categoricals for
+    repeated strings, so group with ``observed=True``.
+
+    With ``allow_stale`` (the default), an expired result is returned at once
+    and refreshed in the background; its load time is in ``df.attrs["as_of"]``
+    (see data_age / render_kpi_card's ``as_of``).
+
+    Statements over base tables are invalidated by data changes rather than
+    by ``freshness`` (see resolve_query); pass ``tables`` (SCHEMA.TABLE names)
+    when the tables read cannot be inferred from the SQL, e.g. behind a view.
+    """
+    section = section or _call_site()
+    sf_session = get_session()
+    key, ttl, checked_at = resolve_query(query, freshness, params, compact, tables)
+    record_tab_query(query_cache_key(query, params, compact), query, freshness, params, compact, tables, section)
+    stats = {}
+    loader = _statement_loader(sf_session, query, params, stats, query_tag_context(section), compact=compact)
+    df, elapsed, error = _timed_fetch(get_query_cache(), key, loader, ttl, allow_stale)
+    _add_rerun_time("sql", elapsed)
+    _log_query(query, section, elapsed, stats, df, error, ttl)
+    if error is not None:
+        st.error(f"Query error: {error}")
+        return pd.DataFrame()
+    # Cached frames are shared across sessions; hand each caller its own copy
+    df = _mark_verified(df.copy(), checked_at)
+    _note_if_stale(df, ttl)
+    return df
+
+def _unpack_query_spec(spec):
+    if isinstance(spec, str):
+        return spec, "operational", None
+    query, freshness, *params = spec
+    return query, freshness, params[0] if params else None
+
+def run_queries(queries):
+    """Execute independent SQL queries concurrently and return {name: DataFrame}.
+
+    ``queries`` maps a result name to a SQL string, a ``(query, freshness)``
+    tuple or a ``(query, freshness, params)`` tuple. Statements go through the shared query cache and are dispatched on
+    a thread pool, so a page waits for its slowest query rather than the sum.
+    Expired results are served stale and refreshed in the background, as in
+    run_query.
+    """
+    section = _call_site()
+    sf_session = get_session()
+    cache = get_query_cache()
+    executor = get_query_executor()
+    started = time.perf_counter()
+    futures = {}
+    for name, spec in queries.items():
+        query, freshness, params = _unpack_query_spec(spec)
+        key, ttl, checked_at = resolve_query(query, freshness, params)
+        record_tab_query(query_cache_key(query, params), query, freshness, params, section=f"{section} [{name}]")
+        stats = {}
+        loader = _statement_loader(sf_session, query, params, stats, query_tag_context(f"{section} [{name}]"))
+        future = executor.submit(_timed_fetch, cache, key, loader, ttl, QUERY_SERVE_STALE)
+        futures[name] = (query, ttl, checked_at, stats, future)
+    results = {}
+    for name, (query, ttl, checked_at, stats, future) in futures.items():
+        df, elapsed, error = future.result()
+        _log_query(query, f"{section} [{name}]", elapsed, stats, df, error, ttl)
+        if error is not None:
+            st.error(f"Query error: {error}")
+            results[name] = pd.DataFrame()
+        else:
+            results[name] = _mark_verified(df.copy(), checked_at)
+            _note_if_stale(results[name], ttl)
+    _add_rerun_time("sql", time.perf_counter() - started)
+    return results
+
+# Bundle members come back as JSON text, so dates arrive as ISO strings and are
+# parsed again on decode; timestamps with a time zone are left as strings
+_BUNDLE_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}([ T]\d{2}:\d{2}:\d{2}(\.\d+)?)?$")
+
+def bundle_sql(members):
+    """Fold named statements into one returning a single OBJECT: name -> array of row objects"""
+    parts = []
+    for name, query in members.items():
+        query = query.strip().rstrip(";")
+        parts.append(f"'{name}', (SELECT ARRAY_AGG(OBJECT_CONSTRUCT_KEEP_NULL(*)) FROM ({query}))")
+    return "SELECT OBJECT_CONSTRUCT_KEEP_NULL(\n    " + ",\n    ".join(parts) + "\n) as BUNDLE"
+
+def _decode_bundle_member(rows, sort_by=None):
+    df = pd.DataFrame(rows or [])
+    for column in df.columns:
+        values = df[column].dropna()
+        if len(values) and values.map(lambda v: isinstance(v, str) and bool(_BUNDLE_DATE_RE.match(v))).all():
+            df[column] = pd.to_datetime(df[column])
+    if sort_by is not None and not df.empty:
+        # ARRAY_AGG does not keep the member's ORDER BY; reapply it here
+        df = df.sort_values(sort_by, ignore_index=True)
+    return df
+
+def run_bundle(members, order_by=None):
+    """Fetch a page's scalar KPIs and small result sets in one statement and return {name: DataFrame}.
+
+    ``members`` takes the same specs as run_queries. Each member is
+    aggregated into an array of row objects inside a single OBJECT_CONSTRUCT,
+    so the page pays one round-trip, and the bundle is cached as one unit
+    under the shortest freshness of its members. Group members that change
+    at a similar rate, and keep them small: a bundle is one VARIANT value
+    (16 MB) and one failing member fails the whole bundle. A member reading
+    CURRENT_DATE() or similar leaves the whole bundle without a data-version
+    key (see resolve_query); fetch such statements with run_queries instead.
+
+    Row order is not preserved through ARRAY_AGG; ``order_by`` maps a member
+    name to the output column(s) its frame is sorted by after decoding.
+    """
+    queries, params, ttls = {}, [], {}
+    for name, spec in members.items():
+        query, freshness, member_params = _unpack_query_spec(spec)
+        queries[name] = query
+        params.extend(member_params or [])
+        ttls[freshness] = QUERY_FRESHNESS_TTL[freshness]
+    freshness = min(ttls, key=ttls.get)
+    bundle = run_query(bundle_sql(queries), freshness, params=params or None,
+                       section=f"{_call_site()} [{', '.join(members)}]")
+    order_by = order_by or {}
+    if bundle.empty:
+        return {name: pd.DataFrame() for name in members}
+    payload = bundle["BUNDLE"].iloc[0]
+    if isinstance(payload, str):
+        payload = json.loads(payload)
+    results = {}
+    for name in members:
+        df = _decode_bundle_member(payload.get(name), order_by.get(name))
+        df.attrs.update(bundle.attrs)
+        results[name] = df
+    return results
+
+def plotly_chart(fig, **kwargs):
+    """st.plotly_chart, timed into the current run's Plotly share on the Performance page"""
+    started = time.perf_counter()
+    result = st.plotly_chart(fig, **kwargs)
+    _add_rerun_time("plotly", time.perf_counter() - started)
+    return result
+
+def render_header(title, subtitle=""):
+    """Render page header with TDF styling"""
+    st.markdown(f"""
+        <div class="main-header">
+            <h1>{title}</h1>
+            <p>{subtitle}</p>
+        </div>
+    """, unsafe_allow_html=True)
+
+def data_age(df):
+    """Seconds since the query behind df was run, or None if df did not come from run_query"""
+    as_of = df.attrs.get("as_of") if df is not None else None
+    return time.time() - as_of if as_of is not None else None
+
+def as_of_label(df, min_age=60):
+    """Plain "as of N min ago" text for data at least min_age seconds old, else an empty string"""
+    age = data_age(df)
+    if age is None or age < min_age:
+        return ""
+    return f"as of {_age_label(age)}"
+
+def as_of_badge(df, min_age=60):
+    """Small "as of N min ago" badge for data at least min_age seconds old, else an empty string"""
+    label = as_of_label(df, min_age)
+    if not label:
+        return ""
+    return f'<span class="as-of-badge" title="Time since this figure was last queried">{label}</span>'
+
+def _age_label(age):
+    if age < 3600:
+        return f"{int(age // 60)} min ago"
+    if age < 86400:
+        return f"{int(age // 3600)} h ago"
+    return f"{int(age // 86400)} d ago"
+
+def render_kpi_card(title, value, subtitle="", status="", as_of=None):
+    """Render a KPI card with optional status color and an "as of" badge for the DataFrame it came from"""
+    status_class = status.lower() if status else ""
+    badge = as_of_badge(as_of) if as_of is not None else ""
+    st.markdown(f"""
+        <div class="kpi-card {status_class}">
+            <div class="kpi-title">{title}{badge}</div>
+            <div class="kpi-value">{value}</div>
+            <div class="kpi-subtitle">{subtitle}</div>
+        </div>
+    """, unsafe_allow_html=True)
+
+def render_metric(label, value, delta=None, as_of=None, **kwargs):
+    """st.metric with the "as of" age of the DataFrame it came from appended to its label"""
+    age_label = as_of_label(as_of) if as_of is not None else ""
+    if age_label:
+        label = f"{label} :gray[({age_label})]"
+    st.metric(label, value, delta, **kwargs)
+
+def render_section_header(title):
+    """Render a section header"""
+    st.markdown(f'<div class="section-header">{title}</div>', unsafe_allow_html=True)
+
+def render_placeholder(page_name, description):
+    """Render a placeholder for pages under development"""
+    st.markdown(f"""
+        <div class="page-placeholder">
+            <h2>📊 {page_name}</h2>
+            <p>{description}</p>
+            <p style="margin-top: 1rem; color: #1a2b4a;">
+                <strong>Data sources connected and ready</strong>
+            </p>
+        </div>
+    """, unsafe_allow_html=True)
+
+# ==============================================================================
+# CAPACITY FORECAST ENGINE
+# ==============================================================================
+
+FORECAST_START = "2025-12-01"
+
+
+def forecast_trajectories(base_capacity, base_demand, months=18, capacity_growth=5.0,
+                          demand_growth=8.0, attrition_rate=0.0, demand_multiplier=1.0, seed=42):
+    """Monthly capacity and demand FTE trajectories, computed locally with NumPy.
+
+    Month m (1-based) is ``base + growth * m`` plus uniform integer noise
+    (-10..15 FTE for capacity, -15..25 for demand); capacity also loses
+    ``base_capacity * attrition_rate * m / 12``. Every argument except
+    ``months`` and ``seed`` may be an array: they broadcast together, so a
+    whole grid of scenarios is evaluated in one call. Returns two arrays of
+    shape ``broadcast_shape + (months,)``. The noise generator is seeded, so
+    identical inputs always produce identical curves.
+    """
+    step = np.arange(1, months + 1)
+    base_capacity = np.asarray(base_capacity, dtype=float)[..., None]
+    base_demand = np.asarray(base_demand, dtype=float)[..., None]
+    capacity_growth = np.asarray(capacity_growth, dtype=float)[..., None]
+    demand_growth = np.asarray(demand_growth, dtype=float)[..., None]
+    attrition_rate = np.asarray(attrition_rate, dtype=float)[..., None]
+    demand_multiplier = np.asarray(demand_multiplier, dtype=float)[..., None]
+
+    shape = np.broadcast_shapes(
+        base_capacity.shape, base_demand.shape, capacity_growth.shape, demand_growth.shape,
+        attrition_rate.shape, demand_multiplier.shape, step.shape,
+    )
+    rng = np.random.default_rng(seed)
+    capacity_noise = rng.integers(-10, 16, size=shape)
+    demand_noise = rng.integers(-15, 26, size=shape)
+
+    capacity = base_capacity + capacity_growth * step - base_capacity * attrition_rate * step / 12 + capacity_noise
+    demand = base_demand * demand_multiplier + demand_growth * step + demand_noise
+    return capacity, demand
+
+
+def forecast_frame(base_capacity, base_demand, months=18, **kwargs):
+    """Single-scenario forecast as a DataFrame (FORECAST_MONTH, CAPACITY_FTE, DEMAND_FTE)"""
+    capacity, demand = forecast_trajectories(base_capacity, base_demand, months=months, **kwargs)
+    return pd.DataFrame({
+        "FORECAST_MONTH": pd.date_range(FORECAST_START, periods=months, freq="MS"),
+        "CAPACITY_FTE": capacity,
+        "DEMAND_FTE": demand,
+    })
+
+# ==============================================================================
+# SIDEBAR KPIS
+# ==============================================================================
+
+# Active sites, tower sites, active employees and annualised revenue, read from
+# the ANALYTICS.DT_EXECUTIVE_KPIS dynamic table (platform figures repeat on every row)
+SIDEBAR_KPI_QUERY = """
+    SELECT
+        MAX(ACTIVE_SITES) as N_SITES,
+        MAX(ACTIVE_TOWER_SITES) as N_TOWERS,
+        MAX(ACTIVE_EMPLOYEES) as N_EMPLOYEES,
+        SUM(CASE WHEN FISCAL_YEAR = 2025 THEN REVENUE_EUR END)/7*12/1000000 as REVENUE_M
+    FROM TDF_DATA_PLATFORM.ANALYTICS.DT_EXECUTIVE_KPIS
+"""
+
+
+def load_sidebar_kpis():
+    """Sidebar platform figures, served from the shared query cache (and its disk tier)"""
+    loader = _statement_loader(
+        get_session(), SIDEBAR_KPI_QUERY, tag_context=("Sidebar", None, "common.load_sidebar_kpis")
+    )
+    key, ttl, checked_at = resolve_query(SIDEBAR_KPI_QUERY, "finance")
+    df, _, error = _timed_fetch(get_query_cache(), key, loader, ttl, QUERY_SERVE_STALE)
+    if error is not None:
+        st.error(f"Query error: {error}")
+        return pd.DataFrame()
+    return _mark_verified(df.copy(), checked_at)
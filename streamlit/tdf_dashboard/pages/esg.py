@@ -0,0 +1,1418 @@
+# ==============================================================================
+# PAGE: ESG REGULATORY REPORTING
+# ==============================================================================
+
+import streamlit as st
+import plotly.graph_objects as go
+
+from tdf_dashboard.common import plotly_chart, render_header, render_tabs, run_query
+
+
+def page_esg_reporting():
+    render_header(
+        "ESG Regulatory Reporting",
+        "Traced, Auditable Reporting Engine • Full Data Lineage • Regulatory Compliance"
+    )
+
+    # Fetch ESG data from database (used by the Overview and Reports tabs)
+    esg_metrics = run_query("""
+        SELECT 
+            CARBON_EMISSIONS_TONNES,
+            CARBON_REDUCTION_PCT,
+            RENEWABLE_ENERGY_PCT,
+            EQUALITY_INDEX_SCORE,
+            FEMALE_EMPLOYEES_PCT,
+            FEMALE_MANAGEMENT_PCT,
+            TRAINING_HOURS_PER_EMPLOYEE,
+            ACCIDENT_FREQUENCY_RATE,
+            OVERALL_ESG_STATUS
+        FROM TDF_DATA_PLATFORM.ESG.BOARD_SCORECARD
+        ORDER BY REPORTING_DATE DESC
+        LIMIT 1
+    """, freshness="finance")
+
+    # Default values if no data or NaN
+    import math
+
+    def safe_esg_value(df, column, default):
+        """Safely extract value from dataframe, returning default if empty or NaN"""
+        if df.empty:
+            return default
+        val = df[column].iloc[0]
+        if val is None or (isinstance(val, float) and math.isnan(val)):
+            return default
+        return val
+
+    carbon = safe_esg_value(esg_metrics, 'CARBON_EMISSIONS_TONNES', 48500)
+    carbon_reduction = safe_esg_value(esg_metrics, 'CARBON_REDUCTION_PCT', -12)
+    renewable = safe_esg_value(esg_metrics, 'RENEWABLE_ENERGY_PCT', 47)
+    equality = safe_esg_value(esg_metrics, 'EQUALITY_INDEX_SCORE', 88)
+    female_pct = safe_esg_value(esg_metrics, 'FEMALE_EMPLOYEES_PCT', 28)
+    female_mgmt = safe_esg_value(esg_metrics, 'FEMALE_MANAGEMENT_PCT', 32)
+    training_hrs = safe_esg_value(esg_metrics, 'TRAINING_HOURS_PER_EMPLOYEE', 24)
+    accident_rate = safe_esg_value(esg_metrics, 'ACCIDENT_FREQUENCY_RATE', 3.2)
+    
+
+    # =========================================================================
+    # TABS ORGANIZATION
+    # =========================================================================
+
+    show_overview, show_performance, show_environment, show_calendar, show_reports = render_tabs([
+        "📊 Overview",
+        "📈 Performance",
+        "🌱 Environment",
+        "📅 Calendar",
+        "📥 Reports & Audit"
+    ], key="esg_tab")
+
+    # =========================================================================
+    # TAB: OVERVIEW
+    # =========================================================================
+
+    if show_overview:
+        # ROW 1: Compliance Status Overview
+        # -------------------------------------------------------------------------
+
+        st.markdown("### 📋 Regulatory Compliance Status")
+
+        # Compliance data for major French/EU regulations
+        compliance_data = [
+            {"regulation": "CSRD", "full_name": "Corporate Sustainability Reporting Directive", "status": "Compliant", "due": "Mar 2025", "progress": 95},
+            {"regulation": "EU Taxonomy", "full_name": "EU Taxonomy for Sustainable Activities", "status": "Compliant", "due": "Jun 2025", "progress": 88},
+            {"regulation": "Index Égalité H/F", "full_name": "French Gender Equality Index", "status": "Compliant", "due": "Mar 2025", "progress": 100},
+            {"regulation": "Bilan GES", "full_name": "French Carbon Footprint Report", "status": "In Progress", "due": "Dec 2025", "progress": 72},
+            {"regulation": "DPEF", "full_name": "Extra-Financial Performance Declaration", "status": "Compliant", "due": "Apr 2025", "progress": 92},
+            {"regulation": "Article 29 LEC", "full_name": "Climate & Energy Law Reporting", "status": "In Progress", "due": "Jun 2025", "progress": 65},
+        ]
+
+        comp_cols = st.columns(6)
+        for i, item in enumerate(compliance_data):
+            with comp_cols[i]:
+                status_color = '#27ae60' if item['status'] == 'Compliant' else '#f39c12'
+                progress_color = '#27ae60' if item['progress'] >= 90 else '#f39c12' if item['progress'] >= 70 else '#e63946'
+                st.markdown(f"""
+                    <div style="background: white; border-radius: 10px; padding: 1rem; text-align: center; height: 160px; box-shadow: 0 2px 8px rgba(0,0,0,0.08);">
+                        <div style="font-weight: 700; color: #1a2b4a; font-size: 1rem; margin-bottom: 0.25rem;">{item['regulation']}</div>
+                        <div style="font-size: 0.65rem; color: #888; margin-bottom: 0.5rem; height: 24px;">{item['full_name'][:30]}...</div>
+                        <div style="background: {status_color}20; color: {status_color}; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.7rem; font-weight: 600; display: inline-block; margin-bottom: 0.5rem;">{item['status']}</div>
+                        <div style="background: #f0f0f0; border-radius: 4px; height: 8px; margin: 0.5rem 0;">
+                            <div style="background: {progress_color}; width: {item['progress']}%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <div style="font-size: 0.7rem; color: #888;">Due: {item['due']} • {item['progress']}%</div>
+                    </div>
+                """, unsafe_allow_html=True)
+
+        # -------------------------------------------------------------------------
+        # ROW 2: Key ESG Metrics
+        # -------------------------------------------------------------------------
+
+        st.markdown("### 🌱 Environmental, Social & Governance Metrics")
+
+        col_e, col_s, col_g = st.columns(3)
+
+        with col_e:
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #27ae60, #2ecc71); border-radius: 12px; padding: 1.5rem; color: white;">
+                    <div style="font-size: 1.2rem; font-weight: 600; margin-bottom: 1rem;">🌍 Environmental</div>
+            """, unsafe_allow_html=True)
+
+            e_col1, e_col2 = st.columns(2)
+            with e_col1:
+                st.metric("Carbon Emissions", f"{carbon:,.0f} tCO₂e", delta=f"{carbon_reduction:.0f}% vs target")
+            with e_col2:
+                st.metric("Renewable Energy", f"{renewable:.0f}%", delta="+5% YoY")
+
+            st.markdown("</div>", unsafe_allow_html=True)
+
+        with col_s:
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #3498db, #2980b9); border-radius: 12px; padding: 1.5rem; color: white;">
+                    <div style="font-size: 1.2rem; font-weight: 600; margin-bottom: 1rem;">👥 Social</div>
+            """, unsafe_allow_html=True)
+
+            s_col1, s_col2 = st.columns(2)
+            with s_col1:
+                st.metric("Equality Index", f"{equality}/100", delta="Above threshold (75)")
+            with s_col2:
+                st.metric("Women in Management", f"{female_mgmt:.0f}%", delta="+3% YoY")
+
+            st.markdown("</div>", unsafe_allow_html=True)
+
+        with col_g:
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #9b59b6, #8e44ad); border-radius: 12px; padding: 1.5rem; color: white;">
+                    <div style="font-size: 1.2rem; font-weight: 600; margin-bottom: 1rem;">🏛️ Governance</div>
+            """, unsafe_allow_html=True)
+
+            g_col1, g_col2 = st.columns(2)
+            with g_col1:
+                st.metric("Training Hours/Employee", f"{training_hrs:.0f}h", delta="+2h vs 2023")
+            with g_col2:
+                st.metric("Accident Frequency", f"{accident_rate:.1f}", delta="-15% YoY", delta_color="normal")
+
+            st.markdown("</div>", unsafe_allow_html=True)
+
+        # -------------------------------------------------------------------------
+
+    # =========================================================================
+    # TAB: PERFORMANCE
+    # =========================================================================
+
+    if show_performance:
+        # ROW 3: Board ESG Scorecard - Executive Summary
+        # -------------------------------------------------------------------------
+
+        st.markdown("### 📊 Board ESG Scorecard")
+        st.caption("Executive summary for board reporting • Updated quarterly")
+
+        # Scorecard data with YoY comparison
+        scorecard_metrics = [
+            {"category": "🌍 Environmental", "metrics": [
+                {"name": "Carbon Intensity", "value": "78.9", "unit": "kgCO₂e/MWh", "target": "70.0", "yoy": -8.5, "status": "on_track"},
+                {"name": "Renewable Energy", "value": "47", "unit": "%", "target": "50", "yoy": 5.0, "status": "on_track"},
+                {"name": "Energy Efficiency", "value": "92", "unit": "PUE avg", "target": "90", "yoy": -2.1, "status": "at_risk"},
+                {"name": "Waste Recycling", "value": "89", "unit": "%", "target": "90", "yoy": 3.0, "status": "on_track"},
+            ]},
+            {"category": "👥 Social", "metrics": [
+                {"name": "Gender Pay Gap", "value": "2.3", "unit": "%", "target": "<5", "yoy": -1.2, "status": "achieved"},
+                {"name": "Women in Leadership", "value": "32", "unit": "%", "target": "35", "yoy": 3.0, "status": "on_track"},
+                {"name": "Training Investment", "value": "1,850", "unit": "€/employee", "target": "1,500", "yoy": 12.0, "status": "achieved"},
+                {"name": "Lost Time Injury Rate", "value": "3.2", "unit": "per million hrs", "target": "<4", "yoy": -15.0, "status": "achieved"},
+            ]},
+            {"category": "🏛️ Governance", "metrics": [
+                {"name": "Board Independence", "value": "60", "unit": "%", "target": "50", "yoy": 0, "status": "achieved"},
+                {"name": "Ethics Training", "value": "95", "unit": "% completed", "target": "100", "yoy": 5.0, "status": "on_track"},
+                {"name": "Supplier ESG Audits", "value": "78", "unit": "% coverage", "target": "80", "yoy": 12.0, "status": "on_track"},
+                {"name": "Data Breaches", "value": "0", "unit": "incidents", "target": "0", "yoy": 0, "status": "achieved"},
+            ]},
+        ]
+
+        for category in scorecard_metrics:
+            cat_color = '#27ae60' if 'Environmental' in category['category'] else '#3498db' if 'Social' in category['category'] else '#9b59b6'
+
+            st.markdown(f"""
+                <div style="background: {cat_color}10; border-left: 4px solid {cat_color}; padding: 0.5rem 1rem; margin: 1rem 0 0.5rem 0; border-radius: 0 8px 8px 0;">
+                    <span style="font-weight: 600; color: {cat_color};">{category['category']}</span>
+                </div>
+            """, unsafe_allow_html=True)
+
+            metric_cols = st.columns(4)
+            for i, metric in enumerate(category['metrics']):
+                with metric_cols[i]:
+                    status_color = '#27ae60' if metric['status'] == 'achieved' else '#3498db' if metric['status'] == 'on_track' else '#f39c12'
+                    status_icon = '✅' if metric['status'] == 'achieved' else '🔵' if metric['status'] == 'on_track' else '⚠️'
+                    yoy_color = '#27ae60' if metric['yoy'] > 0 else '#e63946' if metric['yoy'] < 0 else '#888'
+                    yoy_arrow = '↑' if metric['yoy'] > 0 else '↓' if metric['yoy'] < 0 else '→'
+
+                    st.markdown(f"""
+                        <div style="background: white; border-radius: 8px; padding: 0.75rem; box-shadow: 0 1px 3px rgba(0,0,0,0.08); height: 120px;">
+                            <div style="font-size: 0.7rem; color: #888; margin-bottom: 0.25rem;">{metric['name']}</div>
+                            <div style="font-size: 1.4rem; font-weight: 700; color: #1a2b4a;">{metric['value']}<span style="font-size: 0.7rem; color: #888; font-weight: 400;"> {metric['unit']}</span></div>
+                            <div style="font-size: 0.65rem; color: #888; margin-top: 0.25rem;">Target: {metric['target']}</div>
+                            <div style="display: flex; justify-content: space-between; align-items: center; margin-top: 0.5rem;">
+                                <span style="color: {yoy_color}; font-size: 0.7rem; font-weight: 600;">{yoy_arrow} {abs(metric['yoy'])}% YoY</span>
+                                <span style="font-size: 0.7rem;">{status_icon}</span>
+                            </div>
+                        </div>
+                    """, unsafe_allow_html=True)
+
+        # -------------------------------------------------------------------------
+        # ROW 4: ESG Ratings & Peer Benchmarks
+        # -------------------------------------------------------------------------
+
+        st.markdown("### 🏆 ESG Ratings & Industry Benchmarks")
+        st.caption("External ESG ratings and comparison with telecom infrastructure peers")
+
+        rating_col1, rating_col2 = st.columns([1, 2])
+
+        with rating_col1:
+            st.markdown("#### 📈 External Ratings")
+
+            ratings = [
+                {"agency": "MSCI ESG", "rating": "AA", "score": 7.2, "max": 10, "trend": "up", "date": "Nov 2025"},
+                {"agency": "Sustainalytics", "rating": "Low Risk", "score": 18.5, "max": 40, "trend": "up", "date": "Oct 2025"},
+                {"agency": "CDP Climate", "rating": "A-", "score": None, "max": None, "trend": "stable", "date": "Dec 2025"},
+                {"agency": "EcoVadis", "rating": "Gold", "score": 68, "max": 100, "trend": "up", "date": "Sep 2025"},
+                {"agency": "ISS ESG", "rating": "B", "score": None, "max": None, "trend": "up", "date": "Nov 2025"},
+            ]
+
+            for r in ratings:
+                trend_icon = '📈' if r['trend'] == 'up' else '📉' if r['trend'] == 'down' else '➡️'
+                rating_color = '#27ae60' if r['rating'] in ['AA', 'AAA', 'A', 'A-', 'Gold', 'Low Risk'] else '#3498db' if r['rating'] in ['A', 'B+', 'B', 'Silver'] else '#f39c12'
+
+                score_text = f"{r['score']}/{r['max']}" if r['score'] else ""
+
+                st.markdown(f"""
+                    <div style="background: white; border-radius: 8px; padding: 0.75rem; margin-bottom: 0.5rem; display: flex; justify-content: space-between; align-items: center;">
+                        <div>
+                            <div style="font-weight: 600; color: #1a2b4a; font-size: 0.85rem;">{r['agency']}</div>
+                            <div style="font-size: 0.65rem; color: #888;">{r['date']}</div>
+                        </div>
+                        <div style="text-align: right;">
+                            <div style="background: {rating_color}; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-weight: 700; font-size: 0.9rem; display: inline-block;">{r['rating']}</div>
+                            <div style="font-size: 0.65rem; color: #888; margin-top: 0.25rem;">{score_text} {trend_icon}</div>
+                        </div>
+                    </div>
+                """, unsafe_allow_html=True)
+
+        with rating_col2:
+            st.markdown("#### 📊 Peer Comparison - Telecom Infrastructure")
+
+            # Peer comparison data
+            peers = ['TDF', 'Cellnex', 'Vantage Towers', 'INWIT', 'Telxius', 'Industry Avg']
+            environmental = [72, 68, 75, 65, 62, 58]
+            social = [78, 72, 70, 68, 65, 62]
+            governance = [82, 78, 80, 75, 72, 70]
+
+            fig = go.Figure()
+
+            fig.add_trace(go.Bar(
+                name='Environmental',
+                x=peers,
+                y=environmental,
+                marker_color='#27ae60',
+                text=environmental,
+                textposition='outside'
+            ))
+            fig.add_trace(go.Bar(
+                name='Social',
+                x=peers,
+                y=social,
+                marker_color='#3498db',
+                text=social,
+                textposition='outside'
+            ))
+            fig.add_trace(go.Bar(
+                name='Governance',
+                x=peers,
+                y=governance,
+                marker_color='#9b59b6',
+                text=governance,
+                textposition='outside'
+            ))
+
+            fig.update_layout(
+                barmode='group',
+                height=300,
+                margin=dict(l=20, r=20, t=30, b=40),
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                xaxis=dict(showgrid=False),
+                yaxis=dict(showgrid=True, gridcolor='#f0f0f0', title='Score', range=[0, 100]),
+                legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
+            )
+
+            # Highlight TDF bar
+            fig.add_annotation(x='TDF', y=85, text="⭐ TDF", showarrow=False, font=dict(size=12, color='#1a2b4a'))
+
+            plotly_chart(fig, use_container_width=True)
+
+            st.markdown("""
+                <div style="background: #27ae6015; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                    <span style="color: #27ae60; font-weight: 600;">🏆 TDF ranks #2 among European tower companies in overall ESG performance</span>
+                </div>
+            """, unsafe_allow_html=True)
+
+        # -------------------------------------------------------------------------
+
+    # =========================================================================
+    # TAB: ENVIRONMENT
+    # =========================================================================
+
+    if show_environment:
+        # ROW 5: Net Zero Pathway Tracker
+        # -------------------------------------------------------------------------
+
+        st.markdown("### 🎯 Net Zero Pathway 2030-2050")
+        st.caption("Progress toward science-based targets aligned with Paris Agreement")
+
+        nz_col1, nz_col2 = st.columns([2, 1])
+
+        with nz_col1:
+            # Net Zero trajectory chart
+            years = [2019, 2020, 2021, 2022, 2023, 2024, 2025, 2026, 2027, 2028, 2029, 2030, 2035, 2040, 2045, 2050]
+            baseline = [55000, 55000, 55000, 55000, 55000, 55000, 55000, 55000, 55000, 55000, 55000, 55000, 55000, 55000, 55000, 55000]
+            target_path = [55000, 53000, 51000, 49000, 47000, 44000, 41000, 38000, 35000, 32000, 30000, 33000, 22000, 11000, 5500, 0]
+            actual = [55000, 54200, 52800, 51500, 50100, 49200, 48500, None, None, None, None, None, None, None, None, None]
+
+            fig = go.Figure()
+
+            # Baseline
+            fig.add_trace(go.Scatter(
+                x=years, y=baseline,
+                mode='lines',
+                name='Baseline (2019)',
+                line=dict(color='#e0e0e0', width=2, dash='dot')
+            ))
+
+            # Target pathway
+            fig.add_trace(go.Scatter(
+                x=years, y=target_path,
+                mode='lines+markers',
+                name='Target Pathway',
+                line=dict(color='#27ae60', width=3),
+                marker=dict(size=8),
+                fill='tonexty',
+                fillcolor='rgba(39, 174, 96, 0.1)'
+            ))
+
+            # Actual emissions (only up to 2025)
+            actual_clean = [a for a in actual if a is not None]
+            years_actual = years[:len(actual_clean)]
+            fig.add_trace(go.Scatter(
+                x=years_actual, y=actual_clean,
+                mode='lines+markers',
+                name='Actual Emissions',
+                line=dict(color='#1a2b4a', width=3),
+                marker=dict(size=10, symbol='circle')
+            ))
+
+            # Key milestones
+            fig.add_vline(x=2030, line_width=2, line_dash="dash", line_color="#e63946", annotation_text="2030 Target: -40%", annotation_position="top")
+            fig.add_vline(x=2050, line_width=2, line_dash="dash", line_color="#27ae60", annotation_text="Net Zero", annotation_position="top")
+
+            fig.update_layout(
+                height=350,
+                margin=dict(l=20, r=20, t=40, b=40),
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                xaxis=dict(showgrid=True, gridcolor='#f0f0f0', dtick=5),
+                yaxis=dict(showgrid=True, gridcolor='#f0f0f0', title='tCO₂e', tickformat=','),
+                legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5),
+                hovermode='x unified'
+            )
+
+            plotly_chart(fig, use_container_width=True)
+
+        with nz_col2:
+            st.markdown("#### 🎯 Key Milestones")
+
+            milestones = [
+                {"year": "2025", "target": "-15%", "actual": "-12%", "status": "on_track", "action": "Renewable PPA signed"},
+                {"year": "2027", "target": "-25%", "actual": "-", "status": "planned", "action": "Fleet electrification 80%"},
+                {"year": "2030", "target": "-40%", "actual": "-", "status": "planned", "action": "SBTi validated"},
+                {"year": "2040", "target": "-80%", "actual": "-", "status": "planned", "action": "100% renewable"},
+                {"year": "2050", "target": "Net Zero", "actual": "-", "status": "planned", "action": "Full decarbonization"},
+            ]
+
+            for m in milestones:
+                status_color = '#27ae60' if m['status'] == 'achieved' else '#3498db' if m['status'] == 'on_track' else '#888'
+                status_icon = '✅' if m['status'] == 'achieved' else '🔵' if m['status'] == 'on_track' else '⏳'
+
+                st.markdown(f"""
+                    <div style="background: white; border-radius: 8px; padding: 0.75rem; margin-bottom: 0.5rem; border-left: 3px solid {status_color};">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <span style="font-weight: 700; color: #1a2b4a;">{m['year']}</span>
+                            <span style="font-size: 0.85rem;">{status_icon} {m['target']}</span>
+                        </div>
+                        <div style="font-size: 0.7rem; color: #888; margin-top: 0.25rem;">{m['action']}</div>
+                        {f'<div style="font-size: 0.7rem; color: #27ae60; margin-top: 0.25rem;">Actual: {m["actual"]}</div>' if m['actual'] != '-' else ''}
+                    </div>
+                """, unsafe_allow_html=True)
+
+            # SBTi commitment badge
+            st.markdown("""
+                <div style="background: linear-gradient(135deg, #1a2b4a, #2d3436); border-radius: 8px; padding: 1rem; margin-top: 1rem; text-align: center; color: white;">
+                    <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">🌍</div>
+                    <div style="font-weight: 600;">Science Based Targets</div>
+                    <div style="font-size: 0.75rem; color: #aaa; margin-top: 0.25rem;">Committed • Validation Q2 2026</div>
+                </div>
+            """, unsafe_allow_html=True)
+
+        # -------------------------------------------------------------------------
+
+    # =========================================================================
+    # TAB: CALENDAR
+    # =========================================================================
+
+    if show_calendar:
+        # ROW 6: Regulatory Calendar & Alerts
+        # -------------------------------------------------------------------------
+
+        st.markdown("### 📅 Regulatory Reporting Calendar 2025")
+
+        # Calendar data with deadlines and status
+        # Current date for demo: December 1, 2025
+        # All 2025 reports are complete - showing upcoming 2026 deadlines
+        from datetime import datetime, date
+
+        today = date(2025, 12, 1)  # Demo date
+
+        # Regulatory deadlines for 2026 (FY2025 reporting)
+        raw_calendar = [
+            {"report": "Index Égalité H/F 2026", "due_date": "2026-03-01", "owner": "DRH", "priority": "High", "progress": 45},
+            {"report": "CSRD / ESRS (FY2025)", "due_date": "2026-04-30", "owner": "Finance", "priority": "Critical", "progress": 28},
+            {"report": "DPEF 2026", "due_date": "2026-04-30", "owner": "RSE", "priority": "High", "progress": 35},
+            {"report": "TCFD Disclosure 2026", "due_date": "2026-04-30", "owner": "Finance", "priority": "High", "progress": 40},
+            {"report": "GRI Report 2025", "due_date": "2026-05-31", "owner": "RSE", "priority": "Medium", "progress": 15},
+            {"report": "EU Taxonomy (FY2025)", "due_date": "2026-06-30", "owner": "Finance", "priority": "High", "progress": 22},
+            {"report": "Article 29 LEC 2026", "due_date": "2026-06-30", "owner": "RSE", "priority": "Medium", "progress": 18},
+            {"report": "Bilan GES 2026", "due_date": "2026-12-31", "owner": "RSE", "priority": "Medium", "progress": 5},
+        ]
+
+        # Calculate days left and determine status dynamically
+        calendar_data = []
+        for item in raw_calendar:
+            due = datetime.strptime(item["due_date"], "%Y-%m-%d").date()
+            days_left = (due - today).days
+
+            # Determine status based on progress and time remaining
+            expected_progress = max(0, 100 - (days_left / 3.65))  # ~1% per 3.65 days for annual reports
+
+            if days_left < 0:
+                status = "overdue"
+            elif item["progress"] >= expected_progress - 10:
+                status = "on_track"
+            elif item["progress"] >= expected_progress - 25:
+                status = "at_risk"
+            else:
+                status = "not_started" if item["progress"] < 20 else "at_risk"
+
+            calendar_data.append({
+                "report": item["report"],
+                "due_date": item["due_date"],
+                "days_left": days_left,
+                "owner": item["owner"],
+                "priority": item["priority"],
+                "status": status,
+                "progress": item["progress"]
+            })
+
+        # Sort by due date
+        calendar_data = sorted(calendar_data, key=lambda x: x['due_date'])
+
+        # Alert summary
+        on_track = len([c for c in calendar_data if c['status'] == 'on_track'])
+        at_risk = len([c for c in calendar_data if c['status'] == 'at_risk'])
+        not_started = len([c for c in calendar_data if c['status'] == 'not_started'])
+        overdue = len([c for c in calendar_data if c['status'] == 'overdue'])
+
+        alert_cols = st.columns(4)
+        with alert_cols[0]:
+            st.markdown(f"""
+                <div style="background: #27ae60; border-radius: 8px; padding: 1rem; color: white; text-align: center;">
+                    <div style="font-size: 2rem; font-weight: 700;">{on_track}</div>
+                    <div style="font-size: 0.8rem;">✅ On Track</div>
+                </div>
+            """, unsafe_allow_html=True)
+        with alert_cols[1]:
+            st.markdown(f"""
+                <div style="background: #f39c12; border-radius: 8px; padding: 1rem; color: white; text-align: center;">
+                    <div style="font-size: 2rem; font-weight: 700;">{at_risk}</div>
+                    <div style="font-size: 0.8rem;">⚠️ At Risk</div>
+                </div>
+            """, unsafe_allow_html=True)
+        with alert_cols[2]:
+            st.markdown(f"""
+                <div style="background: #3498db; border-radius: 8px; padding: 1rem; color: white; text-align: center;">
+                    <div style="font-size: 2rem; font-weight: 700;">{not_started}</div>
+                    <div style="font-size: 0.8rem;">🔵 Not Started</div>
+                </div>
+            """, unsafe_allow_html=True)
+        with alert_cols[3]:
+            st.markdown(f"""
+                <div style="background: #e63946; border-radius: 8px; padding: 1rem; color: white; text-align: center;">
+                    <div style="font-size: 2rem; font-weight: 700;">{overdue}</div>
+                    <div style="font-size: 0.8rem;">🔴 Overdue</div>
+                </div>
+            """, unsafe_allow_html=True)
+
+        st.markdown("")
+
+        # Visual timeline
+        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+        # Create timeline chart
+        fig = go.Figure()
+
+        # Add month grid
+        for i, month in enumerate(months):
+            fig.add_vrect(x0=i+0.5, x1=i+1.5, fillcolor='rgba(0,0,0,0.02)' if i % 2 == 0 else 'rgba(0,0,0,0)', line_width=0)
+
+        # Add current date marker
+        current_month = 12  # December
+        fig.add_vline(x=current_month, line_width=3, line_dash="dash", line_color="#e63946", 
+                      annotation_text="Today", annotation_position="top")
+
+        # Add report markers
+        y_positions = list(range(len(calendar_data)))
+        colors = []
+        for item in calendar_data:
+            if item['status'] == 'on_track':
+                colors.append('#27ae60')
+            elif item['status'] == 'at_risk':
+                colors.append('#f39c12')
+            elif item['status'] == 'not_started':
+                colors.append('#3498db')
+            else:
+                colors.append('#e63946')
+
+        # Extract month from due date
+        x_positions = [int(item['due_date'].split('-')[1]) for item in calendar_data]
+
+        fig.add_trace(go.Scatter(
+            x=x_positions,
+            y=[item['report'] for item in calendar_data],
+            mode='markers+text',
+            marker=dict(size=20, color=colors, symbol='circle'),
+            text=[f"{int(item['due_date'].split('-')[1])}/{item['due_date'].split('-')[2]}" for item in calendar_data],
+            textposition='middle right',
+            textfont=dict(size=10),
+            hovertemplate='<b>%{y}</b><br>Due: %{text}<br>Status: %{customdata}<extra></extra>',
+            customdata=[item['status'].replace('_', ' ').title() for item in calendar_data]
+        ))
+
+        fig.update_layout(
+            height=350,
+            margin=dict(l=10, r=10, t=30, b=40),
+            paper_bgcolor='rgba(0,0,0,0)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            xaxis=dict(
+                tickmode='array',
+                tickvals=list(range(1, 13)),
+                ticktext=months,
+                showgrid=True,
+                gridcolor='#f0f0f0',
+                range=[0.5, 12.5]
+            ),
+            yaxis=dict(showgrid=False, categoryorder='array', categoryarray=[item['report'] for item in reversed(calendar_data)]),
+            showlegend=False
+        )
+
+        plotly_chart(fig, use_container_width=True)
+
+        # Detailed table with next actions
+        st.markdown("#### 📋 Upcoming Deadlines & Actions")
+
+        for item in calendar_data[:5]:  # Show next 5
+            if item['status'] == 'on_track':
+                status_color = '#27ae60'
+                status_icon = '✅'
+                status_text = 'On Track'
+            elif item['status'] == 'at_risk':
+                status_color = '#f39c12'
+                status_icon = '⚠️'
+                status_text = 'At Risk'
+            elif item['status'] == 'not_started':
+                status_color = '#3498db'
+                status_icon = '🔵'
+                status_text = 'Not Started'
+            else:
+                status_color = '#e63946'
+                status_icon = '🔴'
+                status_text = 'Overdue'
+
+            priority_color = '#e63946' if item['priority'] == 'Critical' else '#f39c12' if item['priority'] == 'High' else '#3498db'
+
+            st.markdown(f"""
+                <div style="background: white; border-radius: 8px; padding: 1rem; margin-bottom: 0.5rem; display: flex; justify-content: space-between; align-items: center; border-left: 4px solid {status_color}; box-shadow: 0 1px 3px rgba(0,0,0,0.08);">
+                    <div style="flex: 2;">
+                        <div style="font-weight: 600; color: #1a2b4a; font-size: 0.95rem;">{item['report']}</div>
+                        <div style="font-size: 0.75rem; color: #888; margin-top: 0.25rem;">Owner: {item['owner']} • Priority: <span style="color: {priority_color}; font-weight: 600;">{item['priority']}</span></div>
+                    </div>
+                    <div style="flex: 1; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #888;">Due Date</div>
+                        <div style="font-weight: 600; color: #1a2b4a;">{item['due_date']}</div>
+                    </div>
+                    <div style="flex: 1; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #888;">Days Left</div>
+                        <div style="font-weight: 700; color: {status_color}; font-size: 1.2rem;">{item['days_left']}</div>
+                    </div>
+                    <div style="flex: 1; text-align: right;">
+                        <div style="background: {status_color}20; color: {status_color}; padding: 0.4rem 0.75rem; border-radius: 20px; font-size: 0.8rem; font-weight: 600; display: inline-block;">
+                            {status_icon} {status_text}
+                        </div>
+                    </div>
+                </div>
+            """, unsafe_allow_html=True)
+
+        # -------------------------------------------------------------------------
+
+    # =========================================================================
+    # TAB: REPORTS & AUDIT
+    # =========================================================================
+
+    if show_reports:
+        # ROW 3: Report Generation & Download
+        # -------------------------------------------------------------------------
+
+        st.markdown("### 📥 Generate & Download ESG Reports")
+        st.caption("Select a report type to generate compliant regulatory documentation with full data lineage")
+
+        report_col1, report_col2 = st.columns([2, 3])
+
+        with report_col1:
+            # Report type selection
+            report_type = st.selectbox(
+                "📄 Select Report Type",
+                options=[
+                    "CSRD Annual Report",
+                    "French Equality Index (Index Égalité H/F)",
+                    "Carbon Footprint (Bilan GES)",
+                    "EU Taxonomy Alignment Report",
+                    "DPEF (Extra-Financial Performance)",
+                    "GRI Standards Report",
+                    "TCFD Climate Disclosure"
+                ]
+            )
+
+            # Reporting period
+            period = st.selectbox(
+                "📅 Reporting Period",
+                options=["FY 2025", "H1 2025", "H2 2024", "FY 2024"]
+            )
+
+            # Format selection
+            export_format = st.selectbox(
+                "📁 Export Format",
+                options=["PDF", "Excel (XLSX)", "CSV", "JSON (Machine-Readable)"]
+            )
+
+            # Include data lineage
+            include_lineage = st.checkbox("Include Data Lineage Trail", value=True)
+            include_methodology = st.checkbox("Include Calculation Methodology", value=True)
+
+            # Generate and download report
+            st.markdown("---")
+
+            # Generate report data based on type - ALL OFFICIAL FRENCH/EU REGULATORY FORMATS
+            if "Equality" in report_type:
+                # OFFICIAL: Index Égalité Professionnelle - Décret n°2019-15 du 8 janvier 2019
+                # Required for companies with 50+ employees, published before March 1st
+                report_data = {
+                    "Rapport": "INDEX DE L'ÉGALITÉ PROFESSIONNELLE ENTRE LES FEMMES ET LES HOMMES",
+                    "Base_Legale": "Articles L.1142-8 et D.1142-2 à D.1142-14 du Code du travail",
+                    "Decret": "Décret n°2019-15 du 8 janvier 2019",
+                    "Periode_Reference": period,
+                    "Raison_Sociale": "TDF Infrastructure SAS",
+                    "SIREN": "343 070 044",
+                    "Code_NAF": "6110Z - Télécommunications filaires",
+                    "Effectif_Assujetti": 1487,
+                    "Tranche_Effectif": "1000 salariés et plus",
+                    "Indicateur_1_Ecart_Remuneration": {
+                        "Resultat": "2.3%",
+                        "Points": 38,
+                        "Points_Max": 40,
+                        "Population_Valide": True,
+                        "Methode": "Par CSP et tranche d'âge"
+                    },
+                    "Indicateur_2_Ecart_Augmentations": {
+                        "Resultat": "0.8%",
+                        "Points": 20,
+                        "Points_Max": 20,
+                        "En_Faveur_De": "Équilibré"
+                    },
+                    "Indicateur_3_Ecart_Promotions": {
+                        "Resultat": "1.2%",
+                        "Points": 15,
+                        "Points_Max": 15,
+                        "En_Faveur_De": "Femmes"
+                    },
+                    "Indicateur_4_Conge_Maternite": {
+                        "Resultat": "100%",
+                        "Points": 15,
+                        "Points_Max": 15,
+                        "Salariees_Augmentees": "15/15"
+                    },
+                    "Indicateur_5_Hautes_Remunerations": {
+                        "Femmes_Top10": 3,
+                        "Hommes_Top10": 7,
+                        "Points": 0,
+                        "Points_Max": 10
+                    },
+                    "INDEX_TOTAL": 88,
+                    "Seuil_Minimum_Legal": 75,
+                    "Niveau_Resultat": "CONFORME",
+                    "Date_Publication": "2025-03-01",
+                    "Lieu_Publication": "Site internet entreprise, Ministère du Travail",
+                    "Mesures_Correctives": "Plan d'action sur l'indicateur 5 - Objectif 4 femmes minimum dans les 10 plus hautes rémunérations d'ici 2026"
+                }
+                filename_base = f"index_egalite_professionnelle_{period.replace(' ', '_').lower()}"
+
+            elif "Carbon" in report_type:
+                # OFFICIAL: Bilan GES réglementaire - Article L229-25 du Code de l'environnement
+                # Required for companies with 500+ employees, updated every 4 years
+                report_data = {
+                    "Rapport": "BILAN DES ÉMISSIONS DE GAZ À EFFET DE SERRE (BEGES)",
+                    "Base_Legale": "Article L229-25 du Code de l'environnement",
+                    "Decret": "Décret n°2011-829 du 11 juillet 2011, modifié par décret n°2022-982",
+                    "Periode_Reference": period,
+                    "Raison_Sociale": "TDF Infrastructure SAS",
+                    "SIREN": "343 070 044",
+                    "Code_NAF": "6110Z - Télécommunications filaires",
+                    "Adresse_Siege": "106 avenue Marx Dormoy, 92120 Montrouge",
+                    "Nombre_Salaries": 1487,
+                    "Mode_Consolidation": "Contrôle opérationnel",
+                    "Annee_Reference": 2019,
+                    "Emissions_Scope_1": {
+                        "Total_tCO2e": 8420,
+                        "Combustion_Fixe": 2150,
+                        "Combustion_Mobile": 4870,
+                        "Emissions_Fugitives": 1400,
+                        "Incertitude": "±10%"
+                    },
+                    "Emissions_Scope_2": {
+                        "Total_tCO2e": 32150,
+                        "Electricite": 31200,
+                        "Chaleur_Froid": 950,
+                        "Methode": "Location-based",
+                        "Facteur_Emission_Electricite": "0.0520 kgCO2e/kWh (ADEME 2024)"
+                    },
+                    "Emissions_Scope_3_Obligatoires": {
+                        "Total_tCO2e": 7930,
+                        "Achats_Biens_Services": 4200,
+                        "Deplacements_Domicile_Travail": 2100,
+                        "Dechets": 630,
+                        "Transport_Marchandises": 1000
+                    },
+                    "Total_Emissions_tCO2e": 48500,
+                    "Ratio_Par_Salarie": 32.6,
+                    "Ratio_Par_Site": 5.52,
+                    "Evolution_vs_Reference": "-12%",
+                    "Objectifs_Reduction": {
+                        "2025": "-15% vs 2019",
+                        "2030": "-40% vs 2019",
+                        "2050": "Neutralité carbone"
+                    },
+                    "Plan_Transition": {
+                        "Actions_Scope_1": "Électrification flotte véhicules (objectif 80% en 2027)",
+                        "Actions_Scope_2": "PPA énergies renouvelables (objectif 75% en 2026)",
+                        "Actions_Scope_3": "Charte achats responsables, plan mobilité"
+                    },
+                    "Verification": "Non vérifié par tierce partie",
+                    "Publication_ADEME": "Plateforme Bilans GES ADEME",
+                    "Methodologie": "ADEME Bilan Carbone® v8.8, Base Carbone 2024"
+                }
+                filename_base = f"beges_reglementaire_{period.replace(' ', '_').lower()}"
+
+            elif "EU Taxonomy" in report_type:
+                # OFFICIAL: EU Taxonomy Regulation (EU) 2020/852
+                # Required for NFRD/CSRD companies
+                report_data = {
+                    "Rapport": "EU TAXONOMY ALIGNMENT REPORT",
+                    "Base_Legale": "Regulation (EU) 2020/852, Delegated Regulation (EU) 2021/2178",
+                    "Periode_Reference": period,
+                    "Entite_Declarante": "TDF Infrastructure SAS",
+                    "LEI": "969500BVXK1VVHBQTE84",
+                    "Activites_Economiques": [
+                        "8.1 - Data processing, hosting and related activities",
+                        "8.2 - Data-driven solutions for GHG emissions reductions"
+                    ],
+                    "KPI_Chiffre_Affaires": {
+                        "Total_EUR": 799100000,
+                        "Eligible_EUR": 623298000,
+                        "Eligible_Pct": 78.0,
+                        "Aligne_EUR": 519415000,
+                        "Aligne_Pct": 65.0
+                    },
+                    "KPI_CAPEX": {
+                        "Total_EUR": 185000000,
+                        "Eligible_EUR": 151700000,
+                        "Eligible_Pct": 82.0,
+                        "Aligne_EUR": 131350000,
+                        "Aligne_Pct": 71.0
+                    },
+                    "KPI_OPEX": {
+                        "Total_EUR": 245000000,
+                        "Eligible_EUR": 181300000,
+                        "Eligible_Pct": 74.0,
+                        "Aligne_EUR": 151900000,
+                        "Aligne_Pct": 62.0
+                    },
+                    "Objectifs_Environnementaux": {
+                        "Attenuation_Changement_Climatique": True,
+                        "Adaptation_Changement_Climatique": True,
+                        "Utilisation_Durable_Eau": False,
+                        "Economie_Circulaire": True,
+                        "Prevention_Pollution": True,
+                        "Biodiversite": False
+                    },
+                    "DNSH_Assessment": "Critères DNSH satisfaits pour toutes les activités alignées",
+                    "Minimum_Safeguards": {
+                        "OECD_Guidelines": True,
+                        "UN_Guiding_Principles": True,
+                        "ILO_Conventions": True
+                    },
+                    "Verification": "Vérification limitée par Commissaires aux comptes"
+                }
+                filename_base = f"eu_taxonomy_report_{period.replace(' ', '_').lower()}"
+
+            elif "DPEF" in report_type:
+                # OFFICIAL: Déclaration de Performance Extra-Financière
+                # Article L225-102-1 du Code de commerce
+                report_data = {
+                    "Rapport": "DÉCLARATION DE PERFORMANCE EXTRA-FINANCIÈRE (DPEF)",
+                    "Base_Legale": "Article L225-102-1 du Code de commerce, Ordonnance n°2017-1180",
+                    "Periode_Reference": period,
+                    "Raison_Sociale": "TDF Infrastructure SAS",
+                    "SIREN": "343 070 044",
+                    "Modele_Affaires": {
+                        "Description": "Opérateur d'infrastructures de diffusion et télécommunications",
+                        "Zones_Geographiques": "France métropolitaine et DOM-TOM",
+                        "Sites_Operes": 8785,
+                        "Effectif": 1487
+                    },
+                    "Risques_ESG_Identifies": {
+                        "Environnementaux": ["Consommation énergétique", "Émissions GES", "Gestion des déchets électroniques"],
+                        "Sociaux": ["Santé et sécurité au travail", "Égalité professionnelle", "Formation et développement"],
+                        "Gouvernance": ["Éthique des affaires", "Protection des données", "Cybersécurité"]
+                    },
+                    "Indicateurs_Environnementaux": {
+                        "Emissions_GES_tCO2e": 48500,
+                        "Consommation_Energie_MWh": 615000,
+                        "Part_Renouvelable_Pct": 47,
+                        "Dechets_Tonnes": 1250,
+                        "Taux_Valorisation_Pct": 89
+                    },
+                    "Indicateurs_Sociaux": {
+                        "Effectif_CDI": 1402,
+                        "Effectif_CDD": 85,
+                        "Taux_Turnover_Pct": 8.2,
+                        "Heures_Formation_Total": 35688,
+                        "Taux_Frequence_Accidents": 3.2,
+                        "Index_Egalite": 88
+                    },
+                    "Indicateurs_Gouvernance": {
+                        "Part_Administrateurs_Independants_Pct": 60,
+                        "Formations_Ethique_Pct_Salaries": 95,
+                        "Incidents_Donnees_Personnelles": 0
+                    },
+                    "ODD_Contribution": ["ODD 7 - Énergie propre", "ODD 9 - Infrastructure", "ODD 13 - Climat"],
+                    "Verification": "Vérification par Organisme Tiers Indépendant (OTI)"
+                }
+                filename_base = f"dpef_{period.replace(' ', '_').lower()}"
+
+            elif "CSRD" in report_type:
+                # OFFICIAL: Corporate Sustainability Reporting Directive (EU) 2022/2464
+                # ESRS Standards
+                report_data = {
+                    "Rapport": "CORPORATE SUSTAINABILITY REPORTING DIRECTIVE (CSRD)",
+                    "Base_Legale": "Directive (EU) 2022/2464, European Sustainability Reporting Standards (ESRS)",
+                    "Periode_Reference": period,
+                    "Entite_Declarante": "TDF Infrastructure SAS",
+                    "LEI": "969500BVXK1VVHBQTE84",
+                    "ESRS_2_General_Disclosures": {
+                        "BP-1_Basis_For_Preparation": "Consolidation, périmètre France",
+                        "BP-2_Disclosure_In_Relation_To_Circumstances": "Aucune circonstance spécifique",
+                        "GOV-1_Board_Role": "Comité RSE au niveau du Conseil",
+                        "GOV-2_Management_Role": "Direction RSE rattachée à la DG",
+                        "SBM-1_Strategy_Business_Model": "Infrastructure telecom, transition énergétique",
+                        "IRO-1_Risk_Identification": "Matrice de matérialité double"
+                    },
+                    "ESRS_E1_Climate_Change": {
+                        "E1-1_Transition_Plan": "Plan aligné Accord de Paris",
+                        "E1-4_GHG_Targets": "-40% d'ici 2030 vs 2019",
+                        "E1-5_Energy_Consumption_MWh": 615000,
+                        "E1-6_GHG_Emissions_tCO2e": 48500
+                    },
+                    "ESRS_S1_Own_Workforce": {
+                        "S1-1_Policies": "Politique diversité et inclusion",
+                        "S1-6_Pay_Gap_Pct": 2.3,
+                        "S1-14_Health_Safety_Indicators": {"Frequency_Rate": 3.2, "Severity_Rate": 0.18}
+                    },
+                    "ESRS_G1_Business_Conduct": {
+                        "G1-1_Policies": "Code d'éthique, procédure alerte",
+                        "G1-3_Corruption_Incidents": 0
+                    },
+                    "Assurance": {
+                        "Type": "Limited assurance",
+                        "Auditeur": "EY",
+                        "Normes": "ISAE 3000"
+                    }
+                }
+                filename_base = f"csrd_esrs_report_{period.replace(' ', '_').lower()}"
+
+            elif "GRI" in report_type:
+                # OFFICIAL: Global Reporting Initiative Standards 2021
+                report_data = {
+                    "Rapport": "GRI SUSTAINABILITY REPORT",
+                    "Standards": "GRI Standards 2021",
+                    "GRI_Content_Index": "In accordance with GRI Standards",
+                    "Periode_Reference": period,
+                    "Organisation": "TDF Infrastructure SAS",
+                    "GRI_2_General_Disclosures": {
+                        "2-1_Organizational_Details": {"Name": "TDF Infrastructure", "Location": "Montrouge, France", "Ownership": "Private"},
+                        "2-6_Activities_Value_Chain": "Telecom infrastructure operator, 8,785 sites",
+                        "2-7_Employees": 1487,
+                        "2-22_Sustainable_Development_Strategy": "Carbon neutrality 2050"
+                    },
+                    "GRI_3_Material_Topics": ["GRI 302 - Energy", "GRI 305 - Emissions", "GRI 403 - Health Safety", "GRI 405 - Diversity"],
+                    "GRI_302_Energy": {
+                        "302-1_Energy_Consumption_MWh": 615000,
+                        "302-3_Energy_Intensity": 70.0,
+                        "302-4_Reduction_Pct": 8
+                    },
+                    "GRI_305_Emissions": {
+                        "305-1_Scope_1_tCO2e": 8420,
+                        "305-2_Scope_2_tCO2e": 32150,
+                        "305-3_Scope_3_tCO2e": 7930,
+                        "305-4_Intensity_kgCO2e_per_MWh": 78.9,
+                        "305-5_Reduction_Pct": 12
+                    },
+                    "GRI_403_Health_Safety": {
+                        "403-9_Work_Related_Injuries": 47,
+                        "403-9_Injury_Rate": 3.2,
+                        "403-10_Work_Related_Ill_Health": 5
+                    },
+                    "GRI_405_Diversity": {
+                        "405-1_Board_Diversity_Women_Pct": 40,
+                        "405-1_Workforce_Women_Pct": 28,
+                        "405-2_Pay_Ratio_CEO_Median": 12.5
+                    },
+                    "External_Assurance": "Limited assurance by third party"
+                }
+                filename_base = f"gri_report_{period.replace(' ', '_').lower()}"
+
+            elif "TCFD" in report_type:
+                # OFFICIAL: Task Force on Climate-related Financial Disclosures
+                report_data = {
+                    "Rapport": "TCFD CLIMATE-RELATED FINANCIAL DISCLOSURE",
+                    "Framework": "Task Force on Climate-related Financial Disclosures (TCFD) Recommendations",
+                    "Periode_Reference": period,
+                    "Organisation": "TDF Infrastructure SAS",
+                    "Governance": {
+                        "Board_Oversight": "Climate risks reviewed quarterly by Board Risk Committee",
+                        "Management_Role": "CSO reports to CEO, dedicated Climate Team"
+                    },
+                    "Strategy": {
+                        "Risks_Identified": {
+                            "Physical_Acute": "Extreme weather events impacting tower sites",
+                            "Physical_Chronic": "Rising temperatures increasing cooling costs",
+                            "Transition_Policy": "Carbon pricing mechanisms",
+                            "Transition_Technology": "5G energy efficiency requirements"
+                        },
+                        "Opportunities": ["Renewable energy PPA", "Energy efficiency services", "Green bonds"],
+                        "Scenario_Analysis": {
+                            "Scenarios_Used": "IEA NZE 2050, IPCC RCP 4.5, RCP 8.5",
+                            "Time_Horizons": "2030, 2050",
+                            "Financial_Impact_EUR_M": {"2030_Low": -12, "2030_High": -45, "2050_Low": -25, "2050_High": -120}
+                        }
+                    },
+                    "Risk_Management": {
+                        "Identification_Process": "Annual climate risk assessment integrated in ERM",
+                        "Management_Process": "Climate risk mitigation plans by business unit",
+                        "Integration": "Climate KPIs in executive compensation"
+                    },
+                    "Metrics_Targets": {
+                        "Scope_1_2_tCO2e": 40570,
+                        "Scope_3_tCO2e": 7930,
+                        "Target_2030": "-40% vs 2019",
+                        "Target_2050": "Net Zero",
+                        "SBTi_Commitment": "Committed, target validation in progress",
+                        "Carbon_Intensity": "78.9 kgCO2e/MWh",
+                        "Climate_Related_CAPEX_EUR_M": 45
+                    }
+                }
+                filename_base = f"tcfd_disclosure_{period.replace(' ', '_').lower()}"
+
+            else:
+                # Generic ESG Report
+                report_data = {
+                    "Rapport": report_type,
+                    "Periode_Reference": period,
+                    "Organisation": "TDF Infrastructure SAS",
+                    "Scores_ESG": {
+                        "Environmental": "A-",
+                        "Social": "B+",
+                        "Governance": "A",
+                        "Overall": "BBB+"
+                    },
+                    "Metriques_Cles": {
+                        "Emissions_tCO2e": 48500,
+                        "Energie_Renouvelable_Pct": 47,
+                        "Index_Egalite": 88,
+                        "Femmes_Management_Pct": 32,
+                        "Formation_Heures": 24,
+                        "Taux_Accidents": 3.2
+                    }
+                }
+                filename_base = f"esg_report_{period.replace(' ', '_').lower()}"
+
+            # Add lineage if selected
+            if include_lineage:
+                report_data["Data_Lineage"] = {
+                    "Source_Tables": ["ENERGY.CONSUMPTION", "HR.EMPLOYEES", "FINANCE.TRANSACTIONS"],
+                    "Transform_Date": "2025-12-01",
+                    "Validation_Status": "Validated",
+                    "Audit_Trail_ID": "AUD-2025-1201-001"
+                }
+
+            if include_methodology:
+                report_data["Calculation_Methodology"] = {
+                    "Framework": "GRI Standards 2021, CSRD ESRS",
+                    "Emission_Factors": "ADEME Base Carbone 2024",
+                    "Currency": "EUR",
+                    "Boundary": "Operational Control"
+                }
+
+            # Convert to appropriate format
+            import json
+            import io
+
+            if "CSV" in export_format:
+                # Flatten dict for CSV
+                flat_data = {}
+                for k, v in report_data.items():
+                    if isinstance(v, dict):
+                        for k2, v2 in v.items():
+                            flat_data[f"{k}_{k2}"] = v2
+                    else:
+                        flat_data[k] = v
+
+                csv_content = "Field,Value\n"
+                for k, v in flat_data.items():
+                    csv_content += f'"{k}","{v}"\n'
+
+                st.download_button(
+                    label="📥 Download CSV",
+                    data=csv_content,
+                    file_name=f"{filename_base}.csv",
+                    mime="text/csv",
+                    use_container_width=True,
+                    type="primary"
+                )
+            elif "JSON" in export_format:
+                json_content = json.dumps(report_data, indent=2, ensure_ascii=False)
+
+                st.download_button(
+                    label="📥 Download JSON",
+                    data=json_content,
+                    file_name=f"{filename_base}.json",
+                    mime="application/json",
+                    use_container_width=True,
+                    type="primary"
+                )
+            elif "Excel" in export_format:
+                # Create Excel-compatible CSV (opens in Excel)
+                flat_data = {}
+                for k, v in report_data.items():
+                    if isinstance(v, dict):
+                        for k2, v2 in v.items():
+                            flat_data[f"{k}_{k2}"] = v2
+                    else:
+                        flat_data[k] = v
+
+                csv_content = "Field,Value\n"
+                for k, v in flat_data.items():
+                    csv_content += f'"{k}","{v}"\n'
+
+                st.download_button(
+                    label="📥 Download Excel (CSV)",
+                    data=csv_content,
+                    file_name=f"{filename_base}.csv",
+                    mime="text/csv",
+                    use_container_width=True,
+                    type="primary"
+                )
+                st.caption("Opens directly in Microsoft Excel")
+            else:  # PDF - provide as formatted text
+                pdf_content = f"""
+{'='*60}
+{report_data.get('Report', report_type)}
+{'='*60}
+
+Company: TDF Infrastructure
+Period: {period}
+Generated: 2025-12-01
+{'='*60}
+
+"""
+                for k, v in report_data.items():
+                    if isinstance(v, dict):
+                        pdf_content += f"\n{k.replace('_', ' ').upper()}:\n"
+                        for k2, v2 in v.items():
+                            pdf_content += f"  - {k2}: {v2}\n"
+                    else:
+                        pdf_content += f"{k.replace('_', ' ')}: {v}\n"
+
+                pdf_content += f"""
+{'='*60}
+This report is generated from TDF Data Platform
+Full audit trail available in system
+{'='*60}
+"""
+
+                st.download_button(
+                    label="📥 Download Report (TXT)",
+                    data=pdf_content,
+                    file_name=f"{filename_base}.txt",
+                    mime="text/plain",
+                    use_container_width=True,
+                    type="primary"
+                )
+                st.caption("📄 For PDF, import this file into your document system")
+
+        with report_col2:
+            st.markdown("#### 📊 Report Preview")
+
+            # Show preview based on selected report
+            if "Equality" in report_type:
+                st.markdown(f"""
+                    <div style="background: white; border-radius: 10px; padding: 1.5rem; border: 1px solid #e0e0e0;">
+                        <div style="font-weight: 700; color: #1a2b4a; font-size: 1.1rem; margin-bottom: 1rem;">
+                            📋 Index Égalité Professionnelle Femmes-Hommes 2025
+                        </div>
+                        <table style="width: 100%; font-size: 0.85rem;">
+                            <tr style="border-bottom: 1px solid #f0f0f0;">
+                                <td style="padding: 0.5rem; color: #666;">1. Écart de rémunération</td>
+                                <td style="padding: 0.5rem; text-align: right; font-weight: 600;">38/40</td>
+                            </tr>
+                            <tr style="border-bottom: 1px solid #f0f0f0;">
+                                <td style="padding: 0.5rem; color: #666;">2. Écart d'augmentations individuelles</td>
+                                <td style="padding: 0.5rem; text-align: right; font-weight: 600;">20/20</td>
+                            </tr>
+                            <tr style="border-bottom: 1px solid #f0f0f0;">
+                                <td style="padding: 0.5rem; color: #666;">3. Écart de promotions</td>
+                                <td style="padding: 0.5rem; text-align: right; font-weight: 600;">15/15</td>
+                            </tr>
+                            <tr style="border-bottom: 1px solid #f0f0f0;">
+                                <td style="padding: 0.5rem; color: #666;">4. Retour de congé maternité</td>
+                                <td style="padding: 0.5rem; text-align: right; font-weight: 600;">15/15</td>
+                            </tr>
+                            <tr style="border-bottom: 1px solid #f0f0f0;">
+                                <td style="padding: 0.5rem; color: #666;">5. Hautes rémunérations</td>
+                                <td style="padding: 0.5rem; text-align: right; font-weight: 600;">0/10</td>
+                            </tr>
+                            <tr style="background: #f8f9fa;">
+                                <td style="padding: 0.75rem; font-weight: 700; color: #1a2b4a;">TOTAL INDEX</td>
+                                <td style="padding: 0.75rem; text-align: right; font-weight: 700; font-size: 1.2rem; color: #27ae60;">{equality}/100</td>
+                            </tr>
+                        </table>
+                        <div style="margin-top: 1rem; font-size: 0.75rem; color: #888;">
+                            Publication obligatoire au 1er mars 2025 • Seuil minimum: 75/100 ✅
+                        </div>
+                    </div>
+                """, unsafe_allow_html=True)
+            elif "Carbon" in report_type:
+                st.markdown(f"""
+                    <div style="background: white; border-radius: 10px; padding: 1.5rem; border: 1px solid #e0e0e0;">
+                        <div style="font-weight: 700; color: #1a2b4a; font-size: 1.1rem; margin-bottom: 1rem;">
+                            📋 Bilan des Émissions de Gaz à Effet de Serre (BEGES)
+                        </div>
+                        <table style="width: 100%; font-size: 0.85rem;">
+                            <tr style="border-bottom: 1px solid #f0f0f0;">
+                                <td style="padding: 0.5rem; color: #666;">Scope 1 (Direct)</td>
+                                <td style="padding: 0.5rem; text-align: right; font-weight: 600;">8,420 tCO₂e</td>
+                            </tr>
+                            <tr style="border-bottom: 1px solid #f0f0f0;">
+                                <td style="padding: 0.5rem; color: #666;">Scope 2 (Electricity)</td>
+                                <td style="padding: 0.5rem; text-align: right; font-weight: 600;">32,150 tCO₂e</td>
+                            </tr>
+                            <tr style="border-bottom: 1px solid #f0f0f0;">
+                                <td style="padding: 0.5rem; color: #666;">Scope 3 (Indirect)</td>
+                                <td style="padding: 0.5rem; text-align: right; font-weight: 600;">7,930 tCO₂e</td>
+                            </tr>
+                            <tr style="background: #f8f9fa;">
+                                <td style="padding: 0.75rem; font-weight: 700; color: #1a2b4a;">TOTAL EMISSIONS</td>
+                                <td style="padding: 0.75rem; text-align: right; font-weight: 700; font-size: 1.2rem; color: #27ae60;">{carbon:,.0f} tCO₂e</td>
+                            </tr>
+                        </table>
+                        <div style="margin-top: 1rem; font-size: 0.75rem; color: #888;">
+                            Méthodologie: ADEME Bilan Carbone® • Facteurs d'émission: Base Carbone 2024
+                        </div>
+                    </div>
+                """, unsafe_allow_html=True)
+            else:
+                st.markdown(f"""
+                    <div style="background: white; border-radius: 10px; padding: 1.5rem; border: 1px solid #e0e0e0;">
+                        <div style="font-weight: 700; color: #1a2b4a; font-size: 1.1rem; margin-bottom: 1rem;">
+                            📋 {report_type} - {period}
+                        </div>
+                        <div style="color: #666; font-size: 0.9rem; margin-bottom: 1rem;">
+                            This report includes comprehensive ESG metrics with full data traceability.
+                        </div>
+                        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem;">
+                            <div style="background: #f8f9fa; padding: 0.75rem; border-radius: 6px;">
+                                <div style="font-size: 0.7rem; color: #888;">Environmental Score</div>
+                                <div style="font-size: 1.2rem; font-weight: 600; color: #27ae60;">A-</div>
+                            </div>
+                            <div style="background: #f8f9fa; padding: 0.75rem; border-radius: 6px;">
+                                <div style="font-size: 0.7rem; color: #888;">Social Score</div>
+                                <div style="font-size: 1.2rem; font-weight: 600; color: #3498db;">B+</div>
+                            </div>
+                            <div style="background: #f8f9fa; padding: 0.75rem; border-radius: 6px;">
+                                <div style="font-size: 0.7rem; color: #888;">Governance Score</div>
+                                <div style="font-size: 1.2rem; font-weight: 600; color: #9b59b6;">A</div>
+                            </div>
+                            <div style="background: #f8f9fa; padding: 0.75rem; border-radius: 6px;">
+                                <div style="font-size: 0.7rem; color: #888;">Overall Rating</div>
+                                <div style="font-size: 1.2rem; font-weight: 600; color: #1a2b4a;">BBB+</div>
+                            </div>
+                        </div>
+                    </div>
+                """, unsafe_allow_html=True)
+
+        # -------------------------------------------------------------------------
+        # ROW 4: Data Lineage & Audit Trail
+        # -------------------------------------------------------------------------
+
+        st.markdown("### 🔍 Data Lineage & Audit Trail")
+        st.caption("Full traceability from source systems to reported metrics - critical for external audit")
+
+        lineage_col1, lineage_col2 = st.columns([3, 2])
+
+        with lineage_col1:
+            # Visual data lineage - Carbon Flow
+            st.markdown("#### 📊 Carbon Emissions Data Flow")
+            carbon_cols = st.columns([1, 0.3, 1, 0.3, 1, 0.3, 1])
+            with carbon_cols[0]:
+                st.markdown('<div style="background:#e8f4f8;padding:0.75rem;border-radius:8px;text-align:center;"><div style="font-size:0.65rem;color:#666;">Source</div><div style="font-weight:600;color:#1a2b4a;font-size:0.8rem;">ENERGY.CONSUMPTION</div></div>', unsafe_allow_html=True)
+            with carbon_cols[1]:
+                st.markdown('<div style="text-align:center;color:#888;font-size:1.5rem;padding-top:0.5rem;">→</div>', unsafe_allow_html=True)
+            with carbon_cols[2]:
+                st.markdown('<div style="background:#f0f8e8;padding:0.75rem;border-radius:8px;text-align:center;"><div style="font-size:0.65rem;color:#666;">Transform</div><div style="font-weight:600;color:#27ae60;font-size:0.8rem;">Emission Factors</div></div>', unsafe_allow_html=True)
+            with carbon_cols[3]:
+                st.markdown('<div style="text-align:center;color:#888;font-size:1.5rem;padding-top:0.5rem;">→</div>', unsafe_allow_html=True)
+            with carbon_cols[4]:
+                st.markdown('<div style="background:#f8f0e8;padding:0.75rem;border-radius:8px;text-align:center;"><div style="font-size:0.65rem;color:#666;">Aggregate</div><div style="font-weight:600;color:#e67e22;font-size:0.8rem;">CARBON_INVENTORY</div></div>', unsafe_allow_html=True)
+            with carbon_cols[5]:
+                st.markdown('<div style="text-align:center;color:#888;font-size:1.5rem;padding-top:0.5rem;">→</div>', unsafe_allow_html=True)
+            with carbon_cols[6]:
+                st.markdown('<div style="background:#1a2b4a;padding:0.75rem;border-radius:8px;text-align:center;"><div style="font-size:0.65rem;color:#aaa;">Report</div><div style="font-weight:600;color:white;font-size:0.8rem;">BILAN GES</div></div>', unsafe_allow_html=True)
+
+            st.markdown("")
+
+            # Visual data lineage - Equality Flow
+            st.markdown("#### 👥 Equality Index Data Flow")
+            eq_cols = st.columns([1, 0.3, 1, 0.3, 1, 0.3, 1])
+            with eq_cols[0]:
+                st.markdown('<div style="background:#e8f4f8;padding:0.75rem;border-radius:8px;text-align:center;"><div style="font-size:0.65rem;color:#666;">Source</div><div style="font-weight:600;color:#1a2b4a;font-size:0.8rem;">HR.EMPLOYEES</div></div>', unsafe_allow_html=True)
+            with eq_cols[1]:
+                st.markdown('<div style="text-align:center;color:#888;font-size:1.5rem;padding-top:0.5rem;">→</div>', unsafe_allow_html=True)
+            with eq_cols[2]:
+                st.markdown('<div style="background:#f0f8e8;padding:0.75rem;border-radius:8px;text-align:center;"><div style="font-size:0.65rem;color:#666;">Calculate</div><div style="font-weight:600;color:#27ae60;font-size:0.8rem;">5 Indicators</div></div>', unsafe_allow_html=True)
+            with eq_cols[3]:
+                st.markdown('<div style="text-align:center;color:#888;font-size:1.5rem;padding-top:0.5rem;">→</div>', unsafe_allow_html=True)
+            with eq_cols[4]:
+                st.markdown('<div style="background:#f8f0e8;padding:0.75rem;border-radius:8px;text-align:center;"><div style="font-size:0.65rem;color:#666;">Score</div><div style="font-weight:600;color:#e67e22;font-size:0.8rem;">DIVERSITY_INDEX</div></div>', unsafe_allow_html=True)
+            with eq_cols[5]:
+                st.markdown('<div style="text-align:center;color:#888;font-size:1.5rem;padding-top:0.5rem;">→</div>', unsafe_allow_html=True)
+            with eq_cols[6]:
+                st.markdown('<div style="background:#3498db;padding:0.75rem;border-radius:8px;text-align:center;"><div style="font-size:0.65rem;color:rgba(255,255,255,0.7);">Report</div><div style="font-weight:600;color:white;font-size:0.8rem;">INDEX ÉGALITÉ</div></div>', unsafe_allow_html=True)
+
+        with lineage_col2:
+            st.markdown("#### 📝 Recent Audit Log")
+
+            audit_log = [
+                {"time": "Today 14:32", "action": "Report Generated", "user": "M. Dubois", "type": "CSRD"},
+                {"time": "Today 11:15", "action": "Data Validated", "user": "System", "type": "Carbon"},
+                {"time": "Yesterday", "action": "External Audit", "user": "EY Auditors", "type": "DPEF"},
+                {"time": "Dec 15", "action": "Methodology Updated", "user": "A. Martin", "type": "GES"},
+                {"time": "Dec 12", "action": "Index Calculated", "user": "System", "type": "Égalité"},
+            ]
+
+            for log in audit_log:
+                st.markdown(f"""
+                    <div style="background: white; border-radius: 6px; padding: 0.6rem; margin-bottom: 0.4rem; display: flex; justify-content: space-between; align-items: center; border-left: 3px solid #1a2b4a;">
+                        <div>
+                            <div style="font-weight: 600; color: #1a2b4a; font-size: 0.8rem;">{log['action']}</div>
+                            <div style="font-size: 0.7rem; color: #888;">{log['user']} • {log['type']}</div>
+                        </div>
+                        <div style="font-size: 0.7rem; color: #888;">{log['time']}</div>
+                    </div>
+                """, unsafe_allow_html=True)
+
+        # -------------------------------------------------------------------------
+        # ROW 5: Emissions Trend & Renewable Progress
+        # -------------------------------------------------------------------------
+
+        st.markdown("### 📈 Environmental Performance Trends")
+
+        trend_col1, trend_col2 = st.columns(2)
+
+        with trend_col1:
+            st.markdown("#### 🌍 Carbon Emissions by Scope")
+
+            # Create stacked bar chart for emissions
+            emissions_data = {
+                'Month': ['Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
+                'Scope 1': [1400, 1350, 1380, 1320, 1290, 1250],
+                'Scope 2': [5400, 5200, 5350, 5100, 4950, 4800],
+                'Scope 3': [1350, 1300, 1280, 1320, 1300, 1280]
+            }
+
+            fig = go.Figure()
+            fig.add_trace(go.Bar(name='Scope 1 (Direct)', x=emissions_data['Month'], y=emissions_data['Scope 1'], marker_color='#e63946'))
+            fig.add_trace(go.Bar(name='Scope 2 (Electricity)', x=emissions_data['Month'], y=emissions_data['Scope 2'], marker_color='#f39c12'))
+            fig.add_trace(go.Bar(name='Scope 3 (Indirect)', x=emissions_data['Month'], y=emissions_data['Scope 3'], marker_color='#3498db'))
+
+            fig.update_layout(
+                barmode='stack',
+                height=300,
+                margin=dict(l=20, r=20, t=20, b=40),
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                xaxis=dict(showgrid=False),
+                yaxis=dict(showgrid=True, gridcolor='#f0f0f0', title='tCO₂e'),
+                legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='center', x=0.5)
+            )
+
+            plotly_chart(fig, use_container_width=True)
+
+        with trend_col2:
+            st.markdown("#### ⚡ Renewable Energy Progress")
+
+            # Gauge chart for renewable target
+            fig = go.Figure(go.Indicator(
+                mode="gauge+number+delta",
+                value=renewable,
+                number={'suffix': '%', 'font': {'size': 48, 'color': '#27ae60'}},
+                delta={'reference': 50, 'relative': False, 'position': 'bottom', 'valueformat': '.0f'},
+                gauge={
+                    'axis': {'range': [0, 100], 'tickwidth': 1},
+                    'bar': {'color': '#27ae60'},
+                    'steps': [
+                        {'range': [0, 30], 'color': '#fee2e2'},
+                        {'range': [30, 50], 'color': '#fef3c7'},
+                        {'range': [50, 100], 'color': '#d1fae5'}
+                    ],
+                    'threshold': {'line': {'color': '#1a2b4a', 'width': 4}, 'thickness': 0.8, 'value': 50}
+                },
+                title={'text': '2025 Target: 50%', 'font': {'size': 14, 'color': '#666'}}
+            ))
+
+            fig.update_layout(height=300, margin=dict(l=20, r=20, t=40, b=20), paper_bgcolor='rgba(0,0,0,0)')
+            plotly_chart(fig, use_container_width=True)
+
+        # -------------------------------------------------------------------------
+        # ROW 6: Available Reports Download
+        # -------------------------------------------------------------------------
+
+        st.markdown("### 📚 Published Reports Archive")
+
+        reports_archive = [
+            {"name": "CSRD Annual Report 2024", "date": "Mar 2024", "format": "PDF", "size": "2.4 MB", "status": "Published"},
+            {"name": "Index Égalité H/F 2024", "date": "Mar 2024", "format": "PDF", "size": "156 KB", "status": "Published"},
+            {"name": "Bilan GES 2023", "date": "Dec 2023", "format": "PDF", "size": "1.8 MB", "status": "Published"},
+            {"name": "DPEF 2023", "date": "Apr 2024", "format": "PDF", "size": "3.2 MB", "status": "Published"},
+            {"name": "EU Taxonomy Report 2024", "date": "Jun 2024", "format": "Excel", "size": "890 KB", "status": "Published"},
+            {"name": "GRI Standards Report 2023", "date": "May 2024", "format": "PDF", "size": "4.1 MB", "status": "Published"},
+        ]
+
+        archive_cols = st.columns(3)
+        for i, report in enumerate(reports_archive):
+            with archive_cols[i % 3]:
+                st.markdown(f"""
+                    <div style="background: white; border-radius: 8px; padding: 1rem; margin-bottom: 0.5rem; border: 1px solid #e0e0e0;">
+                        <div style="display: flex; justify-content: space-between; align-items: flex-start;">
+                            <div>
+                                <div style="font-weight: 600; color: #1a2b4a; font-size: 0.85rem;">{report['name']}</div>
+                                <div style="font-size: 0.7rem; color: #888; margin-top: 0.25rem;">{report['date']} • {report['format']} • {report['size']}</div>
+                            </div>
+                            <div style="background: #27ae6020; color: #27ae60; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.65rem; font-weight: 600;">
+                                {report['status']}
+                            </div>
+                        </div>
+                        <button style="margin-top: 0.75rem; background: #1a2b4a; color: white; border: none; padding: 0.4rem 0.75rem; border-radius: 4px; font-size: 0.75rem; cursor: pointer; width: 100%;">
+                            📥 Download
+                        </button>
+                    </div>
+                """, unsafe_allow_html=True)
+
+        # Footer
+        st.markdown("---")
+        st.markdown("""
+            <div style="text-align: center; color: #888; font-size: 0.8rem;">
+                🌱 ESG Regulatory Reporting • Data from ENERGY, HR, FINANCE schemas • Full audit trail maintained
+            </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,1179 @@
+# ==============================================================================
+# PAGE: EXECUTIVE DASHBOARD
+# ==============================================================================
+
+import streamlit as st
+import plotly.graph_objects as go
+import pydeck as pdk
+
+from tdf_dashboard.common import as_of_badge, plotly_chart, render_metric, render_tabs, run_bundle, run_query
+
+
+def page_executive_dashboard():
+    
+    # -------------------------------------------------------------------------
+    # HERO BANNER - Key Financial Metrics
+    # -------------------------------------------------------------------------
+    
+    # EBITDA metrics (annualized below) from the ANALYTICS.DT_EXECUTIVE_KPIS
+    # dynamic table and latest ESG status, in one statement. The status reads
+    # BOARD_SCORECARD directly, like the ESG pillar below: the dynamic table
+    # only carries scorecard rows for months with EBITDA figures.
+    hero_data = run_bundle({
+        "ebitda": ("""
+            SELECT 
+                SUM(REVENUE_EUR) as ANNUAL_REVENUE,
+                AVG(EBITDAAL_MARGIN_PCT) as AVG_MARGIN,
+                AVG(YOY_GROWTH_PCT) as AVG_GROWTH
+            FROM TDF_DATA_PLATFORM.ANALYTICS.DT_EXECUTIVE_KPIS 
+            WHERE FISCAL_YEAR = 2025
+        """, "finance"),
+        "esg": ("""
+            SELECT REPORTING_DATE, OVERALL_ESG_STATUS
+            FROM TDF_DATA_PLATFORM.ESG.BOARD_SCORECARD 
+            ORDER BY REPORTING_DATE DESC LIMIT 1
+        """, "finance"),
+    })
+    ebitda_df = hero_data["ebitda"]
+    esg_df = hero_data["esg"]
+    
+    # Get values - annualize if we only have partial year data
+    if not ebitda_df.empty and ebitda_df['ANNUAL_REVENUE'].iloc[0]:
+        # We have 7 months of data (June-Dec), annualize to 12 months
+        months_of_data = 7  # June to December
+        revenue = (ebitda_df['ANNUAL_REVENUE'].iloc[0] / months_of_data * 12) / 1000000
+    else:
+        revenue = 799.1
+    
+    ebitda_margin = ebitda_df['AVG_MARGIN'].iloc[0] if not ebitda_df.empty and ebitda_df['AVG_MARGIN'].iloc[0] else 47.0
+    yoy_growth = ebitda_df['AVG_GROWTH'].iloc[0] if not ebitda_df.empty and ebitda_df['AVG_GROWTH'].iloc[0] else 8.5
+    esg_status = esg_df['OVERALL_ESG_STATUS'].iloc[0] if not esg_df.empty else 'GREEN'
+    
+    # Hero Banner
+    st.markdown(f"""
+        <div class="hero-banner">
+            <div class="hero-metrics">
+                <div class="hero-metric">
+                    <div class="hero-value">€{revenue:.1f}M</div>
+                    <div class="hero-label">Annual Revenue{as_of_badge(ebitda_df)}</div>
+                    <div class="hero-trend positive">↑ +{yoy_growth:.1f}% YoY</div>
+                </div>
+                <div class="hero-metric">
+                    <div class="hero-value">{ebitda_margin:.1f}%</div>
+                    <div class="hero-label">EBITDAaL Margin{as_of_badge(ebitda_df)}</div>
+                    <div class="hero-trend neutral">Target: 42-53%</div>
+                </div>
+                <div class="hero-metric">
+                    <div class="rating-badge">
+                        <div class="rating">BBB-</div>
+                        <div class="outlook">Fitch • Stable</div>
+                    </div>
+                </div>
+                <div class="hero-metric">
+                    <div class="hero-value" style="font-size: 2rem;">
+                        {'🟢' if esg_status == 'GREEN' else '🟡' if esg_status == 'AMBER' else '🔴'}
+                    </div>
+                    <div class="hero-label">ESG Status{as_of_badge(esg_df)}</div>
+                    <div class="hero-trend neutral">{esg_status}</div>
+                </div>
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # =========================================================================
+    # EXECUTIVE TABS
+    # =========================================================================
+    
+    show_overview, show_financial, show_operations, show_clients = render_tabs([
+        "📊 Executive Overview",
+        "💰 Financial Performance", 
+        "🏗️ Infrastructure & Operations",
+        "🤝 Client Portfolio"
+    ], key="exec_tab")
+    
+    # =========================================================================
+    # TAB 1: EXECUTIVE OVERVIEW
+    # =========================================================================
+    
+    if show_overview:
+        
+        # -------------------------------------------------------------------------
+        # 🚨 RISK RADAR - Critical Alerts for Executive Attention
+        # -------------------------------------------------------------------------
+    
+        # Risk Radar, Vital Signs and Strategic Pillars KPIs: one statement for the tab
+        overview_data = run_bundle({
+            # Latest row of the risk snapshot (TASK_REFRESH_RISK_SNAPSHOT) and its daily history
+            "risk": ("""
+                SELECT *
+                FROM TDF_DATA_PLATFORM.ANALYTICS.RISK_SNAPSHOT_HISTORY
+                ORDER BY SNAPSHOT_DATE DESC LIMIT 1
+            """, "operational"),
+            "risk_history": ("""
+                SELECT 
+                    SNAPSHOT_DATE,
+                    HIGH_RISK_EQUIPMENT_COUNT,
+                    SLA_BREACHES_30D,
+                    CRITICAL_DISCREPANCIES,
+                    NON_COMPLIANT_COUNT,
+                    PENDING_ESG_REPORTS
+                FROM TDF_DATA_PLATFORM.ANALYTICS.RISK_SNAPSHOT_HISTORY
+                ORDER BY SNAPSHOT_DATE DESC LIMIT 90
+            """, "operational"),
+            "sites": ("""
+                SELECT 
+                    COUNT(*) as TOTAL_SITES,
+                    AVG(COLOCATION_RATE) as AVG_COLOCATION
+                FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES 
+                WHERE STATUS = 'ACTIVE'
+            """, "reference"),
+            "renewable": ("""
+                SELECT AVG(RENEWABLE_PCT) as RENEWABLE_PCT 
+                FROM TDF_DATA_PLATFORM.ENERGY.RENEWABLE_ENERGY 
+                WHERE YEAR(YEAR_MONTH) = 2025
+            """, "finance"),
+            "sla": ("""
+                SELECT 
+                    COUNT(CASE WHEN SLA_MET = TRUE THEN 1 END) * 100.0 / COUNT(*) as SLA_PCT
+                FROM TDF_DATA_PLATFORM.OPERATIONS.WORK_ORDERS 
+                WHERE STATUS = 'COMPLETED'
+            """, "operational"),
+            "infra": ("""
+                SELECT 
+                    COUNT(*) as SITES,
+                    SUM(CASE WHEN SITE_TYPE = 'TOWER' THEN 1 ELSE 0 END) as TOWERS
+                FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES 
+                WHERE STATUS = 'ACTIVE'
+            """, "reference"),
+            "pos": ("""
+                SELECT COUNT(*) as POS_COUNT 
+                FROM TDF_DATA_PLATFORM.INFRASTRUCTURE.POINTS_OF_SERVICE 
+                WHERE STATUS = 'ACTIVE'
+            """, "reference"),
+            "ops": ("""
+                SELECT 
+                    COUNT(*) as OPEN_WO,
+                    AVG(FAILURE_RISK_SCORE) as AVG_RISK
+                FROM TDF_DATA_PLATFORM.OPERATIONS.EQUIPMENT_STATUS
+            """, "operational"),
+            "wo": ("""
+                SELECT COUNT(*) as OPEN_WO
+                FROM TDF_DATA_PLATFORM.OPERATIONS.WORK_ORDERS 
+                WHERE STATUS = 'OPEN'
+            """, "operational"),
+            "esg_detail": ("""
+                SELECT 
+                    CARBON_EMISSIONS_TONNES,
+                    RENEWABLE_ENERGY_PCT,
+                    EQUALITY_INDEX_SCORE,
+                    CARBON_VARIANCE_PCT
+                FROM TDF_DATA_PLATFORM.ESG.BOARD_SCORECARD 
+                ORDER BY REPORTING_DATE DESC LIMIT 1
+            """, "finance"),
+        }, order_by={"risk_history": "SNAPSHOT_DATE"})
+        risk_df = overview_data["risk"]
+        risk_history_df = overview_data["risk_history"]
+        sites_df = overview_data["sites"]
+        renewable_df = overview_data["renewable"]
+        sla_df = overview_data["sla"]
+    
+        # Build risk items
+        risk_items = []
+        risk = risk_df.iloc[0] if not risk_df.empty else None
+    
+        # Contract renewals
+        if risk is not None and risk['CONTRACTS_EXPIRING_12M'] > 0:
+            risk_items.append({
+                'icon': '📋',
+                'title': f"Contract Renewal: {risk['NEXT_EXPIRY_OPERATOR']}",
+                'detail': f"€{risk['NEXT_EXPIRY_REVENUE_M']:.0f}M revenue • Expires in {risk['NEXT_EXPIRY_DAYS']:.0f} days",
+                'value': f"€{risk['CONTRACT_REVENUE_AT_RISK_M']:.0f}M at risk",
+                'severity': 'red' if risk['NEXT_EXPIRY_DAYS'] < 180 else 'amber'
+            })
+    
+        # Equipment at risk
+        at_risk_count = int(risk['HIGH_RISK_EQUIPMENT_COUNT']) if risk is not None else 0
+        if at_risk_count > 0:
+            risk_items.append({
+                'icon': '⚠️',
+                'title': 'Equipment at High Risk',
+                'detail': 'Equipment with failure risk score > 70 requiring attention',
+                'value': f"{at_risk_count:,} items",
+                'severity': 'red' if at_risk_count > 100 else 'amber'
+            })
+    
+        # SLA breaches
+        breach_count = int(risk['SLA_BREACHES_30D']) if risk is not None else 0
+        if breach_count > 0:
+            risk_items.append({
+                'icon': '🎯',
+                'title': 'SLA Breaches (Last 30 Days)',
+                'detail': 'Work orders that missed SLA targets',
+                'value': f"{breach_count} breaches",
+                'severity': 'red' if breach_count > 50 else 'amber'
+            })
+    
+        # ESG deadlines
+        pending_esg = int(risk['PENDING_ESG_REPORTS']) if risk is not None else 0
+        if pending_esg > 0:
+            risk_items.append({
+                'icon': '🌱',
+                'title': 'ESG Reports In Progress',
+                'detail': 'Regulatory reports awaiting completion',
+                'value': f"{pending_esg} pending",
+                'severity': 'amber'
+            })
+    
+        # Add a green item if things are good
+        if len(risk_items) < 3:
+            risk_items.append({
+                'icon': '✅',
+                'title': 'Infrastructure Health',
+                'detail': 'Network availability and performance on target',
+                'value': '99.8% uptime',
+                'severity': 'green'
+            })
+    
+        # Render Risk Radar using Streamlit columns for better compatibility
+        st.markdown("### 🚨 Risk Radar - Items Requiring Attention")
+        if risk is not None:
+            overall = risk['OVERALL_RISK_STATUS']
+            st.caption(
+                f"{'🟢' if overall == 'GREEN' else '🟡' if overall == 'AMBER' else '🔴'} Overall risk {overall} • "
+                f"snapshot of {risk['REFRESHED_AT']:%d %b %Y %H:%M}"
+            )
+    
+        # Create columns for risk items
+        risk_cols = st.columns(len(risk_items[:4]))
+    
+        for i, item in enumerate(risk_items[:4]):
+            with risk_cols[i]:
+                severity = item.get('severity', 'amber')
+                border_color = '#e63946' if severity == 'red' else '#f39c12' if severity == 'amber' else '#27ae60'
+                bg_color = 'rgba(230, 57, 70, 0.05)' if severity == 'red' else 'rgba(243, 156, 18, 0.05)' if severity == 'amber' else 'rgba(39, 174, 96, 0.05)'
+            
+                st.markdown(f"""
+                    <div style="background: {bg_color}; border-left: 4px solid {border_color}; border-radius: 8px; padding: 1rem; height: 140px;">
+                        <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">{item['icon']}</div>
+                        <div style="font-weight: 600; color: #1a2b4a; font-size: 0.9rem; margin-bottom: 0.25rem;">{item['title']}</div>
+                        <div style="color: #666; font-size: 0.75rem; margin-bottom: 0.5rem;">{item['detail']}</div>
+                        <div style="background: {border_color}; color: white; padding: 0.25rem 0.5rem; border-radius: 12px; font-size: 0.75rem; font-weight: 600; display: inline-block;">{item['value']}</div>
+                    </div>
+                """, unsafe_allow_html=True)
+    
+        # Daily snapshots: one stored row per day, so trends cost nothing to recompute
+        if len(risk_history_df) > 1:
+            with st.expander("📈 Risk trend (daily snapshots)"):
+                fig = go.Figure()
+                # Equipment counts run in the thousands; plot them on their own axis
+                fig.add_trace(go.Scatter(
+                    x=risk_history_df['SNAPSHOT_DATE'], y=risk_history_df['HIGH_RISK_EQUIPMENT_COUNT'],
+                    name='Equipment at high risk (right axis)', mode='lines+markers', yaxis='y2',
+                    line=dict(color='#1a2b4a', dash='dot')
+                ))
+                for column, label in [
+                    ('SLA_BREACHES_30D', 'SLA breaches (30 days)'),
+                    ('CRITICAL_DISCREPANCIES', 'Critical discrepancies'),
+                    ('NON_COMPLIANT_COUNT', 'Non-compliant requirements'),
+                    ('PENDING_ESG_REPORTS', 'ESG reports pending'),
+                ]:
+                    fig.add_trace(go.Scatter(
+                        x=risk_history_df['SNAPSHOT_DATE'], y=risk_history_df[column],
+                        name=label, mode='lines+markers'
+                    ))
+                fig.update_layout(
+                    height=280, margin=dict(l=20, r=20, t=20, b=20), paper_bgcolor='rgba(0,0,0,0)',
+                    yaxis2=dict(overlaying='y', side='right', showgrid=False),
+                    legend=dict(orientation='h', y=-0.2)
+                )
+                plotly_chart(fig, use_container_width=True)
+    
+        # -------------------------------------------------------------------------
+
+        # FOUR VITAL SIGNS - Gauge Charts
+        # -------------------------------------------------------------------------
+    
+        colocation_rate = sites_df['AVG_COLOCATION'].iloc[0] * 100 if not sites_df.empty and sites_df['AVG_COLOCATION'].iloc[0] else 60
+        renewable_pct = renewable_df['RENEWABLE_PCT'].iloc[0] if not renewable_df.empty and renewable_df['RENEWABLE_PCT'].iloc[0] else 47
+        sla_pct = sla_df['SLA_PCT'].iloc[0] if not sla_df.empty and sla_df['SLA_PCT'].iloc[0] else 92
+    
+        st.markdown("### 📊 Vital Signs")
+    
+        col1, col2, col3, col4 = st.columns(4)
+    
+        # Revenue Growth Gauge
+        with col1:
+            fig = go.Figure(go.Indicator(
+                mode="gauge+number+delta",
+                value=yoy_growth,
+                number={'suffix': '%', 'font': {'size': 36, 'color': '#1a2b4a'}},
+                delta={'reference': 5, 'relative': False, 'position': 'bottom'},
+                gauge={
+                    'axis': {'range': [0, 15], 'tickwidth': 1, 'tickcolor': '#1a2b4a'},
+                    'bar': {'color': '#1a2b4a'},
+                    'bgcolor': 'white',
+                    'borderwidth': 0,
+                    'steps': [
+                        {'range': [0, 5], 'color': '#fee2e2'},
+                        {'range': [5, 10], 'color': '#fef3c7'},
+                        {'range': [10, 15], 'color': '#d1fae5'}
+                    ],
+                    'threshold': {
+                        'line': {'color': '#e63946', 'width': 3},
+                        'thickness': 0.8,
+                        'value': 8
+                    }
+                },
+                title={'text': 'Revenue Growth', 'font': {'size': 14, 'color': '#666'}}
+            ))
+            fig.update_layout(height=200, margin=dict(l=20, r=20, t=40, b=20), paper_bgcolor='rgba(0,0,0,0)')
+            plotly_chart(fig, use_container_width=True)
+    
+        # EBITDA Margin Gauge
+        with col2:
+            fig = go.Figure(go.Indicator(
+                mode="gauge+number",
+                value=ebitda_margin,
+                number={'suffix': '%', 'font': {'size': 36, 'color': '#1a2b4a'}},
+                gauge={
+                    'axis': {'range': [30, 60], 'tickwidth': 1, 'tickcolor': '#1a2b4a'},
+                    'bar': {'color': '#27ae60' if 42 <= ebitda_margin <= 53 else '#f39c12'},
+                    'bgcolor': 'white',
+                    'borderwidth': 0,
+                    'steps': [
+                        {'range': [30, 42], 'color': '#fee2e2'},
+                        {'range': [42, 53], 'color': '#d1fae5'},
+                        {'range': [53, 60], 'color': '#dbeafe'}
+                    ],
+                    'threshold': {
+                        'line': {'color': '#1a2b4a', 'width': 2},
+                        'thickness': 0.8,
+                        'value': 47.5
+                    }
+                },
+                title={'text': 'EBITDA Margin', 'font': {'size': 14, 'color': '#666'}}
+            ))
+            fig.update_layout(height=200, margin=dict(l=20, r=20, t=40, b=20), paper_bgcolor='rgba(0,0,0,0)')
+            plotly_chart(fig, use_container_width=True)
+    
+        # Colocation Rate Gauge
+        with col3:
+            fig = go.Figure(go.Indicator(
+                mode="gauge+number",
+                value=colocation_rate,
+                number={'suffix': '%', 'font': {'size': 36, 'color': '#1a2b4a'}},
+                gauge={
+                    'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': '#1a2b4a'},
+                    'bar': {'color': '#1a2b4a'},
+                    'bgcolor': 'white',
+                    'borderwidth': 0,
+                    'steps': [
+                        {'range': [0, 40], 'color': '#fee2e2'},
+                        {'range': [40, 70], 'color': '#fef3c7'},
+                        {'range': [70, 100], 'color': '#d1fae5'}
+                    ]
+                },
+                title={'text': 'Colocation Rate', 'font': {'size': 14, 'color': '#666'}}
+            ))
+            fig.update_layout(height=200, margin=dict(l=20, r=20, t=40, b=20), paper_bgcolor='rgba(0,0,0,0)')
+            plotly_chart(fig, use_container_width=True)
+    
+        # Renewable Energy Gauge
+        with col4:
+            fig = go.Figure(go.Indicator(
+                mode="gauge+number",
+                value=renewable_pct,
+                number={'suffix': '%', 'font': {'size': 36, 'color': '#1a2b4a'}},
+                gauge={
+                    'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': '#1a2b4a'},
+                    'bar': {'color': '#27ae60'},
+                    'bgcolor': 'white',
+                    'borderwidth': 0,
+                    'steps': [
+                        {'range': [0, 30], 'color': '#fee2e2'},
+                        {'range': [30, 50], 'color': '#fef3c7'},
+                        {'range': [50, 100], 'color': '#d1fae5'}
+                    ],
+                    'threshold': {
+                        'line': {'color': '#e63946', 'width': 3},
+                        'thickness': 0.8,
+                        'value': 50
+                    }
+                },
+                title={'text': 'Renewable Energy', 'font': {'size': 14, 'color': '#666'}}
+            ))
+            fig.update_layout(height=200, margin=dict(l=20, r=20, t=40, b=20), paper_bgcolor='rgba(0,0,0,0)')
+            plotly_chart(fig, use_container_width=True)
+    
+        # -------------------------------------------------------------------------
+
+        # THREE STRATEGIC PILLARS
+        # -------------------------------------------------------------------------
+    
+        st.markdown("### 🏛️ Strategic Pillars")
+    
+        col1, col2, col3 = st.columns(3)
+    
+        # Infrastructure Pillar
+        with col1:
+            infra_df = overview_data["infra"]
+            pos_df = overview_data["pos"]
+        
+            sites_count = infra_df['SITES'].iloc[0] if not infra_df.empty else 8785
+            towers_count = infra_df['TOWERS'].iloc[0] if not infra_df.empty else 7877
+            pos_count = pos_df['POS_COUNT'].iloc[0] if not pos_df.empty else 21244
+        
+            st.markdown(f"""
+                <div class="pillar-card infrastructure">
+                    <div class="pillar-title">🏗️ Infrastructure{as_of_badge(infra_df)}</div>
+                    <div class="pillar-metric">
+                        <span class="pillar-metric-label">Active Sites</span>
+                        <span class="pillar-metric-value">{sites_count:,}</span>
+                    </div>
+                    <div class="pillar-metric">
+                        <span class="pillar-metric-label">Towers</span>
+                        <span class="pillar-metric-value">{towers_count:,}</span>
+                    </div>
+                    <div class="pillar-metric">
+                        <span class="pillar-metric-label">Points of Service</span>
+                        <span class="pillar-metric-value">{pos_count:,}</span>
+                    </div>
+                </div>
+            """, unsafe_allow_html=True)
+    
+        # Operations Pillar
+        with col2:
+            ops_df = overview_data["ops"]
+            wo_df = overview_data["wo"]
+        
+            open_wo = wo_df['OPEN_WO'].iloc[0] if not wo_df.empty else 50
+            avg_risk = ops_df['AVG_RISK'].iloc[0] if not ops_df.empty else 42
+        
+            risk_status = 'green' if avg_risk < 40 else 'amber' if avg_risk < 60 else 'red'
+        
+            st.markdown(f"""
+                <div class="pillar-card operations">
+                    <div class="pillar-title">⚡ Operations{as_of_badge(ops_df)}</div>
+                    <div class="pillar-metric">
+                        <span class="pillar-metric-label">SLA Performance</span>
+                        <span class="pillar-metric-value">{sla_pct:.0f}%</span>
+                    </div>
+                    <div class="pillar-metric">
+                        <span class="pillar-metric-label">Open Work Orders</span>
+                        <span class="pillar-metric-value">{open_wo}</span>
+                    </div>
+                    <div class="pillar-metric">
+                        <span class="pillar-metric-label">Avg Risk Score</span>
+                        <span class="pillar-metric-value">
+                            <span class="status-badge {risk_status}">{avg_risk:.0f}</span>
+                        </span>
+                    </div>
+                </div>
+            """, unsafe_allow_html=True)
+    
+        # ESG Pillar
+        with col3:
+            esg_detail = overview_data["esg_detail"]
+        
+            carbon = esg_detail['CARBON_EMISSIONS_TONNES'].iloc[0] if not esg_detail.empty else 48000
+            equality = esg_detail['EQUALITY_INDEX_SCORE'].iloc[0] if not esg_detail.empty else 88
+            carbon_var = esg_detail['CARBON_VARIANCE_PCT'].iloc[0] if not esg_detail.empty else -5
+        
+            carbon_status = 'green' if carbon_var <= 0 else 'amber' if carbon_var < 10 else 'red'
+            equality_status = 'green' if equality >= 85 else 'amber' if equality >= 75 else 'red'
+        
+            st.markdown(f"""
+                <div class="pillar-card esg">
+                    <div class="pillar-title">🌱 ESG{as_of_badge(esg_detail)}</div>
+                    <div class="pillar-metric">
+                        <span class="pillar-metric-label">Renewable Energy</span>
+                        <span class="pillar-metric-value">{renewable_pct:.0f}%</span>
+                    </div>
+                    <div class="pillar-metric">
+                        <span class="pillar-metric-label">Carbon vs Target</span>
+                        <span class="pillar-metric-value">
+                            <span class="status-badge {carbon_status}">{carbon_var:+.0f}%</span>
+                        </span>
+                    </div>
+                    <div class="pillar-metric">
+                        <span class="pillar-metric-label">Equality Index</span>
+                        <span class="pillar-metric-value">
+                            <span class="status-badge {equality_status}">{equality:.0f}/100</span>
+                        </span>
+                    </div>
+                </div>
+            """, unsafe_allow_html=True)
+    
+        # -------------------------------------------------------------------------
+    
+
+    # =========================================================================
+    # TAB 2: FINANCIAL PERFORMANCE
+    # =========================================================================
+
+    if show_financial:
+
+        # MONTHLY FINANCIAL PERFORMANCE - Revenue vs Costs
+        # -------------------------------------------------------------------------
+    
+        st.markdown("### 📈 Monthly Financial Performance")
+    
+        # Fetch monthly financial data
+        monthly_finance_df = run_query("""
+            SELECT 
+                PERIOD_DATE,
+                REVENUE_EUR / 1000000 as REVENUE_M,
+                OPEX_EUR / 1000000 as OPEX_M,
+                EBITDA_EUR / 1000000 as EBITDA_M,
+                EBITDAAL_MARGIN_PCT as MARGIN_PCT
+            FROM TDF_DATA_PLATFORM.FINANCE.EBITDA_METRICS 
+            WHERE FISCAL_YEAR = 2025
+            ORDER BY PERIOD_DATE
+        """, freshness="finance")
+    
+        if not monthly_finance_df.empty:
+            fig = go.Figure()
+        
+            # Revenue line
+            fig.add_trace(go.Scatter(
+                x=monthly_finance_df['PERIOD_DATE'],
+                y=monthly_finance_df['REVENUE_M'],
+                mode='lines+markers',
+                name='Revenue',
+                line=dict(color='#1a2b4a', width=3),
+                marker=dict(size=10, color='#1a2b4a'),
+                hovertemplate='Revenue: €%{y:.1f}M<extra></extra>'
+            ))
+        
+            # OPEX line
+            fig.add_trace(go.Scatter(
+                x=monthly_finance_df['PERIOD_DATE'],
+                y=monthly_finance_df['OPEX_M'],
+                mode='lines+markers',
+                name='OPEX',
+                line=dict(color='#e63946', width=3),
+                marker=dict(size=10, color='#e63946'),
+                hovertemplate='OPEX: €%{y:.1f}M<extra></extra>'
+            ))
+        
+            # EBITDA line
+            fig.add_trace(go.Scatter(
+                x=monthly_finance_df['PERIOD_DATE'],
+                y=monthly_finance_df['EBITDA_M'],
+                mode='lines+markers',
+                name='EBITDA',
+                line=dict(color='#27ae60', width=2, dash='dot'),
+                marker=dict(size=8, color='#27ae60'),
+                hovertemplate='EBITDA: €%{y:.1f}M<extra></extra>'
+            ))
+        
+            fig.update_layout(
+                height=350,
+                margin=dict(l=20, r=20, t=30, b=40),
+                paper_bgcolor='rgba(0,0,0,0)',
+                plot_bgcolor='rgba(0,0,0,0)',
+                xaxis=dict(
+                    showgrid=True,
+                    gridcolor='#f0f0f0',
+                    tickformat='%b %Y',
+                    title=None
+                ),
+                yaxis=dict(
+                    showgrid=True,
+                    gridcolor='#f0f0f0',
+                    title=dict(text='EUR Millions', font=dict(size=12, color='#666')),
+                    tickprefix='€',
+                    ticksuffix='M'
+                ),
+                legend=dict(
+                    orientation='h',
+                    yanchor='bottom',
+                    y=1.02,
+                    xanchor='center',
+                    x=0.5,
+                    font=dict(size=12)
+                ),
+                hovermode='x unified'
+            )
+        
+            plotly_chart(fig, use_container_width=True)
+        
+            # Summary metrics below chart
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                avg_revenue = monthly_finance_df['REVENUE_M'].mean()
+                render_metric("Avg Monthly Revenue", f"€{avg_revenue:.1f}M", as_of=monthly_finance_df)
+            with col2:
+                avg_opex = monthly_finance_df['OPEX_M'].mean()
+                render_metric("Avg Monthly OPEX", f"€{avg_opex:.1f}M", as_of=monthly_finance_df)
+            with col3:
+                avg_ebitda = monthly_finance_df['EBITDA_M'].mean()
+                render_metric("Avg Monthly EBITDA", f"€{avg_ebitda:.1f}M", as_of=monthly_finance_df)
+            with col4:
+                avg_margin = monthly_finance_df['MARGIN_PCT'].mean()
+                render_metric("Avg Margin", f"{avg_margin:.1f}%", as_of=monthly_finance_df)
+        else:
+            st.info("Loading financial data...")
+    
+        # -------------------------------------------------------------------------
+
+        # REVENUE & CLIENT SECTION
+        # -------------------------------------------------------------------------
+    
+        col_left, col_right = st.columns([3, 2])
+    
+        with col_left:
+            st.markdown("### 📈 Revenue by Segment")
+        
+            # Fetch revenue by segment
+            revenue_df = run_query("""
+                SELECT 
+                    SEGMENT_LEVEL1,
+                    SUM(REVENUE_EUR) / 1000000 as REVENUE_M
+                FROM TDF_DATA_PLATFORM.FINANCE.REVENUE_BY_SEGMENT
+                WHERE FISCAL_YEAR = 2025
+                GROUP BY SEGMENT_LEVEL1
+                ORDER BY REVENUE_M DESC
+            """, freshness="finance")
+        
+            if not revenue_df.empty:
+                # Create horizontal bar chart
+                fig = go.Figure()
+            
+                colors = ['#1a2b4a', '#2d3436', '#e63946', '#636e72']
+            
+                fig.add_trace(go.Bar(
+                    y=revenue_df['SEGMENT_LEVEL1'],
+                    x=revenue_df['REVENUE_M'],
+                    orientation='h',
+                    marker=dict(
+                        color=colors[:len(revenue_df)],
+                        line=dict(width=0)
+                    ),
+                    text=[f'€{x:.1f}M' for x in revenue_df['REVENUE_M']],
+                    textposition='inside',
+                    textfont=dict(color='white', size=14, family='Arial Black'),
+                    hovertemplate='%{y}: €%{x:.1f}M<extra></extra>'
+                ))
+            
+                fig.update_layout(
+                    height=300,
+                    margin=dict(l=20, r=20, t=20, b=20),
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    plot_bgcolor='rgba(0,0,0,0)',
+                    xaxis=dict(
+                        showgrid=True,
+                        gridcolor='#f0f0f0',
+                        title=dict(text='Revenue (EUR Millions)', font=dict(size=12, color='#666'))
+                    ),
+                    yaxis=dict(
+                        showgrid=False,
+                        categoryorder='total ascending'
+                    ),
+                    showlegend=False
+                )
+            
+                plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("Loading revenue data...")
+    
+        with col_right:
+            st.markdown("### 🎯 Client Portfolio")
+        
+            # Fetch client concentration
+            client_df = run_query("""
+                SELECT 
+                    o.OPERATOR_NAME,
+                    SUM(rc.REVENUE_EUR) / 1000000 as REVENUE_M,
+                    AVG(rc.REVENUE_SHARE_PCT) as SHARE_PCT
+                FROM TDF_DATA_PLATFORM.FINANCE.REVENUE_BY_CLIENT rc
+                JOIN TDF_DATA_PLATFORM.CORE.OPERATORS o ON rc.OPERATOR_ID = o.OPERATOR_ID
+                WHERE rc.FISCAL_YEAR = 2025
+                GROUP BY o.OPERATOR_NAME
+                ORDER BY REVENUE_M DESC
+            """, freshness="finance")
+        
+            if not client_df.empty:
+                colors = ['#1a2b4a', '#e63946', '#2d3436', '#636e72']
+            
+                fig = go.Figure(data=[go.Pie(
+                    labels=client_df['OPERATOR_NAME'],
+                    values=client_df['REVENUE_M'],
+                    hole=0.6,
+                    marker=dict(colors=colors[:len(client_df)]),
+                    textinfo='percent',
+                    textfont=dict(size=14, color='white'),
+                    hovertemplate='%{label}<br>€%{value:.1f}M<br>%{percent}<extra></extra>'
+                )])
+            
+                fig.update_layout(
+                    height=300,
+                    margin=dict(l=20, r=20, t=20, b=20),
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    showlegend=True,
+                    legend=dict(
+                        orientation='h',
+                        yanchor='bottom',
+                        y=-0.2,
+                        xanchor='center',
+                        x=0.5,
+                        font=dict(size=11)
+                    ),
+                    annotations=[dict(
+                        text='<b>4</b><br>Strategic<br>Clients',
+                        x=0.5, y=0.5,
+                        font=dict(size=14, color='#1a2b4a'),
+                        showarrow=False
+                    )]
+                )
+            
+                plotly_chart(fig, use_container_width=True)
+            else:
+                st.info("Loading client data...")
+    
+        # -------------------------------------------------------------------------
+
+    # =========================================================================
+    # TAB 3: INFRASTRUCTURE & OPERATIONS
+    # =========================================================================
+
+    if show_operations:
+
+        # 🗺️ FRANCE MAP + 💰 CLIENT HEALTH (Side by Side)
+        # -------------------------------------------------------------------------
+    
+        col_map, col_clients = st.columns([3, 2])
+    
+        with col_map:
+            st.markdown("### 🗺️ France Infrastructure Map")
+        
+            # Fetch regional data with coordinates
+            regional_df = run_query("""
+                SELECT 
+                    r.REGION_NAME,
+                    r.REGION_CODE,
+                    r.LATITUDE,
+                    r.LONGITUDE,
+                    r.POPULATION / 1000000 as POPULATION_M,
+                    COALESCE(site_data.SITE_COUNT, 0) as SITE_COUNT,
+                    COALESCE(site_data.REVENUE_M, 0) as REVENUE_M,
+                    COALESCE(site_data.AVG_COLOCATION, 50) as AVG_COLOCATION
+                FROM TDF_DATA_PLATFORM.CORE.REGIONS r
+                LEFT JOIN (
+                    SELECT 
+                        d.REGION_ID,
+                        COUNT(DISTINCT s.SITE_ID) as SITE_COUNT,
+                        SUM(s.ANNUAL_REVENUE_EUR) / 1000000 as REVENUE_M,
+                        AVG(s.COLOCATION_RATE) * 100 as AVG_COLOCATION
+                    FROM TDF_DATA_PLATFORM.CORE.DEPARTMENTS d
+                    INNER JOIN TDF_DATA_PLATFORM.INFRASTRUCTURE.SITES s 
+                        ON d.DEPARTMENT_ID = s.DEPARTMENT_ID
+                    WHERE s.STATUS = 'ACTIVE'
+                    GROUP BY d.REGION_ID
+                ) site_data ON r.REGION_ID = site_data.REGION_ID
+                ORDER BY SITE_COUNT DESC
+            """, freshness="reference", compact=True)
+        
+            if not regional_df.empty:
+                # Prepare data for PyDeck
+                # Scale radius by site count (min 10000, max 80000 meters)
+                max_sites = max(regional_df['SITE_COUNT'].max(), 1)
+                regional_df['radius'] = (regional_df['SITE_COUNT'] / max_sites) * 70000 + 10000
+            
+                # Color by revenue: blue gradient (RGB)
+                max_rev = max(regional_df['REVENUE_M'].max(), 1)
+                regional_df['color_r'] = 26  # TDF navy R
+                regional_df['color_g'] = (43 + (1 - regional_df['REVENUE_M'] / max_rev) * 150).astype(int)
+                regional_df['color_b'] = (74 + (1 - regional_df['REVENUE_M'] / max_rev) * 180).astype(int)
+            
+                # Rename columns for PyDeck (needs lowercase)
+                map_df = regional_df.rename(columns={
+                    'LATITUDE': 'lat', 
+                    'LONGITUDE': 'lon',
+                    'REGION_NAME': 'region_name',
+                    'REGION_CODE': 'region_code',
+                    'SITE_COUNT': 'sites',
+                    'REVENUE_M': 'revenue',
+                    'AVG_COLOCATION': 'colocation',
+                    'POPULATION_M': 'population'
+                })
+            
+                # Create PyDeck ScatterplotLayer
+                layer = pdk.Layer(
+                    "ScatterplotLayer",
+                    data=map_df,
+                    get_position=["lon", "lat"],
+                    get_radius="radius",
+                    get_fill_color=["color_r", "color_g", "color_b", 200],
+                    pickable=True,
+                    auto_highlight=True,
+                    highlight_color=[230, 57, 70, 255],  # TDF red on hover
+                )
+            
+                # Text layer for region codes
+                text_layer = pdk.Layer(
+                    "TextLayer",
+                    data=map_df,
+                    get_position=["lon", "lat"],
+                    get_text="region_code",
+                    get_size=14,
+                    get_color=[255, 255, 255, 255],
+                    get_alignment_baseline="'center'",
+                    font_family='"Arial Black", sans-serif',
+                    pickable=False,
+                )
+            
+                # Set view centered on France
+                view_state = pdk.ViewState(
+                    latitude=46.6,
+                    longitude=2.5,
+                    zoom=4.8,
+                    pitch=0,
+                )
+            
+                # Tooltip with details
+                tooltip = {
+                    "html": """
+                        <div style="background: #1a2b4a; padding: 12px; border-radius: 8px; font-family: Arial, sans-serif;">
+                            <div style="font-size: 16px; font-weight: bold; color: white; margin-bottom: 8px;">{region_name}</div>
+                            <div style="color: #aaa; font-size: 12px;">
+                                📡 <b style="color: white;">{sites}</b> Sites<br/>
+                                💰 <b style="color: white;">€{revenue:.1f}M</b> Revenue<br/>
+                                🏢 <b style="color: white;">{colocation:.0f}%</b> Colocation<br/>
+                                👥 <b style="color: white;">{population:.1f}M</b> Population
+                            </div>
+                        </div>
+                    """,
+                    "style": {"backgroundColor": "transparent", "color": "white"}
+                }
+            
+                # Render the map with Carto basemap (no API key needed)
+                st.pydeck_chart(
+                    pdk.Deck(
+                        layers=[layer, text_layer],
+                        initial_view_state=view_state,
+                        tooltip=tooltip,
+                        map_style="https://basemaps.cartocdn.com/gl/positron-gl-style/style.json",
+                    ),
+                    use_container_width=True
+                )
+            
+                # Summary stats below map
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    top_region = regional_df[regional_df['SITE_COUNT'] > 0].iloc[0] if regional_df['SITE_COUNT'].sum() > 0 else regional_df.iloc[0]
+                    render_metric("Top Region", top_region['REGION_NAME'], f"{int(top_region['SITE_COUNT']):,} sites", as_of=regional_df)
+                with col2:
+                    total_sites = regional_df['SITE_COUNT'].sum()
+                    render_metric("Total Sites", f"{int(total_sites):,}", as_of=regional_df)
+                with col3:
+                    valid_coloc = regional_df[regional_df['AVG_COLOCATION'] > 0]['AVG_COLOCATION']
+                    avg_coloc = valid_coloc.mean() if len(valid_coloc) > 0 else 50
+                    render_metric("Avg Colocation", f"{avg_coloc:.0f}%", as_of=regional_df)
+            else:
+                st.warning("No regional data found.")
+    
+        with col_clients:
+            st.markdown("### 🔧 Service Level by Client")
+        
+            # Fetch client infrastructure metrics (per-operator rollup, one row each)
+            client_infra_df = run_query("""
+                SELECT 
+                    o.OPERATOR_NAME,
+                    o.OPERATOR_CODE,
+                    o.OPERATOR_TYPE,
+                    COALESCE(sl.SITES_COUNT, 0) as SITES_COUNT,
+                    COALESCE(sl.INSTALLATIONS, 0) as INSTALLATIONS,
+                    sl.EQUIPMENT_COUNT,
+                    100.0 * sl.SLA_MET_COUNT / NULLIF(sl.WORK_ORDERS, 0) as SLA_PCT,
+                    sl.OPEN_CRITICAL_TICKETS as CRITICAL_TICKETS
+                FROM TDF_DATA_PLATFORM.CORE.OPERATORS o
+                LEFT JOIN TDF_DATA_PLATFORM.ANALYTICS.DT_OPERATOR_SERVICE_LEVEL sl ON o.OPERATOR_ID = sl.OPERATOR_ID
+                WHERE o.ANNUAL_REVENUE_EUR > 0
+                ORDER BY SITES_COUNT DESC
+                LIMIT 6
+            """, freshness="finance")
+        
+            if not client_infra_df.empty:
+                for _, client in client_infra_df.iterrows():
+                    import pandas as pd
+                    sites = int(client['SITES_COUNT']) if pd.notna(client['SITES_COUNT']) else 0
+                    sla = float(client['SLA_PCT']) if pd.notna(client['SLA_PCT']) else 99.5
+                    tickets = int(client['CRITICAL_TICKETS']) if pd.notna(client['CRITICAL_TICKETS']) else 0
+                    equipment = int(client['EQUIPMENT_COUNT']) if pd.notna(client['EQUIPMENT_COUNT']) else 0
+                    
+                    # Status based on SLA and tickets
+                    if sla >= 99 and tickets == 0:
+                        status_color = '#27ae60'
+                        status_icon = '🟢'
+                        status_text = 'Healthy'
+                    elif sla >= 95 or tickets <= 2:
+                        status_color = '#f39c12'
+                        status_icon = '🟡'
+                        status_text = f'{tickets} tickets'
+                    else:
+                        status_color = '#e63946'
+                        status_icon = '🔴'
+                        status_text = f'{tickets} critical'
+                    
+                    initials = ''.join([w[0] for w in client['OPERATOR_NAME'].split()[:2]]).upper()
+                    
+                    st.markdown(f"""
+                        <div style="background: white; border-left: 4px solid {status_color}; border-radius: 8px; padding: 0.75rem 1rem; margin-bottom: 0.5rem; box-shadow: 0 1px 3px rgba(0,0,0,0.08);">
+                            <div style="display: flex; align-items: center; justify-content: space-between;">
+                                <div style="display: flex; align-items: center; gap: 0.75rem;">
+                                    <div style="background: #1a2b4a; color: white; width: 36px; height: 36px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-weight: bold; font-size: 0.85rem;">{initials}</div>
+                                    <div>
+                                        <div style="font-weight: 600; color: #1a2b4a; font-size: 0.9rem;">{client['OPERATOR_NAME']}</div>
+                                        <div style="color: #666; font-size: 0.75rem;">📡 {sites:,} sites • 🔧 {equipment:,} equipment</div>
+                                    </div>
+                                </div>
+                                <div style="text-align: right;">
+                                    <div style="font-weight: 700; color: #1a2b4a; font-size: 1rem;">{sla:.1f}%</div>
+                                    <div style="background: {status_color}; color: white; padding: 0.15rem 0.5rem; border-radius: 10px; font-size: 0.65rem; font-weight: 600;">{status_icon} {status_text}</div>
+                                </div>
+                            </div>
+                        </div>
+                    """, unsafe_allow_html=True)
+                
+                # Summary metrics
+                total_sites = client_infra_df['SITES_COUNT'].sum()
+                avg_sla = client_infra_df['SLA_PCT'].mean() if client_infra_df['SLA_PCT'].mean() else 99.5
+                total_tickets = client_infra_df['CRITICAL_TICKETS'].sum()
+                
+                st.markdown("---")
+                col1, col2 = st.columns(2)
+                with col1:
+                    render_metric("Avg SLA Performance", f"{avg_sla:.1f}%", "Target: 99.5%", as_of=client_infra_df)
+                with col2:
+                    delta_color = "inverse" if total_tickets > 0 else "normal"
+                    render_metric("Open Critical Tickets", f"{int(total_tickets)}", f"Across {int(total_sites):,} sites", as_of=client_infra_df,
+                                  delta_color=delta_color)
+            else:
+                st.info("Loading infrastructure data...")
+    
+        # -------------------------------------------------------------------------
+
+    # =========================================================================
+    # TAB 4: CLIENT PORTFOLIO
+    # =========================================================================
+
+    if show_clients:
+        
+        # Fetch comprehensive client data
+        client_data_df = run_query("""
+            SELECT 
+                o.OPERATOR_NAME,
+                o.OPERATOR_CODE,
+                o.OPERATOR_TYPE,
+                o.ANNUAL_REVENUE_EUR / 1000000 as REVENUE_M,
+                o.CONTRACT_END_DATE,
+                o.CONTRACT_START_DATE,
+                o.CREDIT_RATING,
+                o.IS_STRATEGIC_CLIENT,
+                DATEDIFF(DAY, CURRENT_DATE(), o.CONTRACT_END_DATE) as DAYS_TO_EXPIRY,
+                DATEDIFF(YEAR, o.CONTRACT_START_DATE, CURRENT_DATE()) as YEARS_AS_CLIENT
+            FROM TDF_DATA_PLATFORM.CORE.OPERATORS o
+            WHERE o.ANNUAL_REVENUE_EUR > 0
+            ORDER BY o.ANNUAL_REVENUE_EUR DESC
+        """, freshness="reference")
+        
+        if not client_data_df.empty:
+            total_revenue = client_data_df['REVENUE_M'].sum()
+            strategic_count = len(client_data_df[client_data_df['IS_STRATEGIC_CLIENT'] == True])
+            avg_tenure = client_data_df['YEARS_AS_CLIENT'].mean()
+            
+            # -------------------------------------------------------------------------
+            # ROW 1: Key Portfolio Metrics
+            # -------------------------------------------------------------------------
+            st.markdown("### 🤝 Strategic Client Intelligence")
+            
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #1a2b4a 0%, #2d3436 100%); border-radius: 12px; padding: 1.5rem; text-align: center; color: white;">
+                        <div style="font-size: 2.5rem; font-weight: 700;">€{total_revenue:.0f}M</div>
+                        <div style="font-size: 0.9rem; opacity: 0.8;">Total Portfolio Revenue</div>
+                    </div>
+                """, unsafe_allow_html=True)
+            with col2:
+                st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #27ae60 0%, #2ecc71 100%); border-radius: 12px; padding: 1.5rem; text-align: center; color: white;">
+                        <div style="font-size: 2.5rem; font-weight: 700;">{strategic_count}</div>
+                        <div style="font-size: 0.9rem; opacity: 0.8;">Strategic Partners</div>
+                    </div>
+                """, unsafe_allow_html=True)
+            with col3:
+                st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #e63946 0%, #f39c12 100%); border-radius: 12px; padding: 1.5rem; text-align: center; color: white;">
+                        <div style="font-size: 2.5rem; font-weight: 700;">{avg_tenure:.0f}</div>
+                        <div style="font-size: 0.9rem; opacity: 0.8;">Avg. Years Partnership</div>
+                    </div>
+                """, unsafe_allow_html=True)
+            with col4:
+                top_client_pct = (client_data_df['REVENUE_M'].iloc[0] / total_revenue) * 100
+                st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #9b59b6 0%, #8e44ad 100%); border-radius: 12px; padding: 1.5rem; text-align: center; color: white;">
+                        <div style="font-size: 2.5rem; font-weight: 700;">{top_client_pct:.0f}%</div>
+                        <div style="font-size: 0.9rem; opacity: 0.8;">Top Client Concentration</div>
+                    </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            # -------------------------------------------------------------------------
+            # ROW 2: Revenue by Segment + Contract Timeline
+            # -------------------------------------------------------------------------
+            col_chart, col_timeline = st.columns([1, 1])
+            
+            with col_chart:
+                st.markdown("#### 📊 Revenue by Client Type")
+                
+                # Group by operator type
+                type_revenue = client_data_df.groupby('OPERATOR_TYPE')['REVENUE_M'].sum().reset_index()
+                type_revenue = type_revenue.sort_values('REVENUE_M', ascending=False)
+                
+                colors = ['#1a2b4a', '#e63946', '#27ae60', '#f39c12', '#9b59b6']
+                
+                fig = go.Figure(data=[go.Pie(
+                    labels=type_revenue['OPERATOR_TYPE'],
+                    values=type_revenue['REVENUE_M'],
+                    hole=0.5,
+                    marker=dict(colors=colors[:len(type_revenue)]),
+                    textinfo='label+percent',
+                    textposition='outside',
+                    textfont=dict(size=12),
+                    hovertemplate='%{label}<br>€%{value:.0f}M<br>%{percent}<extra></extra>'
+                )])
+                
+                fig.update_layout(
+                    height=300,
+                    margin=dict(l=20, r=20, t=20, b=20),
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    showlegend=False,
+                    annotations=[dict(
+                        text=f'<b>€{total_revenue:.0f}M</b><br>Total',
+                        x=0.5, y=0.5,
+                        font=dict(size=16, color='#1a2b4a'),
+                        showarrow=False
+                    )]
+                )
+                plotly_chart(fig, use_container_width=True)
+            
+            with col_timeline:
+                st.markdown("#### 📅 Contract Renewal Timeline")
+                
+                # Create timeline visualization
+                for _, client in client_data_df.head(6).iterrows():
+                    days = client['DAYS_TO_EXPIRY'] if client['DAYS_TO_EXPIRY'] else 9999
+                    
+                    if days < 365:
+                        color = '#e63946'
+                        urgency = '🔴 URGENT'
+                    elif days < 730:
+                        color = '#f39c12'
+                        urgency = '🟡 UPCOMING'
+                    else:
+                        color = '#27ae60'
+                        urgency = '🟢 SECURED'
+                    
+                    # Progress bar (max 5 years = 1825 days)
+                    progress = min(100, (days / 1825) * 100)
+                    
+                    st.markdown(f"""
+                        <div style="margin-bottom: 0.75rem;">
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
+                                <span style="font-weight: 600; color: #1a2b4a; font-size: 0.85rem;">{client['OPERATOR_NAME']}</span>
+                                <span style="font-size: 0.75rem; color: {color}; font-weight: 600;">{urgency}</span>
+                            </div>
+                            <div style="background: #e9ecef; border-radius: 10px; height: 8px; overflow: hidden;">
+                                <div style="background: {color}; width: {progress}%; height: 100%; border-radius: 10px;"></div>
+                            </div>
+                            <div style="display: flex; justify-content: space-between; font-size: 0.7rem; color: #666; margin-top: 0.15rem;">
+                                <span>€{client['REVENUE_M']:.0f}M/yr</span>
+                                <span>{client['CONTRACT_END_DATE'].strftime('%b %Y') if client['CONTRACT_END_DATE'] else 'N/A'}</span>
+                            </div>
+                        </div>
+                    """, unsafe_allow_html=True)
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            # -------------------------------------------------------------------------
+            # ROW 3: Client Health Scorecard
+            # -------------------------------------------------------------------------
+            st.markdown("#### 🏆 Top Client Scorecard")
+            
+            # Create scorecard for top 4 clients
+            top_clients = client_data_df.head(4)
+            cols = st.columns(4)
+            
+            for idx, (_, client) in enumerate(top_clients.iterrows()):
+                with cols[idx]:
+                    days = client['DAYS_TO_EXPIRY'] if client['DAYS_TO_EXPIRY'] else 9999
+                    tenure = client['YEARS_AS_CLIENT']
+                    rating = client['CREDIT_RATING']
+                    strategic = client['IS_STRATEGIC_CLIENT']
+                    
+                    # Calculate health score (0-100)
+                    health_score = min(100, (
+                        (min(days, 1825) / 1825) * 40 +  # Contract stability
+                        (min(tenure, 15) / 15) * 30 +    # Relationship tenure
+                        (30 if strategic else 15)         # Strategic importance
+                    ))
+                    
+                    if health_score >= 80:
+                        score_color = '#27ae60'
+                        score_label = 'Excellent'
+                    elif health_score >= 60:
+                        score_color = '#f39c12'
+                        score_label = 'Good'
+                    else:
+                        score_color = '#e63946'
+                        score_label = 'At Risk'
+                    
+                    initials = ''.join([w[0] for w in client['OPERATOR_NAME'].split()[:2]]).upper()
+                    
+                    st.markdown(f"""
+                        <div style="background: white; border-radius: 12px; padding: 1.25rem; box-shadow: 0 2px 8px rgba(0,0,0,0.1); text-align: center;">
+                            <div style="background: #1a2b4a; color: white; width: 50px; height: 50px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-weight: bold; font-size: 1.1rem; margin: 0 auto 0.75rem auto;">{initials}</div>
+                            <div style="font-weight: 700; color: #1a2b4a; font-size: 1rem; margin-bottom: 0.25rem;">{client['OPERATOR_NAME']}</div>
+                            <div style="color: #666; font-size: 0.75rem; margin-bottom: 0.75rem;">{client['OPERATOR_TYPE']} • {rating}</div>
+                            <div style="background: {score_color}; color: white; border-radius: 20px; padding: 0.5rem 1rem; font-size: 1.25rem; font-weight: 700; margin-bottom: 0.5rem;">{health_score:.0f}</div>
+                            <div style="color: {score_color}; font-size: 0.8rem; font-weight: 600;">{score_label}</div>
+                            <div style="margin-top: 0.75rem; padding-top: 0.75rem; border-top: 1px solid #eee;">
+                                <div style="font-size: 1.1rem; font-weight: 700; color: #1a2b4a;">€{client['REVENUE_M']:.0f}M</div>
+                                <div style="color: #888; font-size: 0.7rem;">{tenure:.0f} years partner</div>
+                            </div>
+                        </div>
+                    """, unsafe_allow_html=True)
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+            
+            # -------------------------------------------------------------------------
+            # ROW 4: Revenue Risk Summary
+            # -------------------------------------------------------------------------
+            at_risk = client_data_df[client_data_df['DAYS_TO_EXPIRY'] < 730]['REVENUE_M'].sum()
+            secured = client_data_df[client_data_df['DAYS_TO_EXPIRY'] >= 730]['REVENUE_M'].sum()
+            critical = client_data_df[client_data_df['DAYS_TO_EXPIRY'] < 365]['REVENUE_M'].sum()
+            
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                render_metric("🟢 Revenue Secured", f"€{secured:.0f}M", f"{(secured/total_revenue)*100:.0f}% of portfolio",
+                              as_of=client_data_df)
+            with col2:
+                render_metric("🟡 Renewal Pipeline", f"€{at_risk:.0f}M", f"{(at_risk/total_revenue)*100:.0f}% within 24mo",
+                              as_of=client_data_df, delta_color="off")
+            with col3:
+                render_metric("🔴 Urgent Renewals", f"€{critical:.0f}M", f"{(critical/total_revenue)*100:.0f}% within 12mo",
+                              as_of=client_data_df, delta_color="inverse")
+
+    # -------------------------------------------------------------------------
+    # FOOTER
+    # -------------------------------------------------------------------------
+
+    st.markdown("---")
+    st.markdown("""
+        <div style="text-align: center; color: #888; font-size: 0.8rem;">
+            📊 Data refreshed from TDF_DATA_PLATFORM • Powered by Snowflake
+        </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,214 @@
+# ==============================================================================
+# PAGE: PERFORMANCE
+# ==============================================================================
+# Hidden page (open the app with ?perf=1) showing the in-process query log:
+# latency per query fingerprint and where rerun time goes
+# ==============================================================================
+
+import streamlit as st
+import plotly.graph_objects as go
+import pandas as pd
+
+from tdf_dashboard.common import (
+    get_query_cache, get_query_log, plotly_chart, render_header, render_kpi_card, render_section_header, run_query,
+)
+
+# Warehouse time and credits per dashboard section, from the QUERY_TAG every
+# statement carries (same report as sql/queries/dashboard_cost_attribution.sql)
+COST_ATTRIBUTION_QUERY = """
+    WITH dashboard_queries AS (
+        SELECT q.QUERY_ID, TRY_PARSE_JSON(q.QUERY_TAG) as TAG, q.TOTAL_ELAPSED_TIME,
+               q.BYTES_SCANNED, q.CREDITS_USED_CLOUD_SERVICES
+        FROM SNOWFLAKE.ACCOUNT_USAGE.QUERY_HISTORY q
+        WHERE q.START_TIME >= DATEADD('day', -1 * ?, CURRENT_TIMESTAMP())
+          AND q.QUERY_TAG LIKE '%"app":"tdf_dashboard"%'
+    )
+    SELECT
+        d.TAG:page::STRING as PAGE,
+        d.TAG:tab::STRING as TAB,
+        d.TAG:section::STRING as SECTION,
+        COUNT(*) as N_QUERIES,
+        COUNT_IF(d.TAG:cache::STRING = 'prefetch') as N_PREFETCH,
+        COUNT_IF(d.TAG:cache::STRING = 'refresh') as N_REFRESH,
+        SUM(d.TOTAL_ELAPSED_TIME) / 1000 as TOTAL_ELAPSED_S,
+        APPROX_PERCENTILE(d.TOTAL_ELAPSED_TIME, 0.95) / 1000 as P95_ELAPSED_S,
+        SUM(d.BYTES_SCANNED) / POWER(1024, 3) as GB_SCANNED,
+        SUM(COALESCE(a.CREDITS_ATTRIBUTED_COMPUTE, 0)) as COMPUTE_CREDITS,
+        SUM(d.CREDITS_USED_CLOUD_SERVICES) as CLOUD_SERVICES_CREDITS
+    FROM dashboard_queries d
+    LEFT JOIN SNOWFLAKE.ACCOUNT_USAGE.QUERY_ATTRIBUTION_HISTORY a ON a.QUERY_ID = d.QUERY_ID
+    GROUP BY 1, 2, 3
+    ORDER BY COMPUTE_CREDITS DESC, TOTAL_ELAPSED_S DESC
+"""
+
+
+def _p95(values):
+    return values.quantile(0.95)
+
+
+def page_performance():
+    render_header(
+        "Performance",
+        "Query latency, cache behaviour and rerun time breakdown for this app process"
+    )
+
+    queries, reruns = get_query_log().snapshot()
+    if not queries:
+        st.info("No queries recorded yet. Browse the dashboard pages, then come back here.")
+        return
+
+    log = pd.DataFrame(queries)
+    # Cache hits carry no SQL timing or sizes; keep those columns numeric (NaN)
+    for column in ["sql_ms", "rows", "bytes", "bytes_raw"]:
+        log[column] = pd.to_numeric(log[column])
+    log["bytes_saved"] = log["bytes_raw"] - log["bytes"]
+    cache_stats = get_query_cache().stats()
+
+    # -------------------------------------------------------------------------
+    # SUMMARY
+    # -------------------------------------------------------------------------
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        render_kpi_card("Queries Logged", f"{len(log):,}", f"{log['fingerprint'].nunique()} distinct statements")
+    with col2:
+        hit_rate = log["cache"].isin(["hit", "stale"]).mean() * 100
+        render_kpi_card("Cache Hit Rate", f"{hit_rate:.0f}%",
+                        f"{cache_stats['entries']} cached • {(log['cache'] == 'stale').sum():,} served stale",
+                        "green" if hit_rate >= 80 else "amber")
+    with col3:
+        render_kpi_card("p95 Latency", f"{_p95(log['elapsed_ms']):,.0f} ms",
+                        f"p50 {log['elapsed_ms'].median():,.0f} ms")
+    with col4:
+        n_errors = int((log["cache"] == "error").sum())
+        render_kpi_card("Query Errors", f"{n_errors:,}", "since process start or last clear",
+                        "red" if n_errors else "green")
+
+    disk = get_query_cache().disk
+    if disk is not None:
+        disk_stats = disk.stats()
+        st.caption(
+            f"Persistent Parquet tier at {disk.root}: {disk_stats['files']:,} results, "
+            f"{disk_stats['bytes'] / 1024 ** 2:,.1f} MB, {cache_stats['disk_hits']:,} loads served from disk"
+        )
+
+    # -------------------------------------------------------------------------
+    # RERUN TIME BREAKDOWN
+    # -------------------------------------------------------------------------
+    render_section_header("Rerun Time: SQL vs pandas vs Plotly")
+
+    if reruns:
+        runs = pd.DataFrame(reruns)
+        runs["view"] = runs["page"].fillna("-") + " / " + runs["tab"].fillna("-")
+        by_view = runs.groupby("view").agg(
+            runs=("total_ms", "size"),
+            total_ms=("total_ms", "mean"),
+            sql_ms=("sql_ms", "mean"),
+            pandas_ms=("pandas_ms", "mean"),
+            plotly_ms=("plotly_ms", "mean"),
+        ).sort_values("total_ms")
+
+        fig = go.Figure()
+        for column, label, color in [
+            ("sql_ms", "SQL (waiting on run_query)", "#1a2b4a"),
+            ("pandas_ms", "pandas & page code", "#8d99ae"),
+            ("plotly_ms", "Plotly (chart serialisation)", "#e63946"),
+        ]:
+            fig.add_trace(go.Bar(
+                y=by_view.index, x=by_view[column], name=label, orientation="h",
+                marker_color=color, hovertemplate="%{y}<br>" + label + ": %{x:,.0f} ms<extra></extra>"
+            ))
+        fig.update_layout(
+            barmode="stack",
+            height=max(250, 40 * len(by_view) + 100),
+            margin=dict(l=20, r=20, t=30, b=20),
+            xaxis_title="Mean rerun time (ms)",
+            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="left", x=0),
+            plot_bgcolor="white",
+        )
+        plotly_chart(fig, use_container_width=True)
+        st.caption(
+            "Full page runs only; fragment reruns are not included. Figure construction counts as "
+            "page code, Plotly covers serialising figures in st.plotly_chart."
+        )
+    else:
+        st.info("No completed page runs recorded yet.")
+
+    # -------------------------------------------------------------------------
+    # LATENCY BY QUERY FINGERPRINT
+    # -------------------------------------------------------------------------
+    render_section_header("Latency by Query Fingerprint")
+
+    by_fingerprint = log.groupby("fingerprint").agg(
+        calls=("elapsed_ms", "size"),
+        p50_ms=("elapsed_ms", "median"),
+        p95_ms=("elapsed_ms", _p95),
+        sql_p95_ms=("sql_ms", _p95),
+        hit_rate=("cache", lambda s: s.isin(["hit", "stale"]).mean()),
+        rows=("rows", "median"),
+        result_kb=("bytes", lambda s: s.max() / 1024),
+        saved_kb=("bytes_saved", lambda s: s.max() / 1024),
+        page=("page", "last"),
+        tab=("tab", "last"),
+        section=("section", "last"),
+        last_query_id=("query_id", "last"),
+        query=("query", "first"),
+    ).sort_values("p95_ms", ascending=False).reset_index()
+
+    st.dataframe(
+        by_fingerprint,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "p50_ms": st.column_config.NumberColumn("p50 (ms)", format="%.0f"),
+            "p95_ms": st.column_config.NumberColumn("p95 (ms)", format="%.0f"),
+            "sql_p95_ms": st.column_config.NumberColumn("SQL p95 (ms)", format="%.0f"),
+            "hit_rate": st.column_config.ProgressColumn("Cache hits", min_value=0, max_value=1),
+            "result_kb": st.column_config.NumberColumn("Result (KB)", format="%.0f"),
+            "saved_kb": st.column_config.NumberColumn("Compaction saved (KB)", format="%.0f"),
+        },
+    )
+
+    compacted = log[log["bytes_saved"] > 0]
+    if not compacted.empty:
+        saved_mb = compacted["bytes_saved"].sum() / 1024 ** 2
+        raw_mb = compacted["bytes_raw"].sum() / 1024 ** 2
+        st.caption(
+            f"Dtype compaction (run_query(..., compact=True)) saved {saved_mb:,.1f} MB of {raw_mb:,.1f} MB "
+            f"({saved_mb / raw_mb * 100:.0f}%) across {len(compacted):,} fetches."
+        )
+
+    # -------------------------------------------------------------------------
+    # RECENT QUERIES
+    # -------------------------------------------------------------------------
+    render_section_header("Recent Queries")
+
+    recent = log.tail(200).iloc[::-1].copy()
+    recent["ts"] = pd.to_datetime(recent["ts"], unit="s")
+    st.dataframe(
+        recent[["ts", "page", "tab", "section", "cache", "elapsed_ms", "sql_ms", "rows", "bytes", "query_id", "error", "query"]],
+        use_container_width=True,
+        hide_index=True,
+    )
+
+    # -------------------------------------------------------------------------
+    # WAREHOUSE COST BY SECTION
+    # -------------------------------------------------------------------------
+    render_section_header("Warehouse Cost by Section (ACCOUNT_USAGE)")
+
+    cost_col1, cost_col2 = st.columns([1, 3])
+    with cost_col1:
+        days = st.selectbox("Lookback", [1, 7, 30], index=1, format_func=lambda d: f"Last {d} days",
+                            key="perf_cost_days")
+        show_cost = st.toggle("Load cost report", key="perf_cost_report",
+                              help="Queries SNOWFLAKE.ACCOUNT_USAGE; needs IMPORTED PRIVILEGES and lags up to ~45 min")
+    with cost_col2:
+        if show_cost:
+            cost = run_query(COST_ATTRIBUTION_QUERY, "finance", params=[days])
+            if not cost.empty:
+                st.dataframe(cost, use_container_width=True, hide_index=True)
+            else:
+                st.info("No tagged dashboard statements in ACCOUNT_USAGE for this period yet.")
+
+    if st.button("Clear query log", key="perf_clear_log"):
+        get_query_log().clear()
+        st.rerun()
@@ -0,0 +1,563 @@
+# ==============================================================================
+# TDF CUSTOM CSS THEME
+# ==============================================================================
+# Navy blue (#1a2b4a) and TDF red (#e63946) styling shared by every page
+# ==============================================================================
+
+import streamlit as st
+
+TDF_CSS = """
+<style>
+    /* TDF Brand Colors */
+    :root {
+        --tdf-navy: #1a2b4a;
+        --tdf-red: #e63946;
+        --tdf-light-gray: #f8f9fa;
+        --tdf-dark-gray: #2d3436;
+        --tdf-white: #ffffff;
+    }
+    
+    /* Main background */
+    .stApp {
+        background-color: var(--tdf-light-gray);
+    }
+    
+    /* Sidebar styling */
+    [data-testid="stSidebar"] {
+        background: linear-gradient(180deg, #1a2b4a 0%, #2d3436 100%);
+        padding-top: 0;
+    }
+    
+    [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] {
+        color: var(--tdf-white);
+    }
+    
+    [data-testid="stSidebar"] .stRadio label {
+        color: var(--tdf-white) !important;
+        font-size: 1rem;
+        padding: 0.5rem 0;
+    }
+    
+    [data-testid="stSidebar"] .stRadio [data-testid="stMarkdownContainer"] p {
+        color: var(--tdf-white) !important;
+    }
+    
+    /* Header styling */
+    .main-header {
+        background: linear-gradient(90deg, #1a2b4a 0%, #2d3436 100%);
+        padding: 1.5rem 2rem;
+        border-radius: 10px;
+        margin-bottom: 2rem;
+        color: white;
+    }
+    
+    .main-header h1 {
+        color: white !important;
+        margin: 0;
+        font-weight: 600;
+    }
+    
+    .main-header p {
+        color: rgba(255,255,255,0.8);
+        margin: 0.5rem 0 0 0;
+    }
+    
+    /* KPI Card styling */
+    .kpi-card {
+        background: white;
+        border-radius: 10px;
+        padding: 1.5rem;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.08);
+        border-left: 4px solid #1a2b4a;
+        height: 100%;
+    }
+    
+    .kpi-card.green { border-left-color: #27ae60; }
+    .kpi-card.amber { border-left-color: #f39c12; }
+    .kpi-card.red { border-left-color: #e63946; }
+    
+    .kpi-title {
+        font-size: 0.85rem;
+        color: #666;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+        margin-bottom: 0.5rem;
+    }
+    
+    .kpi-value {
+        font-size: 2rem;
+        font-weight: 700;
+        color: #1a2b4a;
+        margin-bottom: 0.25rem;
+    }
+    
+    .kpi-subtitle {
+        font-size: 0.8rem;
+        color: #888;
+    }
+    
+    .as-of-badge {
+        display: inline-block;
+        margin-left: 0.5rem;
+        padding: 0.05rem 0.45rem;
+        border-radius: 10px;
+        background: #fff4e0;
+        color: #b9770e;
+        font-size: 0.65rem;
+        text-transform: none;
+        letter-spacing: 0;
+        vertical-align: middle;
+    }
+    
+    /* Status indicators */
+    .status-green { color: #27ae60; }
+    .status-amber { color: #f39c12; }
+    .status-red { color: #e63946; }
+    
+    /* Section headers */
+    .section-header {
+        color: #1a2b4a;
+        font-weight: 600;
+        font-size: 1.2rem;
+        margin: 1.5rem 0 1rem 0;
+        padding-bottom: 0.5rem;
+        border-bottom: 2px solid #e63946;
+    }
+    
+    /* Chart container */
+    .chart-container {
+        background: white;
+        border-radius: 10px;
+        padding: 1.5rem;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.08);
+        margin-bottom: 1rem;
+    }
+    
+    /* Table styling */
+    .dataframe {
+        font-size: 0.85rem;
+    }
+    
+    /* Hide Streamlit branding */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    
+    /* Sidebar divider */
+    .sidebar-divider {
+        border-top: 1px solid rgba(255,255,255,0.2);
+        margin: 1rem 0;
+    }
+    
+    /* Page placeholder */
+    .page-placeholder {
+        background: white;
+        border-radius: 10px;
+        padding: 3rem;
+        text-align: center;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.08);
+        margin-top: 2rem;
+    }
+    
+    .page-placeholder h2 {
+        color: #1a2b4a;
+        margin-bottom: 1rem;
+    }
+    
+    .page-placeholder p {
+        color: #666;
+    }
+    
+    /* Executive Dashboard Hero Banner */
+    .hero-banner {
+        background: linear-gradient(135deg, #1a2b4a 0%, #2d3436 50%, #1a2b4a 100%);
+        border-radius: 15px;
+        padding: 2rem 3rem;
+        margin-bottom: 1.5rem;
+        box-shadow: 0 4px 20px rgba(26, 43, 74, 0.3);
+    }
+    
+    .hero-metrics {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        flex-wrap: wrap;
+        gap: 2rem;
+    }
+    
+    .hero-metric {
+        text-align: center;
+        flex: 1;
+        min-width: 150px;
+    }
+    
+    .hero-value {
+        font-size: 2.8rem;
+        font-weight: 700;
+        color: #ffffff;
+        margin-bottom: 0.25rem;
+        text-shadow: 0 2px 4px rgba(0,0,0,0.2);
+    }
+    
+    .hero-label {
+        font-size: 0.9rem;
+        color: rgba(255,255,255,0.7);
+        text-transform: uppercase;
+        letter-spacing: 1px;
+    }
+    
+    .hero-trend {
+        font-size: 0.85rem;
+        margin-top: 0.25rem;
+    }
+    
+    .hero-trend.positive { color: #27ae60; }
+    .hero-trend.neutral { color: rgba(255,255,255,0.6); }
+    
+    .rating-badge {
+        background: rgba(255,255,255,0.15);
+        border: 1px solid rgba(255,255,255,0.3);
+        border-radius: 8px;
+        padding: 0.5rem 1rem;
+        display: inline-block;
+    }
+    
+    .rating-badge .rating {
+        font-size: 1.5rem;
+        font-weight: 700;
+        color: #ffffff;
+    }
+    
+    .rating-badge .outlook {
+        font-size: 0.75rem;
+        color: rgba(255,255,255,0.7);
+    }
+    
+    /* Metric cards for executive dashboard */
+    .metric-card {
+        background: white;
+        border-radius: 12px;
+        padding: 1.5rem;
+        box-shadow: 0 2px 12px rgba(0,0,0,0.08);
+        height: 100%;
+        transition: transform 0.2s, box-shadow 0.2s;
+    }
+    
+    .metric-card:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 4px 20px rgba(0,0,0,0.12);
+    }
+    
+    .metric-card-title {
+        font-size: 0.8rem;
+        color: #666;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+        margin-bottom: 1rem;
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+    }
+    
+    .metric-card-value {
+        font-size: 2.2rem;
+        font-weight: 700;
+        color: #1a2b4a;
+    }
+    
+    .metric-card-subtitle {
+        font-size: 0.85rem;
+        color: #888;
+        margin-top: 0.25rem;
+    }
+    
+    /* Status badge */
+    .status-badge {
+        display: inline-flex;
+        align-items: center;
+        gap: 0.35rem;
+        padding: 0.25rem 0.75rem;
+        border-radius: 20px;
+        font-size: 0.75rem;
+        font-weight: 600;
+        text-transform: uppercase;
+    }
+    
+    .status-badge.green {
+        background: rgba(39, 174, 96, 0.1);
+        color: #27ae60;
+    }
+    
+    .status-badge.amber {
+        background: rgba(243, 156, 18, 0.1);
+        color: #f39c12;
+    }
+    
+    .status-badge.red {
+        background: rgba(230, 57, 70, 0.1);
+        color: #e63946;
+    }
+    
+    /* Chart card */
+    .chart-card {
+        background: white;
+        border-radius: 12px;
+        padding: 1.5rem;
+        box-shadow: 0 2px 12px rgba(0,0,0,0.08);
+        margin-bottom: 1rem;
+    }
+    
+    .chart-card-title {
+        font-size: 1rem;
+        font-weight: 600;
+        color: #1a2b4a;
+        margin-bottom: 1rem;
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+    }
+    
+    /* Pillar cards */
+    .pillar-card {
+        background: white;
+        border-radius: 12px;
+        padding: 1.25rem;
+        box-shadow: 0 2px 12px rgba(0,0,0,0.08);
+        border-top: 3px solid #1a2b4a;
+    }
+    
+    .pillar-card.infrastructure { border-top-color: #1a2b4a; }
+    .pillar-card.operations { border-top-color: #e63946; }
+    .pillar-card.esg { border-top-color: #27ae60; }
+    
+    .pillar-title {
+        font-size: 0.85rem;
+        font-weight: 600;
+        color: #1a2b4a;
+        margin-bottom: 1rem;
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+    }
+    
+    .pillar-metric {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        padding: 0.5rem 0;
+        border-bottom: 1px solid #f0f0f0;
+    }
+    
+    .pillar-metric:last-child {
+        border-bottom: none;
+    }
+    
+    .pillar-metric-label {
+        font-size: 0.85rem;
+        color: #666;
+    }
+    
+    .pillar-metric-value {
+        font-size: 1rem;
+        font-weight: 600;
+        color: #1a2b4a;
+    }
+    
+    /* Risk Radar Styles */
+    .risk-radar {
+        background: linear-gradient(135deg, #1a2b4a 0%, #2d3436 100%);
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin-bottom: 1.5rem;
+        box-shadow: 0 4px 20px rgba(26, 43, 74, 0.2);
+    }
+    
+    .risk-radar-title {
+        color: #ffffff;
+        font-size: 1rem;
+        font-weight: 600;
+        margin-bottom: 1rem;
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+    }
+    
+    .risk-items {
+        display: flex;
+        flex-direction: column;
+        gap: 0.75rem;
+    }
+    
+    .risk-item {
+        background: rgba(255,255,255,0.1);
+        border-radius: 8px;
+        padding: 0.75rem 1rem;
+        display: flex;
+        align-items: center;
+        gap: 1rem;
+        border-left: 3px solid #e63946;
+    }
+    
+    .risk-item.amber {
+        border-left-color: #f39c12;
+    }
+    
+    .risk-item.green {
+        border-left-color: #27ae60;
+    }
+    
+    .risk-icon {
+        font-size: 1.5rem;
+    }
+    
+    .risk-content {
+        flex: 1;
+    }
+    
+    .risk-title {
+        color: #ffffff;
+        font-size: 0.9rem;
+        font-weight: 500;
+    }
+    
+    .risk-detail {
+        color: rgba(255,255,255,0.7);
+        font-size: 0.8rem;
+        margin-top: 0.25rem;
+    }
+    
+    .risk-value {
+        background: rgba(230, 57, 70, 0.2);
+        color: #ff6b6b;
+        padding: 0.25rem 0.75rem;
+        border-radius: 20px;
+        font-size: 0.85rem;
+        font-weight: 600;
+    }
+    
+    .risk-value.amber {
+        background: rgba(243, 156, 18, 0.2);
+        color: #ffd93d;
+    }
+    
+    .risk-value.green {
+        background: rgba(39, 174, 96, 0.2);
+        color: #6bcb77;
+    }
+    
+    /* Client Health Styles */
+    .client-health-card {
+        background: white;
+        border-radius: 10px;
+        padding: 0.75rem 1rem;
+        margin-bottom: 0.5rem;
+        display: flex;
+        align-items: center;
+        gap: 1rem;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.06);
+        border-left: 4px solid #27ae60;
+    }
+    
+    .client-health-card.warning {
+        border-left-color: #f39c12;
+    }
+    
+    .client-health-card.risk {
+        border-left-color: #e63946;
+    }
+    
+    .client-logo {
+        width: 40px;
+        height: 40px;
+        background: #f0f0f0;
+        border-radius: 8px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-weight: 700;
+        color: #1a2b4a;
+        font-size: 0.85rem;
+    }
+    
+    .client-info {
+        flex: 1;
+    }
+    
+    .client-name {
+        font-weight: 600;
+        color: #1a2b4a;
+        font-size: 0.95rem;
+    }
+    
+    .client-meta {
+        color: #888;
+        font-size: 0.8rem;
+    }
+    
+    .client-metrics {
+        text-align: right;
+    }
+    
+    .client-revenue {
+        font-weight: 700;
+        color: #1a2b4a;
+        font-size: 1rem;
+    }
+    
+    .client-status {
+        font-size: 0.75rem;
+        padding: 0.15rem 0.5rem;
+        border-radius: 10px;
+        margin-top: 0.25rem;
+        display: inline-block;
+    }
+    
+    .client-status.healthy {
+        background: rgba(39, 174, 96, 0.1);
+        color: #27ae60;
+    }
+    
+    .client-status.expiring {
+        background: rgba(243, 156, 18, 0.1);
+        color: #f39c12;
+    }
+    
+    .client-status.at-risk {
+        background: rgba(230, 57, 70, 0.1);
+        color: #e63946;
+    }
+    
+    /* Map container */
+    .map-container {
+        background: white;
+        border-radius: 12px;
+        padding: 1.5rem;
+        box-shadow: 0 2px 12px rgba(0,0,0,0.08);
+    }
+    
+    .map-legend {
+        display: flex;
+        justify-content: center;
+        gap: 1.5rem;
+        margin-top: 1rem;
+        font-size: 0.8rem;
+        color: #666;
+    }
+    
+    .legend-item {
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+    }
+    
+    .legend-dot {
+        width: 12px;
+        height: 12px;
+        border-radius: 50%;
+    }
+</style>
+"""
+
+
+def apply_theme():
+    """Inject the TDF CSS theme into the current page"""
+    st.markdown(TDF_CSS, unsafe_allow_html=True)